@@ -0,0 +1,186 @@
+"""Fleet benchmarks: spin up N plants with synthetic source sensors and measure
+what the integration costs as the fleet grows.
+
+Every plant gets its own soil moisture sensor; temperature and humidity
+sensors are shared per room of ROOM_SIZE plants, like a real installation.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from custom_components.plant_care.const import (
+    DOMAIN,
+    OPT_HUMIDITY_ENTITY_ID,
+    OPT_MOISTURE_ENTITY_ID,
+    OPT_MOISTURE_MIN,
+    OPT_TEMP_ENTITY_ID,
+)
+from custom_components.plant_care.storage import PlantCareStorage
+
+SIZES = [
+    int(size)
+    for size in os.environ.get("PLANT_CARE_BENCH_SIZES", "10,100,1000").split(",")
+]
+ROOM_SIZE = 10
+
+# Simulated hour: every source sensor reports every 5 minutes
+SIM_STEPS = 12
+MOISTURE_MIN = 20
+
+
+def _set_sources(hass: HomeAssistant, plants: int, step: int = 0) -> None:
+    for room in range((plants + ROOM_SIZE - 1) // ROOM_SIZE):
+        hass.states.async_set(f"sensor.bench_temp_{room}", str(20 + step % 3))
+        hass.states.async_set(f"sensor.bench_humidity_{room}", str(50 + step % 5))
+    for i in range(plants):
+        # Slowly drying soil, a few plants cross moisture_min during the hour
+        hass.states.async_set(f"sensor.bench_moisture_{i}", str(_moisture(i, step)))
+
+
+def _moisture(plant: int, step: int) -> int:
+    return 60 - (plant % 40) - step
+
+
+async def _setup_fleet(hass: HomeAssistant, plants: int) -> list[MockConfigEntry]:
+    _set_sources(hass, plants)
+    entries = []
+    for i in range(plants):
+        room = i // ROOM_SIZE
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            unique_id=f"bench_{i}",
+            data={"plant_name": f"Bench {i}", "plant_id": f"bench_{i}"},
+            options={
+                OPT_TEMP_ENTITY_ID: f"sensor.bench_temp_{room}",
+                OPT_HUMIDITY_ENTITY_ID: f"sensor.bench_humidity_{room}",
+                OPT_MOISTURE_ENTITY_ID: f"sensor.bench_moisture_{i}",
+                OPT_MOISTURE_MIN: MOISTURE_MIN,
+            },
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+    assert all(entry.state is ConfigEntryState.LOADED for entry in entries)
+    return entries
+
+
+@pytest.mark.parametrize("plants", SIZES)
+async def bench_setup_time(hass: HomeAssistant, plants: int, report) -> None:
+    start = time.perf_counter()
+    await _setup_fleet(hass, plants)
+    elapsed = time.perf_counter() - start
+
+    # Never watered: every plant is due right after setup
+    for i in range(plants):
+        assert hass.states.get(f"binary_sensor.bench_{i}_watering_due").state == "on"
+
+    report(metric="setup time", plants=plants, value=elapsed * 1000, unit="ms")
+    report(metric="setup time per plant", plants=plants, value=elapsed * 1000 / plants, unit="ms")
+
+
+@pytest.mark.parametrize("plants", SIZES)
+async def bench_update_data(hass: HomeAssistant, plants: int, report) -> None:
+    entries = await _setup_fleet(hass, plants)
+    coordinators = [hass.data[DOMAIN][e.entry_id]["coordinator"] for e in entries]
+
+    start = time.perf_counter()
+    results = [await coordinator._async_update_data() for coordinator in coordinators]
+    elapsed = time.perf_counter() - start
+
+    # Nothing changed in between: the refresh reproduces the current data
+    for coordinator, data in zip(coordinators, results):
+        assert data.tasks == coordinator.data.tasks
+
+    report(metric="_async_update_data (fleet)", plants=plants, value=elapsed * 1000, unit="ms")
+
+
+@pytest.mark.parametrize("plants", SIZES)
+async def bench_memory_per_plant(hass: HomeAssistant, plants: int, report) -> None:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        await _setup_fleet(hass, plants)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    report(metric="memory per plant", plants=plants, value=allocated / plants / 1024, unit="KiB")
+
+
+@pytest.mark.parametrize("plants", SIZES)
+async def bench_hour_of_operation(hass: HomeAssistant, plants: int, report) -> None:
+    """Simulate one hour of sensor updates plus one bulk watering.
+
+    Nothing polls, so no time needs to pass: all work in the hour is caused by
+    the source state changes.
+    """
+    await _setup_fleet(hass, plants)
+
+    state_writes = 0
+
+    def _count(event) -> None:
+        nonlocal state_writes
+        if not event.data["entity_id"].startswith("sensor.bench_"):
+            state_writes += 1
+
+    appends = 0
+    snapshots = 0
+    original_append = PlantCareStorage._append_journal
+    original_compact = PlantCareStorage._async_compact
+
+    def _counting_append(self, events) -> None:
+        nonlocal appends
+        appends += 1
+        original_append(self, events)
+
+    async def _counting_compact(self) -> None:
+        nonlocal snapshots
+        snapshots += 1
+        await original_compact(self)
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _count)
+    try:
+        with patch.object(
+            PlantCareStorage, "_append_journal", _counting_append
+        ), patch.object(PlantCareStorage, "_async_compact", _counting_compact):
+            for step in range(1, SIM_STEPS + 1):
+                _set_sources(hass, plants, step)
+                await hass.async_block_till_done()
+
+            entity_ids = [f"button.bench_{i}_watering_mark_watered" for i in range(plants)]
+            await hass.services.async_call(
+                DOMAIN, "mark_done", {"entity_id": entity_ids, "task": "watering"}, blocking=True
+            )
+            await hass.data[DOMAIN]["storage"].async_flush()
+            await hass.async_block_till_done()
+    finally:
+        unsub()
+
+    for i in range(plants):
+        out_of_range = _moisture(i, SIM_STEPS) < MOISTURE_MIN
+        state = hass.states.get(f"binary_sensor.bench_{i}_moisture_out_of_range")
+        assert state.state == ("on" if out_of_range else "off")
+        assert hass.states.get(f"binary_sensor.bench_{i}_watering_due").state == "off"
+    # Sensor updates never touch storage; the bulk watering is one append
+    assert appends == 1
+    assert snapshots <= 1
+
+    report(metric="state writes per hour", plants=plants, value=state_writes, unit="writes")
+    report(metric="state writes per plant-hour", plants=plants, value=state_writes / plants, unit="writes")
+    report(metric="journal appends per hour", plants=plants, value=appends, unit="writes")
+    report(metric="snapshot writes per hour", plants=plants, value=snapshots, unit="writes")
@@ -0,0 +1,65 @@
+"""Fixtures and reporting for the plant_care fleet benchmarks.
+
+Run from the repository root:
+
+    pip install -r benchmarks/requirements.txt
+    pytest -c benchmarks/pytest.ini benchmarks
+
+Fleet sizes default to 10, 100 and 1000 plants; override them with e.g.
+PLANT_CARE_BENCH_SIZES=10,50. Set PLANT_CARE_BENCH_JSON=<file> to also write
+the results as JSON (e.g. to compare runs in CI).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import pytest
+
+# Make `custom_components.plant_care` importable without installing anything
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+RESULTS: list[dict] = []
+
+# The `hass` / `enable_custom_integrations` fixtures come from
+# pytest-homeassistant-custom-component, which registers itself as a plugin
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    yield
+
+
+@pytest.fixture(autouse=True)
+def isolated_config_dir(hass, tmp_path):
+    # The storage journal is a real file; keep it out of the harness' config dir
+    hass.config.config_dir = str(tmp_path)
+    yield
+
+
+@pytest.fixture
+def report():
+    """Record one result row: report(metric=..., plants=..., value=..., unit=...)."""
+
+    def _report(**row) -> None:
+        RESULTS.append(row)
+
+    return _report
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    if not RESULTS:
+        return
+
+    terminalreporter.section("plant_care benchmarks")
+    for row in RESULTS:
+        terminalreporter.write_line(
+            f"{row['metric']:<32} {row['plants']:>6} plants  "
+            f"{row['value']:>14.3f} {row['unit']}"
+        )
+
+    if path := os.environ.get("PLANT_CARE_BENCH_JSON"):
+        with open(path, "w", encoding="utf-8") as fp:
+            json.dump(RESULTS, fp, indent=2)
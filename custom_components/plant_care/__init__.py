@@ -1,24 +1,51 @@
 from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.event import async_call_later, async_track_time_change
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN, PLATFORMS, DEFAULT_OPTIONS
 from .coordinator import PlantCareCoordinator
+from .fleet import PlantCareFleet
+from .scheduler import PlantCareScheduler
+from .services import async_setup_services
 from .storage import PlantCareStorage
 
 # Config-entry-only integration (no YAML setup)
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    # Domain-wide services (history queries, bulk import, ...) work across all
+    # plants and may run before any entry is loaded
+    hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN].setdefault("storage", PlantCareStorage(hass))
+    hass.data[DOMAIN].setdefault("scheduler", PlantCareScheduler(hass))
+    hass.data[DOMAIN].setdefault("fleet", PlantCareFleet(hass))
+    async_setup_services(hass)
+
+    # Fleet summary sensors, the care calendar and the to-do list belong to
+    # the domain, not to a plant entry
+    for platform in (Platform.SENSOR, Platform.CALENDAR, Platform.TODO):
+        hass.async_create_task(
+            async_load_platform(hass, platform, DOMAIN, {}, config)
+        )
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Ensure domain storage exists even without async_setup()
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN].setdefault("storage", PlantCareStorage(hass))
+    hass.data[DOMAIN].setdefault("scheduler", PlantCareScheduler(hass))
+    hass.data[DOMAIN].setdefault("fleet", PlantCareFleet(hass))
 
     storage: PlantCareStorage = hass.data[DOMAIN]["storage"]
+    scheduler: PlantCareScheduler = hass.data[DOMAIN]["scheduler"]
+    fleet: PlantCareFleet = hass.data[DOMAIN]["fleet"]
 
     if hasattr(storage, "async_setup"):
         await storage.async_setup()
@@ -41,33 +68,55 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Forward platforms first so CoordinatorEntity listeners get attached
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # IMPORTANT: ensure the periodic scheduler starts even if listeners attach later
-    # (dummy listener; removed automatically on unload)
-    unsub_listener = coordinator.async_add_listener(lambda: None)
-    entry.async_on_unload(unsub_listener)
-
-    # Refresh immediately on setup/startup (now entities exist + scheduler will run)
+    # Refresh immediately on setup/startup (now entities exist)
     await coordinator.async_config_entry_first_refresh()
 
-    # Optional: delayed refresh so sensors that come online after boot are picked up
-    async def _delayed_refresh(_now) -> None:
-        await coordinator.async_refresh()
+    # Env metrics are event-driven: re-evaluated on source sensor state changes.
+    # This also covers sources that only become available later (e.g. a Zigbee
+    # network still starting up), so no speculative delayed refresh is needed.
+    coordinator.async_track_sources()
+    entry.async_on_unload(coordinator.async_untrack_sources)
+    entry.async_on_unload(coordinator.async_cancel_filter_timers)
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+    # Don't lose number edits that are still being coalesced
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            EVENT_HOMEASSISTANT_STOP, coordinator.async_write_pending_options
+        )
+    )
+
+    # Due-state wakeups are owned by the shared domain scheduler
+    # (one timer for all plants)
+    entry.async_on_unload(scheduler.async_register(coordinator))
+    # Due / out-of-range plants for the fleet summary sensors
+    entry.async_on_unload(fleet.async_register(coordinator))
 
-    entry.async_on_unload(async_call_later(hass, 60, _delayed_refresh))
-
-    # Daily refresh 03:00 (dates/tasks)
-    async def _daily_refresh(_now) -> None:
-        await coordinator.async_refresh()
+    return True
 
-    unsub_daily = async_track_time_change(hass, _daily_refresh, hour=3, minute=0, second=0)
-    entry.async_on_unload(unsub_daily)
 
-    return True
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Re-evaluate after an options change (options flow or number edits)."""
+    if (entry_data := hass.data[DOMAIN].get(entry.entry_id)) is None:
+        return  # unloaded in the meantime
+    coordinator: PlantCareCoordinator = entry_data["coordinator"]
+    data = coordinator.data
+    if data is not None and coordinator.config.tasks != data.task_types:
+        # Tasks were added or removed: entities are generated per task
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+    await coordinator.async_options_updated()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    if (entry_data := hass.data[DOMAIN].get(entry.entry_id)) is not None:
+        entry_data["coordinator"].async_write_pending_options()
+
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
 
+    # Don't keep coalesced writes pending past an unload
+    storage: PlantCareStorage = hass.data[DOMAIN]["storage"]
+    await storage.async_flush()
+
     return unload_ok
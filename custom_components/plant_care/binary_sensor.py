@@ -1,57 +1,50 @@
 from __future__ import annotations
 
-from typing import Any
-
 from homeassistant.components.binary_sensor import BinarySensorEntity
 
 from .const import (
     DOMAIN,
-    TASK_WATERING,
-    TASK_FERTILIZING,
     OPT_TEMP_ENTITY_ID,
     OPT_HUMIDITY_ENTITY_ID,
     OPT_MOISTURE_ENTITY_ID,
+    OPT_LIGHT_ENTITY_ID,
 )
-from .device import PlantCareEntity
+from .device import PlantCareMetricEntity, PlantCareTaskEntity
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     async_add_entities(
         [
-            # Due tasks
-            PlantCareDueBinarySensor(entry, coordinator, TASK_WATERING),
-            PlantCareDueBinarySensor(entry, coordinator, TASK_FERTILIZING),
+            # Due tasks, one per task of the plant
+            *(
+                PlantCareDueBinarySensor(entry, coordinator, task_type)
+                for task_type in coordinator.config.tasks
+            ),
             # Env bounds (disabled-by-default if no external sensor configured)
             PlantCareEnvOutOfRangeBinarySensor(entry, coordinator, "temperature"),
             PlantCareEnvOutOfRangeBinarySensor(entry, coordinator, "humidity"),
             PlantCareEnvOutOfRangeBinarySensor(entry, coordinator, "moisture"),
+            PlantCareEnvOutOfRangeBinarySensor(entry, coordinator, "light"),
         ]
     )
 
 
-class PlantCareDueBinarySensor(PlantCareEntity, BinarySensorEntity):
+class PlantCareDueBinarySensor(PlantCareTaskEntity, BinarySensorEntity):
     """Binary sensor that turns on when a given plant care task is due."""
 
     _attr_device_class = "problem"
 
     def __init__(self, entry, coordinator, task_type: str):
-        super().__init__(entry, coordinator)
-        self.task_type = task_type
+        super().__init__(entry, coordinator, task_type)
 
         plant_id = entry.data.get("plant_id", entry.entry_id)
         plant_name = entry.data.get("plant_name", "Plant")
 
-        if task_type == TASK_WATERING:
-            self._attr_name = f"{plant_name} Watering Due"
-            self._attr_unique_id = f"{plant_id}_watering_due"
-            self._attr_suggested_object_id = f"{plant_id}_watering_due"
-            self._attr_icon = "mdi:watering-can-outline"
-        else:
-            self._attr_name = f"{plant_name} Fertilizing Due"
-            self._attr_unique_id = f"{plant_id}_fertilizing_due"
-            self._attr_suggested_object_id = f"{plant_id}_fertilizing_due"
-            self._attr_icon = "mdi:bottle-tonic-outline"
+        self._attr_name = f"{plant_name} {self.definition.name} Due"
+        self._attr_unique_id = f"{plant_id}_{task_type}_due"
+        self._attr_suggested_object_id = f"{plant_id}_{task_type}_due"
+        self._attr_icon = self.definition.icon
 
     @property
     def is_on(self) -> bool | None:
@@ -60,38 +53,30 @@ class PlantCareDueBinarySensor(PlantCareEntity, BinarySensorEntity):
 
         Home Assistant may call this before the coordinator has data.
         """
-        data: dict[str, Any] | None = self.coordinator.data
-        if not data:
-            return None
-
-        tasks = data.get("tasks")
-        if not isinstance(tasks, dict):
-            return None
-
-        task = tasks.get(self.task_type)
-        if task is None:
-            return None
-
-        return bool(getattr(task, "is_due", False))
+        task = self.task
+        return task.is_due if task is not None else None
 
     @property
     def extra_state_attributes(self):
-        # Safe even when coordinator.data is None or tasks missing
-        data = self.coordinator.data or {}
-        tasks = data.get("tasks") or {}
-        t = tasks.get(self.task_type)
-
+        # Safe even when coordinator.data is None
+        t = self.task
         if t is None:
             return {}
 
-        next_due = getattr(t, "next_due_date", None)
+        next_due = t.next_due_date
         return {
             "next_due_date": next_due.isoformat() if next_due else None,
-            "days_overdue": getattr(t, "days_overdue", None),
+            "days_overdue": t.days_overdue,
+            "interval_days": t.interval_days,
+            "learned_interval_days": (
+                round(t.learned_interval_days, 1)
+                if t.learned_interval_days is not None
+                else None
+            ),
         }
 
 
-class PlantCareEnvOutOfRangeBinarySensor(PlantCareEntity, BinarySensorEntity):
+class PlantCareEnvOutOfRangeBinarySensor(PlantCareMetricEntity, BinarySensorEntity):
     """Binary sensor that turns on when the selected env sensor is out of bounds.
 
     UX:
@@ -103,8 +88,7 @@ class PlantCareEnvOutOfRangeBinarySensor(PlantCareEntity, BinarySensorEntity):
     _attr_device_class = "problem"
 
     def __init__(self, entry, coordinator, metric: str):
-        super().__init__(entry, coordinator)
-        self.metric = metric
+        super().__init__(entry, coordinator, metric)
 
         plant_id = entry.data.get("plant_id", entry.entry_id)
         plant_name = entry.data.get("plant_name", "Plant")
@@ -113,6 +97,7 @@ class PlantCareEnvOutOfRangeBinarySensor(PlantCareEntity, BinarySensorEntity):
             "temperature": "Temperature",
             "humidity": "Humidity",
             "moisture": "Moisture",
+            "light": "Light",
         }[metric]
 
         self._attr_name = f"{plant_name} {pretty} Out of range"
@@ -124,6 +109,7 @@ class PlantCareEnvOutOfRangeBinarySensor(PlantCareEntity, BinarySensorEntity):
             "temperature": OPT_TEMP_ENTITY_ID,
             "humidity": OPT_HUMIDITY_ENTITY_ID,
             "moisture": OPT_MOISTURE_ENTITY_ID,
+            "light": OPT_LIGHT_ENTITY_ID,
         }[metric]
         is_configured = bool((entry.options.get(opt_key) or "").strip())
         self._attr_entity_registry_enabled_default = is_configured
@@ -133,27 +119,26 @@ class PlantCareEnvOutOfRangeBinarySensor(PlantCareEntity, BinarySensorEntity):
             "temperature": "mdi:thermometer",
             "humidity": "mdi:water-percent",
             "moisture": "mdi:flower",
+            "light": "mdi:white-balance-sunny",
         }[metric]
         self._icon_bad = {
             "temperature": "mdi:thermometer-alert",
             "humidity": "mdi:water-alert",
             "moisture": "mdi:flower-outline",
+            "light": "mdi:weather-sunny-alert",
         }[metric]
 
-    def _metric_data(self) -> dict:
-        data = (self.coordinator.data or {}).get("env", {})
-        return data.get(self.metric, {})
-
     @property
     def available(self) -> bool:
         # out_of_range == None means unavailable (no configured sensor / invalid value)
-        oor = self._metric_data().get("out_of_range")
-        return oor is not None
+        m = self.metric_result
+        return m is not None and m.out_of_range is not None
 
     @property
     def is_on(self) -> bool | None:
         # Should be True/False/None (None => unavailable/unknown)
-        return self._metric_data().get("out_of_range")
+        m = self.metric_result
+        return m.out_of_range if m is not None else None
 
     @property
     def icon(self) -> str | None:
@@ -162,10 +147,12 @@ class PlantCareEnvOutOfRangeBinarySensor(PlantCareEntity, BinarySensorEntity):
 
     @property
     def extra_state_attributes(self):
-        m = self._metric_data()
+        m = self.metric_result
+        if m is None:
+            return {}
         return {
-            "value": m.get("value"),
-            "min": m.get("min"),
-            "max": m.get("max"),
-            "deviation": m.get("deviation"),
+            "value": m.value,
+            "min": m.min,
+            "max": m.max,
+            "deviation": m.deviation,
         }
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import logging
+import os
+from typing import Any
+
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import (
+    CONF_PLANT_ID,
+    CONF_PLANT_NAME,
+    CORE_TASKS,
+    DEFAULT_OPTIONS,
+    DOMAIN,
+    IMPORT_BATCH_SIZE,
+    OPT_EXTRA_TASKS,
+    TASK_FERTILIZING,
+    TASK_WATERING,
+)
+from .scheduler import PlantCareScheduler
+from .storage import PlantCareStorage
+from .tasks import (
+    get_task_definition,
+    option_default,
+    parse_task_types,
+    plant_task_types,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Last-done columns of the core tasks (other tasks: "last_<task>")
+_LAST_DONE_FIELDS = {
+    TASK_WATERING: "last_watered",
+    TASK_FERTILIZING: "last_fertilized",
+}
+
+# Column order of exported files (plus the columns of extra tasks, see
+# _export_fields())
+EXPORT_FIELDS = [
+    CONF_PLANT_NAME,
+    CONF_PLANT_ID,
+    *DEFAULT_OPTIONS,
+    *_LAST_DONE_FIELDS.values(),
+]
+
+
+def _last_done_field(task_type: str) -> str:
+    return _LAST_DONE_FIELDS.get(task_type, f"last_{task_type}")
+
+
+def _task_fields(task_type: str) -> list[str]:
+    """Columns of an extra task: interval, adaptive mode and last done."""
+    definition = get_task_definition(task_type)
+    return [
+        definition.interval_option,
+        definition.adaptive_option,
+        _last_done_field(task_type),
+    ]
+
+
+def _export_fields(rows: list[dict[str, Any]]) -> list[str]:
+    fields = list(EXPORT_FIELDS)
+    for row in rows:
+        fields.extend(key for key in row if key not in fields)
+    return fields
+
+
+def resolve_config_path(hass: HomeAssistant, path: str) -> str:
+    """Resolve a path relative to the config dir; refuse paths outside of it."""
+    config_dir = os.path.realpath(hass.config.config_dir)
+    full = os.path.realpath(os.path.join(config_dir, path))
+    if os.path.commonpath([config_dir, full]) != config_dir:
+        raise ServiceValidationError(f"Path must be inside the config directory: {path}")
+    return full
+
+
+def _is_csv(path: str) -> bool:
+    return path.lower().endswith(".csv")
+
+
+def _read_rows(path: str) -> list[dict[str, Any]]:
+    """Read plant rows from a CSV or JSON file (runs in the executor)."""
+    with open(path, encoding="utf-8", newline="") as fp:
+        if _is_csv(path):
+            return list(csv.DictReader(fp))
+        rows = json.load(fp)
+    # JSON: either a list of plants or {"plants": [...]} (as written by export)
+    if isinstance(rows, dict):
+        rows = rows.get("plants", [])
+    return rows
+
+
+def _write_rows(path: str, rows: list[dict[str, Any]]) -> None:
+    """Write plant rows as CSV or JSON (runs in the executor)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as fp:
+        if _is_csv(path):
+            writer = csv.DictWriter(fp, fieldnames=_export_fields(rows))
+            writer.writeheader()
+            writer.writerows(
+                # CSV cells hold the extra tasks comma-separated
+                {**row, OPT_EXTRA_TASKS: ",".join(row.get(OPT_EXTRA_TASKS) or [])}
+                for row in rows
+            )
+        else:
+            json.dump({"plants": rows}, fp, indent=2)
+
+
+def _as_iso(ts: int | None) -> str | None:
+    """Exported files stay human readable: epoch seconds -> local ISO string."""
+    if ts is None:
+        return None
+    return dt_util.as_local(dt_util.utc_from_timestamp(ts)).isoformat()
+
+
+def _coerce_option(key: str, value: Any) -> Any:
+    """Options from files may be strings (CSV); store them like the config flow does."""
+    default = option_default(key)
+    if isinstance(default, list):
+        return list(parse_task_types(value))
+    if isinstance(default, str):
+        return (str(value) if value is not None else "").strip()
+    if isinstance(default, bool):
+        if isinstance(value, str):
+            return value.strip().lower() in ("1", "true", "yes", "on")
+        return bool(value)
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+def _parse_row(row: dict[str, Any]) -> tuple[str, str, dict[str, Any], dict[str, int]]:
+    """Return (plant_id, plant_name, options, {task: epoch seconds}) for one row."""
+    plant_name = (row.get(CONF_PLANT_NAME) or "").strip()
+    if not plant_name:
+        raise ValueError("missing plant_name")
+    plant_id = (row.get(CONF_PLANT_ID) or "").strip() or slugify(plant_name)
+
+    options = {
+        key: _coerce_option(key, row[key])
+        for key in DEFAULT_OPTIONS
+        if row.get(key) not in (None, "")
+    }
+    # Interval / adaptive columns of the extra tasks listed in the row
+    for task_type in plant_task_types(options)[len(CORE_TASKS) :]:
+        definition = get_task_definition(task_type)
+        for key in (definition.interval_option, definition.adaptive_option):
+            if row.get(key) not in (None, ""):
+                options[key] = _coerce_option(key, row[key])
+
+    last_done: dict[str, int] = {}
+    for task_type in plant_task_types(options):
+        field = _last_done_field(task_type)
+        if not (raw := row.get(field)):
+            continue
+        if (parsed := dt_util.parse_datetime(str(raw))) is None:
+            raise ValueError(f"invalid {field}: {raw}")
+        last_done[task_type] = int(dt_util.as_local(parsed).timestamp())
+
+    return plant_id, plant_name, options, last_done
+
+
+async def async_import_plants(hass: HomeAssistant, path: str) -> dict[str, Any]:
+    """Create or update plants from a CSV/JSON file in the config dir.
+
+    - new plants are created through the config flow (import step), in
+      batches of IMPORT_BATCH_SIZE so setup doesn't block the event loop
+    - existing plants (same plant_id) get their options updated
+    - last-done timestamps newer than the stored ones are written in one
+      storage transaction and the affected plants are refreshed in one
+      batched scheduler pass; older or equal ones (e.g. re-importing an
+      export) are skipped so they neither repeat history events nor move
+      last done backwards
+    """
+    full = resolve_config_path(hass, path)
+    try:
+        rows = await hass.async_add_executor_job(_read_rows, full)
+    except (OSError, ValueError) as err:
+        raise ServiceValidationError(f"Cannot read {path}: {err}") from err
+
+    created: list[str] = []
+    updated: list[str] = []
+    errors: list[str] = []
+    events: list[tuple[str, str, int]] = []
+    to_create: list[tuple[str, str, dict[str, Any], dict[str, int]]] = []
+    entries = hass.config_entries
+
+    for index, row in enumerate(rows, start=1):
+        try:
+            plant_id, plant_name, options, last_done = _parse_row(row)
+        except (AttributeError, TypeError, ValueError) as err:
+            errors.append(f"row {index}: {err}")
+            continue
+
+        entry = entries.async_entry_for_domain_unique_id(DOMAIN, plant_id)
+        if entry is None:
+            to_create.append((plant_id, plant_name, options, last_done))
+            continue
+
+        if options and any(entry.options.get(k) != v for k, v in options.items()):
+            entries.async_update_entry(entry, options={**entry.options, **options})
+        events.extend((entry.entry_id, t, ts) for t, ts in last_done.items())
+        updated.append(plant_id)
+
+    for start in range(0, len(to_create), IMPORT_BATCH_SIZE):
+        if start:
+            await asyncio.sleep(0)
+        batch = to_create[start : start + IMPORT_BATCH_SIZE]
+        results = await asyncio.gather(
+            *(
+                entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": SOURCE_IMPORT},
+                    data={
+                        CONF_PLANT_ID: plant_id,
+                        CONF_PLANT_NAME: plant_name,
+                        "options": options,
+                    },
+                )
+                for plant_id, plant_name, options, _ in batch
+            )
+        )
+        for (plant_id, _, _, last_done), result in zip(batch, results):
+            entry = entries.async_entry_for_domain_unique_id(DOMAIN, plant_id)
+            if entry is None:
+                errors.append(f"{plant_id}: {result.get('reason', 'not created')}")
+                continue
+            events.extend((entry.entry_id, t, ts) for t, ts in last_done.items())
+            created.append(plant_id)
+
+    storage: PlantCareStorage = hass.data[DOMAIN]["storage"]
+    states = {
+        entry_id: await storage.get_entry_state(entry_id)
+        for entry_id in {entry_id for entry_id, _, _ in events}
+    }
+    events = [
+        (entry_id, task_type, ts)
+        for entry_id, task_type, ts in events
+        if (last := states[entry_id].last_done(task_type)) is None or ts > last
+    ]
+    if events:
+        scheduler: PlantCareScheduler = hass.data[DOMAIN]["scheduler"]
+        await storage.record_events(events)
+        await scheduler.async_refresh({entry_id for entry_id, _, _ in events})
+
+    if errors:
+        _LOGGER.warning("Plant import from %s: %s", path, "; ".join(errors))
+
+    return {"created": created, "updated": updated, "errors": errors}
+
+
+async def async_export_plants(hass: HomeAssistant, path: str) -> dict[str, Any]:
+    """Write all plants (options + last-done timestamps) to a CSV/JSON file."""
+    full = resolve_config_path(hass, path)
+    storage: PlantCareStorage | None = hass.data.get(DOMAIN, {}).get("storage")
+
+    rows: list[dict[str, Any]] = []
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        state = await storage.get_entry_state(entry.entry_id) if storage else None
+        row = {
+            CONF_PLANT_NAME: entry.data.get(CONF_PLANT_NAME, entry.title),
+            CONF_PLANT_ID: entry.data.get(CONF_PLANT_ID, entry.entry_id),
+            **{key: entry.options.get(key, default) for key, default in DEFAULT_OPTIONS.items()},
+        }
+        task_types = plant_task_types(entry.options)
+        row[OPT_EXTRA_TASKS] = list(task_types[len(CORE_TASKS) :])
+        for task_type in task_types:
+            if task_type not in CORE_TASKS:
+                interval_key, adaptive_key, _ = _task_fields(task_type)
+                row[interval_key] = entry.options.get(
+                    interval_key, option_default(interval_key)
+                )
+                row[adaptive_key] = entry.options.get(adaptive_key, False)
+            row[_last_done_field(task_type)] = (
+                _as_iso(state.last_done(task_type)) if state else None
+            )
+        rows.append(row)
+
+    try:
+        await hass.async_add_executor_job(_write_rows, full, rows)
+    except OSError as err:
+        raise ServiceValidationError(f"Cannot write {path}: {err}") from err
+
+    return {"path": full, "count": len(rows)}
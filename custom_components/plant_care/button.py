@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from homeassistant.components.button import ButtonEntity
-from homeassistant.util import dt as dt_util
+from homeassistant.util import dt as dt_util, slugify
 
-from .const import DOMAIN, TASK_WATERING, TASK_FERTILIZING
+from .const import DOMAIN
 from .device import PlantCareEntity
+from .tasks import get_task_definition
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -12,10 +13,8 @@ async def async_setup_entry(hass, entry, async_add_entities):
     storage = hass.data[DOMAIN][entry.entry_id]["storage"]
 
     async_add_entities(
-        [
-            PlantCareMarkDoneButton(entry, coordinator, storage, TASK_WATERING),
-            PlantCareMarkDoneButton(entry, coordinator, storage, TASK_FERTILIZING),
-        ]
+        PlantCareMarkDoneButton(entry, coordinator, storage, task_type)
+        for task_type in coordinator.config.tasks
     )
 
 
@@ -28,19 +27,14 @@ class PlantCareMarkDoneButton(PlantCareEntity, ButtonEntity):
         plant_id = entry.data.get("plant_id", entry.entry_id)
         plant_name = entry.data.get("plant_name", "Plant")
 
-        if task_type == TASK_WATERING:
-            self._attr_name = f"{plant_name} Watering Mark watered"
-            self._attr_icon = "mdi:watering-can"
-            self._attr_unique_id = f"{plant_id}_watering_mark_watered"
-            self._attr_suggested_object_id = f"{plant_id}_watering_mark_watered"
-        else:
-            self._attr_name = f"{plant_name} Fertilizing Mark fertilized"
-            self._attr_icon = "mdi:bottle-tonic"
-            self._attr_unique_id = f"{plant_id}_fertilizing_mark_fertilized"
-            self._attr_suggested_object_id = f"{plant_id}_fertilizing_mark_fertilized"
+        definition = get_task_definition(task_type)
+        self._attr_name = f"{plant_name} {definition.name} Mark {definition.done}"
+        self._attr_icon = definition.done_icon
+        object_id = f"{plant_id}_{task_type}_mark_{slugify(definition.done)}"
+        self._attr_unique_id = object_id
+        self._attr_suggested_object_id = object_id
 
     async def async_press(self) -> None:
-        now = dt_util.now()
-        iso = dt_util.as_local(now).isoformat()
-        await self.storage.set_last_done(self.entry.entry_id, self.task_type, iso)
+        ts = int(dt_util.utcnow().timestamp())
+        await self.storage.set_last_done(self.entry.entry_id, self.task_type, ts)
         await self.coordinator.async_refresh()
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+
+from .const import CALENDAR_CACHE_MAX_DAYS, DOMAIN
+from .fleet import PlantCareFleet, PlantSchedule, TaskSchedule
+
+
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
+    """Domain-wide care calendar (loaded by discovery from async_setup)."""
+    if discovery_info is None:
+        return
+    fleet: PlantCareFleet = hass.data[DOMAIN]["fleet"]
+    async_add_entities([PlantCareCalendar(fleet)])
+
+
+def _first_occurrence(schedule: TaskSchedule) -> date:
+    # A due task is shown today (it stays there until it is done)
+    return schedule.next_due_date + timedelta(days=schedule.days_overdue)
+
+
+def _occurrences(schedule: TaskSchedule, start: date, end: date) -> Iterator[date]:
+    """Days in [start, end] on which the task is due, assuming it's done on time.
+
+    Computed arithmetically from the first occurrence and the interval.
+    """
+    first = _first_occurrence(schedule)
+    interval = schedule.interval_days
+    if interval <= 0:
+        if start <= first <= end:
+            yield first
+        return
+    # Index of the first occurrence on or after `start` (ceil division)
+    k = max(0, -((first - start).days // interval))
+    day = first + timedelta(days=k * interval)
+    step = timedelta(days=interval)
+    while day <= end:
+        yield day
+        day += step
+
+
+class PlantCareCalendar(CalendarEntity):
+    """Upcoming care tasks of all plants as all-day events.
+
+    Recurrences are generated from each task's next due date and interval
+    (see _occurrences()). Events are cached per day, sorted; a plant's
+    schedule change only drops the cached days its old or new occurrences
+    fall on.
+    """
+
+    _attr_should_poll = False
+    _attr_icon = "mdi:calendar-heart"
+
+    def __init__(self, fleet: PlantCareFleet) -> None:
+        self.fleet = fleet
+        self._attr_name = "Plant Care"
+        self._attr_unique_id = f"{DOMAIN}_schedule"
+        self._attr_suggested_object_id = DOMAIN
+        # day -> events of all plants on that day, sorted
+        self._days: dict[date, list[CalendarEvent]] = {}
+        self._write_scheduled = False
+
+    @property
+    def available(self) -> bool:
+        # Schedule changes include the first plant added and the last removed
+        return self.fleet.has_plants
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.fleet.async_add_schedule_listener(self._async_schedule_changed)
+        )
+
+    @callback
+    def _async_schedule_changed(self, entry_id: str, old: PlantSchedule | None) -> None:
+        if self._days:
+            lo, hi = min(self._days), max(self._days)
+            new = self.fleet.schedules.get(entry_id)
+            for plant_schedule in (old, new):
+                if plant_schedule is None:
+                    continue
+                for schedule in plant_schedule[1]:
+                    for day in _occurrences(schedule, lo, hi):
+                        self._days.pop(day, None)
+
+        # Many plants change together (mark_done on a group, midnight passes):
+        # write the calendar state once for all of them
+        if not self._write_scheduled:
+            self._write_scheduled = True
+            self.hass.loop.call_soon(self._async_write_scheduled)
+
+    @callback
+    def _async_write_scheduled(self) -> None:
+        self._write_scheduled = False
+        if self.hass is not None:
+            self.async_write_ha_state()
+
+    # --- Events ---
+
+    def _events_between(self, start: date, end: date) -> list[CalendarEvent]:
+        """All events on the days [start, end], filling missing cache days first."""
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        missing = [day for day in days if day not in self._days]
+        if missing:
+            if len(self._days) + len(missing) > CALENDAR_CACHE_MAX_DAYS:
+                self._days.clear()
+                missing = days
+            lo, hi = missing[0], missing[-1]
+            buckets: dict[date, list[tuple[str, int, CalendarEvent]]] = {
+                day: [] for day in missing
+            }
+            for entry_id, (plant_name, schedules) in self.fleet.schedules.items():
+                # Within a plant, events keep the order of its tasks
+                for position, schedule in enumerate(schedules):
+                    for day in _occurrences(schedule, lo, hi):
+                        if (bucket := buckets.get(day)) is not None:
+                            bucket.append(
+                                (
+                                    plant_name,
+                                    position,
+                                    _event(entry_id, plant_name, schedule, day),
+                                )
+                            )
+            for day, bucket in buckets.items():
+                bucket.sort(key=lambda item: (item[0], item[1]))
+                self._days[day] = [event for _, _, event in bucket]
+
+        return [event for day in days for event in self._days[day]]
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """The next upcoming event (the first one of the earliest day)."""
+        firsts = [
+            _first_occurrence(schedule)
+            for _, schedules in self.fleet.schedules.values()
+            for schedule in schedules
+        ]
+        if not firsts:
+            return None
+        day = min(firsts)
+        events = self._events_between(day, day)
+        return events[0] if events else None
+
+    async def async_get_events(
+        self, hass, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        start = dt_util.as_local(start_date).date()
+        # end_date is exclusive
+        end = dt_util.as_local(end_date - timedelta(microseconds=1)).date()
+        if end < start:
+            return []
+        return self._events_between(start, end)
+
+
+def _event(
+    entry_id: str, plant_name: str, schedule: TaskSchedule, day: date
+) -> CalendarEvent:
+    first = day == _first_occurrence(schedule)
+    return CalendarEvent(
+        start=day,
+        end=day + timedelta(days=1),
+        summary=schedule.summary(plant_name),
+        description=schedule.overdue_text if first else None,
+        uid=f"{entry_id}_{schedule.task_type}_{day.isoformat()}",
+    )
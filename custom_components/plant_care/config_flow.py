@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import csv
+import logging
+from typing import Any
+
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -11,6 +15,7 @@ from .const import (
     DOMAIN,
     CONF_PLANT_ID,
     CONF_PLANT_NAME,
+    CONF_SPECIES,
     DEFAULT_OPTIONS,
     OPT_WATERING_INTERVAL_DAYS,
     OPT_FERTILIZING_INTERVAL_DAYS,
@@ -25,59 +30,60 @@ from .const import (
     OPT_TEMP_ENTITY_ID,
     OPT_HUMIDITY_ENTITY_ID,
     OPT_MOISTURE_ENTITY_ID,
+    OPT_LIGHT_ENTITY_ID,
 )
+from .species import SpeciesProfile, async_get_species_index
+
+_LOGGER = logging.getLogger(__name__)
 
 STEP_USER_SCHEMA = vol.Schema(
     {
         # Only required field
         vol.Required(CONF_PLANT_NAME): selector.TextSelector(),
-        # Defaults for this plant
-        vol.Optional(
-            OPT_WATERING_INTERVAL_DAYS,
-            default=int(DEFAULT_OPTIONS[OPT_WATERING_INTERVAL_DAYS]),
-        ): vol.All(vol.Coerce(int), vol.Range(min=0)),
-        vol.Optional(
-            OPT_FERTILIZING_INTERVAL_DAYS,
-            default=int(DEFAULT_OPTIONS[OPT_FERTILIZING_INTERVAL_DAYS]),
-        ): vol.All(vol.Coerce(int), vol.Range(min=0)),
-        vol.Optional(
-            OPT_MOISTURE_MIN, default=int(DEFAULT_OPTIONS[OPT_MOISTURE_MIN])
-        ): vol.Coerce(int),
-        vol.Optional(
-            OPT_MOISTURE_MAX, default=int(DEFAULT_OPTIONS[OPT_MOISTURE_MAX])
-        ): vol.Coerce(int),
-        vol.Optional(
-            OPT_HUMIDITY_MIN, default=int(DEFAULT_OPTIONS[OPT_HUMIDITY_MIN])
-        ): vol.Coerce(int),
-        vol.Optional(
-            OPT_HUMIDITY_MAX, default=int(DEFAULT_OPTIONS[OPT_HUMIDITY_MAX])
-        ): vol.Coerce(int),
-        vol.Optional(
-            OPT_TEMP_MIN, default=float(DEFAULT_OPTIONS[OPT_TEMP_MIN])
-        ): vol.Coerce(float),
-        vol.Optional(
-            OPT_TEMP_MAX, default=float(DEFAULT_OPTIONS[OPT_TEMP_MAX])
-        ): vol.Coerce(float),
-        vol.Optional(
-            OPT_LIGHT_MIN, default=int(DEFAULT_OPTIONS[OPT_LIGHT_MIN])
-        ): vol.Coerce(int),
-        vol.Optional(
-            OPT_LIGHT_MAX, default=int(DEFAULT_OPTIONS[OPT_LIGHT_MAX])
-        ): vol.Coerce(int),
-        # Optional external sensors (entity_ids)
-        # IMPORTANT: default=None so the selector is truly optional (no forced selection)
-        vol.Optional(OPT_TEMP_ENTITY_ID): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain="sensor")
-        ),
-        vol.Optional(OPT_HUMIDITY_ENTITY_ID): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain="sensor")
-        ),
-        vol.Optional(OPT_MOISTURE_ENTITY_ID): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain="sensor")
-        ),
+        # Optional: search the species profiles for care defaults
+        vol.Optional(CONF_SPECIES): selector.TextSelector(),
     }
 )
 
+# Care settings; their defaults come from the species profile, if one was picked
+_SETTINGS_FIELDS: dict[str, Any] = {
+    OPT_WATERING_INTERVAL_DAYS: vol.All(vol.Coerce(int), vol.Range(min=0)),
+    OPT_FERTILIZING_INTERVAL_DAYS: vol.All(vol.Coerce(int), vol.Range(min=0)),
+    OPT_MOISTURE_MIN: vol.Coerce(int),
+    OPT_MOISTURE_MAX: vol.Coerce(int),
+    OPT_HUMIDITY_MIN: vol.Coerce(int),
+    OPT_HUMIDITY_MAX: vol.Coerce(int),
+    OPT_TEMP_MIN: vol.Coerce(float),
+    OPT_TEMP_MAX: vol.Coerce(float),
+    OPT_LIGHT_MIN: vol.Coerce(int),
+    OPT_LIGHT_MAX: vol.Coerce(int),
+}
+
+
+def _settings_schema(defaults: dict[str, Any]) -> vol.Schema:
+    return vol.Schema(
+        {
+            **{
+                vol.Optional(key, default=validator(defaults[key])): validator
+                for key, validator in _SETTINGS_FIELDS.items()
+            },
+            # Optional external sensors (entity_ids)
+            # IMPORTANT: default=None so the selector is truly optional (no forced selection)
+            vol.Optional(OPT_TEMP_ENTITY_ID): selector.EntitySelector(
+                selector.EntitySelectorConfig(domain="sensor")
+            ),
+            vol.Optional(OPT_HUMIDITY_ENTITY_ID): selector.EntitySelector(
+                selector.EntitySelectorConfig(domain="sensor")
+            ),
+            vol.Optional(OPT_MOISTURE_ENTITY_ID): selector.EntitySelector(
+                selector.EntitySelectorConfig(domain="sensor")
+            ),
+            vol.Optional(OPT_LIGHT_ENTITY_ID): selector.EntitySelector(
+                selector.EntitySelectorConfig(domain="sensor")
+            ),
+        }
+    )
+
 
 class PlantCareConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
@@ -88,21 +94,89 @@ class PlantCareConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return PlantCareOptionsFlowHandler(config_entry)
 
+    def __init__(self) -> None:
+        self._plant_name = ""
+        self._species: SpeciesProfile | None = None
+        self._matches: list[SpeciesProfile] = []
+
     async def async_step_user(self, user_input=None) -> FlowResult:
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            self._plant_name = user_input[CONF_PLANT_NAME].strip()
+
+            # Use plant_id as unique_id so it stays stable even if the entry title/name changes later
+            await self.async_set_unique_id(slugify(self._plant_name))
+            self._abort_if_unique_id_configured()
+
+            if not (query := (user_input.get(CONF_SPECIES) or "").strip()):
+                return await self.async_step_settings()
+            # The profiles are only loaded once someone searches them
+            try:
+                index = await async_get_species_index(self.hass)
+            except (OSError, ValueError, csv.Error) as err:
+                # The plant can still be set up with the generic defaults
+                _LOGGER.warning("Cannot load the species profiles: %s", err)
+                return await self.async_step_settings()
+            self._matches = index.search(query)
+            if self._matches:
+                return await self.async_step_species()
+            errors[CONF_SPECIES] = "no_species_match"
+
+        return self.async_show_form(
+            step_id="user",
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_USER_SCHEMA, user_input or {}
+            ),
+            errors=errors,
+        )
+
+    async def async_step_species(self, user_input=None) -> FlowResult:
+        """Pick one of the species profiles matching the search."""
+        if user_input is not None:
+            self._species = next(
+                (p for p in self._matches if p.key == user_input[CONF_SPECIES]), None
+            )
+            return await self.async_step_settings()
+
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_SPECIES, default=self._matches[0].key
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=[
+                            selector.SelectOptionDict(value=p.key, label=p.label)
+                            for p in self._matches
+                        ],
+                        mode=selector.SelectSelectorMode.LIST,
+                    )
+                )
+            }
+        )
+        return self.async_show_form(step_id="species", data_schema=schema)
+
+    async def async_step_settings(self, user_input=None) -> FlowResult:
+        """Care settings, prefilled from the species profile (or the defaults)."""
         if user_input is None:
-            return self.async_show_form(step_id="user", data_schema=STEP_USER_SCHEMA)
+            defaults = dict(DEFAULT_OPTIONS)
+            if self._species is not None:
+                defaults.update(self._species.options)
+            return self.async_show_form(
+                step_id="settings",
+                data_schema=_settings_schema(defaults),
+                description_placeholders={
+                    "species": self._species.label if self._species else "-"
+                },
+            )
 
-        plant_name = user_input[CONF_PLANT_NAME].strip()
+        plant_name = self._plant_name
         plant_id = slugify(plant_name)
 
-        # Use plant_id as unique_id so it stays stable even if the entry title/name changes later
-        await self.async_set_unique_id(plant_id)
-        self._abort_if_unique_id_configured()
-
         # Optional sensors: store "" when not selected
         temp_entity = (user_input.get(OPT_TEMP_ENTITY_ID) or "").strip()
         humidity_entity = (user_input.get(OPT_HUMIDITY_ENTITY_ID) or "").strip()
         moisture_entity = (user_input.get(OPT_MOISTURE_ENTITY_ID) or "").strip()
+        light_entity = (user_input.get(OPT_LIGHT_ENTITY_ID) or "").strip()
 
         options = {
             OPT_WATERING_INTERVAL_DAYS: int(user_input[OPT_WATERING_INTERVAL_DAYS]),
@@ -121,8 +195,27 @@ class PlantCareConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             OPT_TEMP_ENTITY_ID: temp_entity,
             OPT_HUMIDITY_ENTITY_ID: humidity_entity,
             OPT_MOISTURE_ENTITY_ID: moisture_entity,
+            OPT_LIGHT_ENTITY_ID: light_entity,
+        }
+
+        data = {
+            CONF_PLANT_NAME: plant_name,
+            CONF_PLANT_ID: plant_id,
         }
+        if self._species is not None:
+            data[CONF_SPECIES] = self._species.key
+
+        return self.async_create_entry(title=plant_name, data=data, options=options)
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Create a plant from a bulk import row (see bulk.py)."""
+        plant_name = import_data[CONF_PLANT_NAME].strip()
+        plant_id = import_data.get(CONF_PLANT_ID) or slugify(plant_name)
+
+        await self.async_set_unique_id(plant_id)
+        self._abort_if_unique_id_configured()
 
+        options = {**DEFAULT_OPTIONS, **import_data.get("options", {})}
         data = {
             CONF_PLANT_NAME: plant_name,
             CONF_PLANT_ID: plant_id,
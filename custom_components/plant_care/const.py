@@ -7,11 +7,12 @@ PLATFORMS = ["sensor", "binary_sensor", "button", "number"]
 # Entry data keys
 CONF_PLANT_ID = "plant_id"
 CONF_PLANT_NAME = "plant_name"
+CONF_SPECIES = "species"  # key of the species profile the plant was created from
 
-# Task types
+# Task types every plant has (more per plant via OPT_EXTRA_TASKS, see tasks.py)
 TASK_WATERING = "watering"
 TASK_FERTILIZING = "fertilizing"
-TASKS = (TASK_WATERING, TASK_FERTILIZING)
+CORE_TASKS = (TASK_WATERING, TASK_FERTILIZING)
 
 # Option keys (stored in config_entry.options)
 OPT_WATERING_INTERVAL_DAYS = "watering_interval_days"
@@ -29,14 +30,54 @@ OPT_TEMP_MAX = "temp_max"
 OPT_LIGHT_MIN = "light_min"
 OPT_LIGHT_MAX = "light_max"
 
+# Out-of-range filtering per metric (hysteresis in the metric's unit, dwell in minutes)
+OPT_TEMP_HYSTERESIS = "temp_hysteresis"
+OPT_TEMP_MIN_DWELL = "temp_min_dwell_minutes"
+OPT_HUMIDITY_HYSTERESIS = "humidity_hysteresis"
+OPT_HUMIDITY_MIN_DWELL = "humidity_min_dwell_minutes"
+OPT_MOISTURE_HYSTERESIS = "moisture_hysteresis"
+OPT_MOISTURE_MIN_DWELL = "moisture_min_dwell_minutes"
+OPT_LIGHT_HYSTERESIS = "light_hysteresis"
+OPT_LIGHT_MIN_DWELL = "light_min_dwell_minutes"
+
+# Watering due date may come earlier from the moisture trend (see prediction.py)
+OPT_WATERING_PREDICTIVE = "watering_predictive"
+
+# Adaptive intervals: learn the interval from the actual mark-done events
+OPT_WATERING_ADAPTIVE = "watering_adaptive"
+OPT_FERTILIZING_ADAPTIVE = "fertilizing_adaptive"
+
+# Additional task types of a plant (list), e.g. ["misting", "repotting"]
+OPT_EXTRA_TASKS = "extra_tasks"
+
 # Optional external source sensors (entity_ids)
 OPT_TEMP_ENTITY_ID = "temp_entity_id"
 OPT_HUMIDITY_ENTITY_ID = "humidity_entity_id"
 OPT_MOISTURE_ENTITY_ID = "moisture_entity_id"
+OPT_LIGHT_ENTITY_ID = "light_entity_id"
+
+# Environment metrics: metric -> (source entity option, min option, max option)
+ENV_METRICS: dict[str, tuple[str, str, str]] = {
+    "temperature": (OPT_TEMP_ENTITY_ID, OPT_TEMP_MIN, OPT_TEMP_MAX),
+    "humidity": (OPT_HUMIDITY_ENTITY_ID, OPT_HUMIDITY_MIN, OPT_HUMIDITY_MAX),
+    "moisture": (OPT_MOISTURE_ENTITY_ID, OPT_MOISTURE_MIN, OPT_MOISTURE_MAX),
+    # Light bounds are checked against the smoothed illuminance (see dli.py)
+    "light": (OPT_LIGHT_ENTITY_ID, OPT_LIGHT_MIN, OPT_LIGHT_MAX),
+}
+METRICS = tuple(ENV_METRICS)
+
+# Out-of-range filtering: metric -> (hysteresis option, minimum dwell option)
+ENV_METRIC_FILTERS: dict[str, tuple[str, str]] = {
+    "temperature": (OPT_TEMP_HYSTERESIS, OPT_TEMP_MIN_DWELL),
+    "humidity": (OPT_HUMIDITY_HYSTERESIS, OPT_HUMIDITY_MIN_DWELL),
+    "moisture": (OPT_MOISTURE_HYSTERESIS, OPT_MOISTURE_MIN_DWELL),
+    "light": (OPT_LIGHT_HYSTERESIS, OPT_LIGHT_MIN_DWELL),
+}
 
 # Mixed-type defaults: numbers + strings
 # (Intervals support 0 to disable; entity_id empty string means "not configured")
-DEFAULT_OPTIONS: dict[str, float | str] = {
+# Interval / adaptive options of extra tasks default to their task definition
+DEFAULT_OPTIONS: dict[str, float | str | bool | list[str]] = {
     OPT_WATERING_INTERVAL_DAYS: 7,
     OPT_FERTILIZING_INTERVAL_DAYS: 30,
     OPT_MOISTURE_MIN: 0,
@@ -47,13 +88,69 @@ DEFAULT_OPTIONS: dict[str, float | str] = {
     OPT_TEMP_MAX: 30,
     OPT_LIGHT_MIN: 0,
     OPT_LIGHT_MAX: 100000,
+    OPT_TEMP_HYSTERESIS: 0,
+    OPT_TEMP_MIN_DWELL: 0,
+    OPT_HUMIDITY_HYSTERESIS: 0,
+    OPT_HUMIDITY_MIN_DWELL: 0,
+    OPT_MOISTURE_HYSTERESIS: 0,
+    OPT_MOISTURE_MIN_DWELL: 0,
+    OPT_LIGHT_HYSTERESIS: 0,
+    OPT_LIGHT_MIN_DWELL: 0,
     OPT_TEMP_ENTITY_ID: "",
     OPT_HUMIDITY_ENTITY_ID: "",
     OPT_MOISTURE_ENTITY_ID: "",
+    OPT_LIGHT_ENTITY_ID: "",
+    OPT_WATERING_PREDICTIVE: False,
+    OPT_WATERING_ADAPTIVE: False,
+    OPT_FERTILIZING_ADAPTIVE: False,
+    OPT_EXTRA_TASKS: [],
 }
 
-STORAGE_VERSION = 1
+# Domain-wide scheduler
+SCHEDULER_BATCH_SIZE = 25  # plants refreshed together in one scheduler pass
+SCHEDULER_BATCH_DELAY = 0.1  # seconds between batches (keeps the event loop responsive)
+SCHEDULER_RETRY_DELAY = 300  # seconds until a plant whose refresh failed is retried
+
+# Light: lux -> PPFD (µmol/m²/s) conversion for sunlight, and the time
+# constant of the smoothed illuminance used for the light bounds
+LUX_TO_PPFD = 0.0185
+LIGHT_SMOOTHING_TAU = 1800  # seconds
+
+# Moisture trend: readings needed before predicting, minimum time span of
+# the fit, and the rise (points) that counts as watering (new segment)
+PREDICTION_MIN_SAMPLES = 6
+PREDICTION_MIN_SPAN = 6 * 3600  # seconds
+PREDICTION_RISE_RESET = 5.0
+
+# Adaptive intervals: weight of the newest gap in the exponentially weighted
+# mean, and shorter gaps that are ignored (e.g. a button pressed twice)
+ADAPTIVE_ALPHA = 0.3
+ADAPTIVE_MIN_GAP_DAYS = 0.5
+
+# Instrumentation: upper bounds (seconds) of the duration histogram buckets
+INSTRUMENTATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# Calendar: days of events kept in the per-day cache before it is cleared
+CALENDAR_CACHE_MAX_DAYS = 400
+
+# Number entity edits within this window are written as one options update
+OPTIONS_SAVE_DELAY = 1.0  # seconds
+
+# Bulk import: plants created (and set up) concurrently per batch
+IMPORT_BATCH_SIZE = 10
+
+# Species profiles (species.csv): matches offered by the config flow, and the
+# share of the query's trigrams a name must contain to match approximately
+SPECIES_SEARCH_LIMIT = 20
+SPECIES_MIN_SIMILARITY = 0.4
+
+STORAGE_VERSION = 5
 STORAGE_KEY = f"{DOMAIN}_state"
+STORAGE_SAVE_DELAY = 10  # seconds; bursts of updates within this window -> one write
+STORAGE_JOURNAL_COMPACT_THRESHOLD = 500  # journal events before folding into a snapshot
+
+# Care history kept per plant and task (oldest events are dropped beyond this)
+HISTORY_MAX_EVENTS = 256
 
 
 def plant_object_id(entry, suffix: str) -> str:
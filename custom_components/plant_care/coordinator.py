@@ -1,50 +1,231 @@
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
 from typing import Any
+from datetime import date, datetime, timedelta
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    CONF_PLANT_NAME,
     DEFAULT_OPTIONS,
-    OPT_WATERING_INTERVAL_DAYS,
-    OPT_FERTILIZING_INTERVAL_DAYS,
-    OPT_TEMP_ENTITY_ID,
-    OPT_HUMIDITY_ENTITY_ID,
-    OPT_MOISTURE_ENTITY_ID,
-    OPT_TEMP_MIN,
-    OPT_TEMP_MAX,
-    OPT_HUMIDITY_MIN,
-    OPT_HUMIDITY_MAX,
-    OPT_MOISTURE_MIN,
-    OPT_MOISTURE_MAX,
+    ENV_METRIC_FILTERS,
+    ENV_METRICS,
+    METRICS,
+    OPT_WATERING_PREDICTIVE,
+    OPTIONS_SAVE_DELAY,
     TASK_WATERING,
-    TASK_FERTILIZING,
 )
-from .storage import PlantCareStorage
+from .dli import DailyLightIntegral
+from .instrumentation import async_get_instrumentation
+from .prediction import MoistureTrend
+from .range_filter import OutOfRangeFilter
+from .sources import async_get_sources, state_to_float
+from .storage import PlantCareStorage, PlantState
+from .tasks import get_task_definition, option_default, plant_task_types
 
 _LOGGER = logging.getLogger(__name__)
 
+_LIGHT = METRICS.index("light")
+_MOISTURE = METRICS.index("moisture")
+# Core tasks come first in every plant's task list
+_WATERING = 0
+
+
+@dataclass(slots=True, frozen=True)
+class PlantConfig:
+    """Per-entry configuration compiled from the entry options.
+
+    Rebuilt only when the options change, so refreshes don't repeat option
+    lookups and float() conversions for static values. Per-task values are
+    tuples indexed like `tasks`, per-metric values like METRICS.
+    """
+
+    plant_name: str
+    tasks: tuple[str, ...]  # task types of the plant (core tasks first)
+    intervals: tuple[int, ...]  # interval days per task (0 = disabled)
+    bounds: tuple[tuple[float, float], ...]  # (min, max) per metric
+    sources: tuple[str, ...]  # source entity_id per metric ("" = not configured)
+    filters: tuple[tuple[float, float], ...]  # (hysteresis, min dwell seconds) per metric
+    predictive: bool  # watering may come due earlier by the moisture trend
+    adaptive: tuple[bool, ...]  # use the learned interval per task
+
+    @classmethod
+    def from_entry(cls, entry) -> PlantConfig:
+        options = entry.options
+
+        def number(key: str) -> float:
+            return float(options.get(key, DEFAULT_OPTIONS[key]))
+
+        task_types = plant_task_types(options)
+        definitions = [get_task_definition(task_type) for task_type in task_types]
+        return cls(
+            plant_name=entry.data.get(CONF_PLANT_NAME, "Plant"),
+            tasks=task_types,
+            intervals=tuple(
+                int(float(options.get(d.interval_option, d.default_interval)))
+                for d in definitions
+            ),
+            bounds=tuple(
+                (number(ENV_METRICS[metric][1]), number(ENV_METRICS[metric][2]))
+                for metric in METRICS
+            ),
+            sources=tuple(
+                (options.get(ENV_METRICS[metric][0]) or "").strip() for metric in METRICS
+            ),
+            filters=tuple(
+                (
+                    number(ENV_METRIC_FILTERS[metric][0]),
+                    number(ENV_METRIC_FILTERS[metric][1]) * 60,
+                )
+                for metric in METRICS
+            ),
+            predictive=bool(options.get(OPT_WATERING_PREDICTIVE, False)),
+            adaptive=tuple(
+                bool(options.get(d.adaptive_option, False)) for d in definitions
+            ),
+        )
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TaskComputed:
     last_done: datetime | None
     next_due_date: date | None
     is_due: bool
     days_overdue: int
+    interval_days: int = 0  # interval the due date is based on (0 = disabled)
+    # Interval learned from the care history (None = not enough events yet)
+    learned_interval_days: float | None = None
+
+    def next_change_date(self) -> date | None:
+        """Return the next local date on which this task's state changes.
+
+        - disabled: never
+        - not due yet: the day it becomes due
+        - due: tomorrow (days_overdue / next_due_date move on)
+        """
+        if self.next_due_date is None:
+            return None
+        if not self.is_due:
+            return self.next_due_date
+        return self.next_due_date + timedelta(days=self.days_overdue + 1)
+
+
+@dataclass(slots=True, frozen=True)
+class MetricResult:
+    value: float | None
+    min: float
+    max: float
+    out_of_range: bool | None  # None => unavailable
+    deviation: float | None
+
+
+@dataclass(slots=True)
+class PlantCareData:
+    """Coordinator result. Entities bind to their task/metric index once."""
+
+    plant_name: str
+    task_types: tuple[str, ...]  # the plant's tasks, see PlantConfig.tasks
+    tasks: tuple[TaskComputed, ...]  # indexed like task_types
+    env: list[MetricResult]  # indexed like METRICS; updated in place by source pushes
+    # Day the moisture trend crosses moisture_min (None = no prediction)
+    predicted_watering: date | None = None
+
+
+def _compute_task(
+    last_done_ts: int | None,
+    interval_days: int,
+    today: date,
+    predicted: date | None = None,
+    learned: float | None = None,
+    adaptive: bool = False,
+) -> TaskComputed:
+    last_done = (
+        dt_util.utc_from_timestamp(last_done_ts) if last_done_ts is not None else None
+    )
+
+    # interval_days == 0 means "disabled"
+    if interval_days <= 0:
+        return TaskComputed(
+            last_done=last_done,
+            next_due_date=None,
+            is_due=False,
+            days_overdue=0,
+            learned_interval_days=learned,
+        )
 
+    if adaptive and learned is not None:
+        # Adaptive mode: follow how often the task is actually done
+        interval_days = max(1, round(learned))
 
-class PlantCareCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    if last_done is None:
+        # Never done -> due immediately
+        return TaskComputed(
+            last_done=None,
+            next_due_date=today,
+            is_due=True,
+            days_overdue=0,
+            interval_days=interval_days,
+            learned_interval_days=learned,
+        )
+
+    last_done_date = dt_util.as_local(last_done).date()
+    next_due = last_done_date + timedelta(days=interval_days)
+    if predicted is not None and predicted < next_due:
+        # Predictive watering: due when the soil is expected to be too dry
+        next_due = max(predicted, last_done_date)
+    is_due = today >= next_due
+    overdue = (today - next_due).days if is_due else 0
+
+    return TaskComputed(
+        last_done=last_done,
+        next_due_date=next_due,
+        is_due=is_due,
+        days_overdue=overdue,
+        interval_days=interval_days,
+        learned_interval_days=learned,
+    )
+
+
+def _compute_bounds(
+    value: float | None, min_v: float, max_v: float, out_of_range: bool | None
+) -> MetricResult:
+    # out_of_range comes from the metric's OutOfRangeFilter; deviation stays raw
+    # if value is None -> unavailable
+    if value is None:
+        return MetricResult(None, min_v, max_v, None, None)
+    if value < min_v:
+        # below min
+        return MetricResult(value, min_v, max_v, out_of_range, float(min_v - value))
+    if value > max_v:
+        # above max
+        return MetricResult(value, min_v, max_v, out_of_range, float(value - max_v))
+    return MetricResult(value, min_v, max_v, out_of_range, 0.0)
+
+
+class PlantCareCoordinator(DataUpdateCoordinator[PlantCareData]):
     """Coordinator for plant care.
 
     Updates:
-    - every hour (env checks)
-    - plus manual refresh via buttons/config changes (async_refresh())
-    - plus your daily trigger at 03:00 (handled in __init__.py)
+    - env metrics are event-driven: a state change of a configured source
+      sensor re-evaluates only that metric and pushes it to its entities
+      (sources shared by plants are subscribed once, sources.py);
+      the out-of-range state is filtered by per-metric hysteresis and
+      minimum dwell time (range_filter.py)
+    - manual refresh via buttons (async_refresh())
+    - option changes re-evaluate only the affected tasks/metrics; number
+      entity edits are coalesced into one options write
+    - refreshes that produce identical data don't notify any entity
+    - tasks are memoized on their inputs; task entities are only notified
+      when their own task changed, so extra tasks add little refresh cost
+    - task due-state transitions wake exactly the affected plants
+      (domain scheduler, scheduler.py)
     """
 
     def __init__(self, hass: HomeAssistant, entry, storage: PlantCareStorage) -> None:
@@ -52,151 +233,472 @@ class PlantCareCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass,
             logger=_LOGGER,
             name=f"plant_care_{entry.entry_id}",
-            update_interval=timedelta(minutes=15),
+            # No polling: env sensors push state changes, due dates are woken
+            # by the domain scheduler
+            update_interval=None,
+            # Only notify entities when a refresh produced different data
+            always_update=False,
         )
         self.entry = entry
         self.storage = storage
+        self.instrumentation = async_get_instrumentation(hass)
+        # Entity state writes of this plant (counted by PlantCareEntity)
+        self.state_writes = 0
 
-    def get_number(self, key: str) -> float:
-        """Return numeric option/config values (floats/ints) with defaults."""
-        return float(self.entry.options.get(key, DEFAULT_OPTIONS[key]))
+        # source entity_id -> indices of the metrics fed by it
+        self._tracked_sources: dict[str, tuple[int, ...]] = {}
+        # Tracked sources that have not reported a usable value yet; entities
+        # not derived from the current reading (DLI, prediction) are
+        # unavailable until they do
+        self.pending_sources: set[str] = set()
+        self._sources = async_get_sources(hass)
+        self._metric_listeners: dict[int, list[CALLBACK_TYPE]] = {}
+        self._task_listeners: dict[int, list[CALLBACK_TYPE]] = {}
+        # task type -> (inputs, result) of its last computation
+        self._task_memo: dict[str, tuple[tuple[Any, ...], TaskComputed]] = {}
+        # Tasks the task listeners were last notified of
+        self._notified_tasks: tuple[TaskComputed, ...] = ()
+        # Hysteresis/dwell state per metric, plus timers committing pending changes
+        self._range_filters = [OutOfRangeFilter() for _ in METRICS]
+        self._filter_timers: dict[int, CALLBACK_TYPE] = {}
+        # Daily light integral, fed with the light source readings
+        self.light = DailyLightIntegral()
+        # Drying trend, fed with the moisture source readings
+        self.moisture_trend = MoistureTrend()
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        # Load persisted last_* values
-        state = await self.storage.get_entry_state(self.entry.entry_id)
+        self._config: PlantConfig | None = None
+        self._config_options = None
+        # Config the current data was computed with (see async_options_updated)
+        self._applied_config: PlantConfig | None = None
 
-        now = dt_util.now()
-        today = dt_util.as_local(now).date()
-
-        def parse_iso(iso: str | None) -> datetime | None:
-            if not iso:
-                return None
-            try:
-                dt = dt_util.parse_datetime(iso)
-                return dt_util.as_local(dt) if dt else None
-            except Exception:
-                return None
-
-        last_watered_dt = parse_iso(state.last_watered)
-        last_fertilized_dt = parse_iso(state.last_fertilized)
-
-        def compute_task(
-            last_done: datetime | None, interval_days: int
-        ) -> TaskComputed:
-            # interval_days == 0 means "disabled"
-            if interval_days <= 0:
-                return TaskComputed(
-                    last_done=last_done,
-                    next_due_date=None,
-                    is_due=False,
-                    days_overdue=0,
-                )
+        # Number entity edits not yet written to the entry options
+        self._pending_options: dict[str, Any] = {}
+        # option key -> listeners (number entities showing the option)
+        self._option_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        # Options the option listeners were last notified of
+        self._notified_options = entry.options
+        self._options_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=OPTIONS_SAVE_DELAY,
+            immediate=False,
+            function=self.async_write_pending_options,
+        )
 
-            if last_done is None:
-                # Never done -> due immediately
-                return TaskComputed(
-                    last_done=None,
-                    next_due_date=today,
-                    is_due=True,
-                    days_overdue=0,
-                )
+    @property
+    def config(self) -> PlantConfig:
+        """Compiled configuration; rebuilt only when the entry options changed."""
+        # Home Assistant replaces the options mapping on every update
+        if self._config is None or self.entry.options is not self._config_options:
+            self._config_options = self.entry.options
+            self._config = PlantConfig.from_entry(self.entry)
+            for range_filter, (hysteresis, min_dwell) in zip(
+                self._range_filters, self._config.filters
+            ):
+                range_filter.hysteresis = hysteresis
+                range_filter.min_dwell = min_dwell
+        return self._config
 
-            last_done_date = dt_util.as_local(last_done).date()
-            next_due = last_done_date + timedelta(days=interval_days)
-            is_due = today >= next_due
-            overdue = (today - next_due).days if is_due else 0
+    # --- Options ---
 
-            return TaskComputed(
-                last_done=last_done,
-                next_due_date=next_due,
-                is_due=is_due,
-                days_overdue=overdue,
+    def get_option(self, key: str) -> Any:
+        """Current value of an option, including edits that are not written yet."""
+        if key in self._pending_options:
+            return self._pending_options[key]
+        if key in self.entry.options:
+            return self.entry.options[key]
+        return option_default(key)
+
+    @callback
+    def async_set_option(self, key: str, value: Any) -> None:
+        """Queue an option edit; edits within OPTIONS_SAVE_DELAY are written together."""
+        self._pending_options[key] = value
+        self._options_debouncer.async_schedule_call()
+
+    @callback
+    def async_write_pending_options(self, _event: Event | None = None) -> None:
+        """Write queued option edits in one config entry update (also on unload/stop)."""
+        self._options_debouncer.async_cancel()
+        pending, self._pending_options = self._pending_options, {}
+        if pending:
+            # The entry update listener then calls async_options_updated()
+            self.hass.config_entries.async_update_entry(
+                self.entry, options={**self.entry.options, **pending}
             )
 
-        def _read_float_state(entity_id: str) -> float | None:
-            if not entity_id:
-                return None
-            st = self.hass.states.get(entity_id)
-            if st is None:
-                return None
-            try:
-                return float(st.state)
-            except (ValueError, TypeError):
-                return None
-
-        def _compute_bounds(
-            value: float | None, min_v: float, max_v: float
-        ) -> dict[str, Any]:
-            # if value is None -> unavailable
-            if value is None:
-                return {
-                    "value": None,
-                    "min": min_v,
-                    "max": max_v,
-                    "out_of_range": None,  # None => unavailable
-                    "deviation": None,
-                }
-
-            if value < min_v:
-                return {
-                    "value": value,
-                    "min": min_v,
-                    "max": max_v,
-                    "out_of_range": True,
-                    "deviation": float(min_v - value),  # below min
-                }
-            if value > max_v:
-                return {
-                    "value": value,
-                    "min": min_v,
-                    "max": max_v,
-                    "out_of_range": True,
-                    "deviation": float(value - max_v),  # above max
-                }
-            return {
-                "value": value,
-                "min": min_v,
-                "max": max_v,
-                "out_of_range": False,
-                "deviation": 0.0,
-            }
-
-        # --- Task intervals (0 disables) ---
-        water_interval = int(self.get_number(OPT_WATERING_INTERVAL_DAYS))
-        fert_interval = int(self.get_number(OPT_FERTILIZING_INTERVAL_DAYS))
-
-        watering = compute_task(last_watered_dt, water_interval)
-        fertilizing = compute_task(last_fertilized_dt, fert_interval)
+    @callback
+    def async_add_option_listener(
+        self, key: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for changes of one option in the entry options."""
+        listeners = self._option_listeners.setdefault(key, [])
+        listeners.append(update_callback)
 
-        # --- External env sensors (optional) ---
-        temp_entity = (self.entry.options.get(OPT_TEMP_ENTITY_ID) or "").strip()
-        humidity_entity = (self.entry.options.get(OPT_HUMIDITY_ENTITY_ID) or "").strip()
-        moisture_entity = (self.entry.options.get(OPT_MOISTURE_ENTITY_ID) or "").strip()
-
-        temp_value = _read_float_state(temp_entity)
-        humidity_value = _read_float_state(humidity_entity)
-        moisture_value = _read_float_state(moisture_entity)
-
-        temp_min = float(self.get_number(OPT_TEMP_MIN))
-        temp_max = float(self.get_number(OPT_TEMP_MAX))
-        humidity_min = float(self.get_number(OPT_HUMIDITY_MIN))
-        humidity_max = float(self.get_number(OPT_HUMIDITY_MAX))
-        moisture_min = float(self.get_number(OPT_MOISTURE_MIN))
-        moisture_max = float(self.get_number(OPT_MOISTURE_MAX))
-
-        env = {
-            "temperature": _compute_bounds(temp_value, temp_min, temp_max),
-            "humidity": _compute_bounds(humidity_value, humidity_min, humidity_max),
-            "moisture": _compute_bounds(moisture_value, moisture_min, moisture_max),
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_notify_options(self) -> None:
+        options, notified = self.entry.options, self._notified_options
+        self._notified_options = options
+        for key, listeners in self._option_listeners.items():
+            if options.get(key) != notified.get(key):
+                for update_callback in list(listeners):
+                    update_callback()
+
+    async def async_options_updated(self) -> None:
+        """Re-evaluate only the tasks/metrics affected by an options change."""
+        self._async_notify_options()
+        old = self._applied_config
+        new = self.config
+        self.async_track_sources()
+        if self.data is None or old is None:
+            await self.async_refresh()
+            return
+        if new.tasks != old.tasks:
+            # Tasks were added or removed: the entry is reloaded (see __init__)
+            return
+        self._applied_config = new
+
+        if new.intervals != old.intervals or new.adaptive != old.adaptive:
+            state = await self.storage.get_entry_state(self.entry.entry_id)
+            # Unchanged tasks come back from the memo as the same objects
+            tasks = self._compute_tasks(
+                state, dt_util.now().date(), self.data.predicted_watering
+            )
+            if tasks != self.data.tasks:
+                self.data.tasks = tasks
+                # Only the changed tasks' entities are notified; the
+                # scheduler re-indexes the due transitions
+                self.async_update_listeners()
+
+        for index in range(len(METRICS)):
+            if new.sources[index] != old.sources[index]:
+                # The filter state belongs to the readings of the old source
+                self._range_filters[index].reset()
+            if (
+                new.bounds[index] != old.bounds[index]
+                or new.sources[index] != old.sources[index]
+                or new.filters[index] != old.filters[index]
+            ):
+                self._async_update_metric(index, None)
+
+        if new.predictive != old.predictive:
+            self._async_update_prediction(force=True)
+
+    def get_source_entity(self, metric: str) -> str:
+        """Return the configured source entity_id for a metric ("" if unset)."""
+        return self.config.sources[METRICS.index(metric)]
+
+    def is_source_pending(self, metric: str) -> bool:
+        """True while the metric's source has not reported a usable value yet."""
+        return self.get_source_entity(metric) in self.pending_sources
+
+    def _evaluate_metric(
+        self, index: int, state: State | None = None, value: float | None = None
+    ) -> MetricResult:
+        """Evaluate a metric from the source state (read if not given).
+
+        `value` is the state already parsed (by the source registry).
+        """
+        config = self.config
+        if state is None:
+            entity_id = config.sources[index]
+            state = self.hass.states.get(entity_id) if entity_id else None
+        min_v, max_v = config.bounds[index]
+        if value is None:
+            value = state_to_float(state)
+        now = dt_util.utcnow().timestamp()
+        if index == _LIGHT:
+            # Accumulate the DLI; bounds use the smoothed illuminance
+            value = self.light.update(value, now)
+        elif index == _MOISTURE and value is not None:
+            # Refreshes re-read the same state; its timestamp dedupes the sample
+            self.moisture_trend.add(value, state.last_updated.timestamp())
+
+        range_filter = self._range_filters[index]
+        pending = range_filter.update(value, min_v, max_v, now)
+        self._async_schedule_filter_check(index, pending)
+        return _compute_bounds(value, min_v, max_v, range_filter.state)
+
+    @callback
+    def _async_schedule_filter_check(self, index: int, delay: float | None) -> None:
+        """Re-evaluate a metric once its pending out-of-range change may commit."""
+        if delay is None:
+            if (unsub := self._filter_timers.pop(index, None)) is not None:
+                unsub()
+            return
+        if index in self._filter_timers:
+            return  # already armed for the same pending change
+
+        @callback
+        def _async_check(_now) -> None:
+            self._filter_timers.pop(index, None)
+            if self.data is not None:
+                self._async_update_metric(index, None)
+
+        self._filter_timers[index] = async_call_later(self.hass, delay, _async_check)
+
+    @callback
+    def async_cancel_filter_timers(self) -> None:
+        for unsub in self._filter_timers.values():
+            unsub()
+        self._filter_timers.clear()
+
+    # --- Event-driven env evaluation ---
+
+    @callback
+    def async_track_sources(self) -> bool:
+        """Subscribe to the configured source sensors (via the source registry).
+
+        Idempotent: only resubscribes when the configured entity_ids changed.
+        Returns True if the subscription changed.
+        """
+        sources: dict[str, list[int]] = {}
+        for index, entity_id in enumerate(self.config.sources):
+            if entity_id:
+                sources.setdefault(entity_id, []).append(index)
+        tracked = {entity_id: tuple(m) for entity_id, m in sources.items()}
+
+        if tracked == self._tracked_sources:
+            return False
+
+        self._tracked_sources = tracked
+        self.pending_sources = {
+            entity_id
+            for entity_id in tracked
+            if state_to_float(self.hass.states.get(entity_id)) is None
         }
+        self._sources.async_set_sources(self, tracked)
+        for entity_id in self.pending_sources:
+            for index in tracked[entity_id]:
+                self._async_notify_metric(index)
+        return True
+
+    @callback
+    def async_untrack_sources(self) -> None:
+        self._sources.async_set_sources(self, ())
+        self._tracked_sources = {}
+        self.pending_sources = set()
+
+    @callback
+    def async_add_metric_listener(
+        self, index: int, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for updates of a single env metric (pushed between refreshes)."""
+        listeners = self._metric_listeners.setdefault(index, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_add_task_listener(
+        self, index: int, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for changes of a single task (by its index in the plant's tasks)."""
+        listeners = self._task_listeners.setdefault(index, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the coordinator listeners, then the listeners of changed tasks."""
+        super().async_update_listeners()
+        if self.data is None:
+            return
+        tasks, notified = self.data.tasks, self._notified_tasks
+        self._notified_tasks = tasks
+        for index, task in enumerate(tasks):
+            # Memoized tasks are the same object as long as their inputs are
+            if index < len(notified) and notified[index] is task:
+                continue
+            for update_callback in list(self._task_listeners.get(index, ())):
+                update_callback()
+
+    @callback
+    def async_source_changed(
+        self, entity_id: str, new_state: State | None, value: float | None
+    ) -> None:
+        """A source sensor changed (called by the source registry with the parsed value)."""
+        # Nothing to update before the first refresh has produced data
+        if not self.data:
+            return
+
+        if entity_id in self.pending_sources and value is not None:
+            # First usable value of a late source: this event is the refresh
+            # (and makes its entities available again, see below)
+            self.pending_sources.discard(entity_id)
+            _LOGGER.debug("%s: source %s became available", self.name, entity_id)
+
+        for index in self._tracked_sources.get(entity_id, ()):
+            self._async_update_metric(index, new_state, value)
 
-        plant_name = self.entry.data.get("plant_name", "Plant")
+    @callback
+    def _async_update_metric(
+        self, index: int, state: State | None, value: float | None = None
+    ) -> None:
+        writes = self.state_writes
+        result = self._evaluate_metric(index, state, value)
+        if index == _MOISTURE:
+            # Before notifying: the prediction sensor is a moisture listener
+            self._async_update_prediction()
 
+        env = self.data.env
+        # The DLI (light) and the drying trend (moisture) move on with every
+        # reading, even if the result doesn't
+        if env[index] != result or index in (_LIGHT, _MOISTURE):
+            env[index] = result
+            self._async_notify_metric(index)
+
+        if self.instrumentation.enabled:
+            self.instrumentation.record_push_writes(
+                self.entry.entry_id, self.state_writes - writes
+            )
+
+    @callback
+    def async_start_of_day(self, now: datetime) -> None:
+        """Close the light day at local midnight (called by the domain scheduler).
+
+        The light sensor may not report around midnight; without this the
+        DLI sensor would keep showing the previous day until it does.
+        """
+        if self.data is None or not self.config.sources[_LIGHT]:
+            return
+        self.light.advance(now.timestamp())
+        self._async_notify_metric(_LIGHT)
+
+    @callback
+    def _async_notify_metric(self, index: int) -> None:
+        for update_callback in list(self._metric_listeners.get(index, ())):
+            update_callback()
+
+    def _predict_watering(self) -> date | None:
+        min_v = self.config.bounds[_MOISTURE][0]
+        if (ts := self.moisture_trend.predict_crossing(min_v)) is None:
+            return None
+        return dt_util.as_local(dt_util.utc_from_timestamp(ts)).date()
+
+    @callback
+    def _async_update_prediction(self, force: bool = False) -> None:
+        """Update the predicted watering day (and the due date in predictive mode)."""
+        data = self.data
+        predicted = self._predict_watering()
+        if predicted == data.predicted_watering and not force:
+            return
+        data.predicted_watering = predicted
+
+        config = self.config
+        if (memo := self._task_memo.get(TASK_WATERING)) is None:
+            return
+        last_done_ts, _interval, _today, _predicted, learned, _adaptive = memo[0]
+        task = self._compute_task_memo(
+            TASK_WATERING,
+            (
+                last_done_ts,
+                config.intervals[_WATERING],
+                dt_util.now().date(),
+                predicted if config.predictive else None,
+                learned,
+                config.adaptive[_WATERING],
+            ),
+        )
+        if task is not data.tasks[_WATERING]:
+            tasks = list(data.tasks)
+            tasks[_WATERING] = task
+            data.tasks = tuple(tasks)
+            self.async_update_listeners()
+
+    def _compute_task_memo(
+        self, task_type: str, inputs: tuple[Any, ...]
+    ) -> TaskComputed:
+        """_compute_task(*inputs), reusing the previous result if inputs are equal."""
+        memo = self._task_memo.get(task_type)
+        if memo is None or memo[0] != inputs:
+            memo = self._task_memo[task_type] = (inputs, _compute_task(*inputs))
+        return memo[1]
+
+    def _compute_tasks(
+        self, state: PlantState, today: date, predicted: date | None
+    ) -> tuple[TaskComputed, ...]:
+        """Compute all tasks of the plant, in config.tasks order (0 disables)."""
+        config = self.config
+        return tuple(
+            self._compute_task_memo(
+                task_type,
+                (
+                    state.last_done(task_type),
+                    config.intervals[index],
+                    today,
+                    predicted if index == _WATERING and config.predictive else None,
+                    state.learned(task_type),
+                    config.adaptive[index],
+                ),
+            )
+            for index, task_type in enumerate(config.tasks)
+        )
+
+    def as_diagnostics(self) -> dict[str, Any]:
         return {
-            "plant_name": plant_name,
-            "tasks": {
-                TASK_WATERING: watering,
-                TASK_FERTILIZING: fertilizing,
+            "last_update_success": self.last_update_success,
+            "tracked_sources": list(self._tracked_sources),
+            "pending_sources": sorted(self.pending_sources),
+            "pending_options": dict(self._pending_options),
+            "active_timers": {
+                "filter": len(self._filter_timers),
+                "options_write": int(bool(self._pending_options)),
             },
-            "env": env,
+            "state_writes": self.state_writes,
+            "moisture_trend": self.moisture_trend.as_dict(),
+            "light": self.light.as_dict(),
         }
+
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh; timed (incl. the entity writes it causes) when instrumented."""
+        if not self.instrumentation.enabled:
+            await super()._async_refresh(*args, **kwargs)
+            return
+        writes = self.state_writes
+        started = time.perf_counter()
+        await super()._async_refresh(*args, **kwargs)
+        entry_id = self.entry.entry_id
+        self.instrumentation.record_refresh(entry_id, time.perf_counter() - started)
+        self.instrumentation.record_refresh_writes(entry_id, self.state_writes - writes)
+
+    async def _async_update_data(self) -> PlantCareData:
+        # Load persisted last_* values (epoch seconds)
+        state = await self.storage.get_entry_state(self.entry.entry_id)
+        config = self.config
+
+        today = dt_util.now().date()
+
+        # --- External env sensors (optional) ---
+        # A recorded watering starts a new drying segment of the moisture trend
+        self.moisture_trend.start_after(state.last_done(TASK_WATERING))
+        env = [self._evaluate_metric(index) for index in range(len(METRICS))]
+        predicted = self._predict_watering()
+
+        # --- Tasks ---
+        # Learned intervals are kept up to date by the storage on every
+        # mark-done event; nothing is derived from the history here
+        tasks = self._compute_tasks(state, today, predicted)
+
+        self._applied_config = config
+        return PlantCareData(
+            plant_name=config.plant_name,
+            task_types=config.tasks,
+            tasks=tasks,
+            env=env,
+            predicted_watering=predicted,
+        )
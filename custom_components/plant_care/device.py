@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+from typing import Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, METRICS
+from .coordinator import MetricResult, TaskComputed
+from .tasks import get_task_definition
 
 
 class PlantCareEntity(CoordinatorEntity):
-    """Base entity for Plant Care entities (subscribes to the coordinator)."""
+    """Base entity for Plant Care entities (subscribes to the coordinator).
+
+    Coordinator updates only write state when something this entity publishes
+    (availability, state, attributes, icon) actually changed, so refreshes
+    that leave a plant unchanged don't produce identical recorder rows.
+    """
+
+    _last_state_key: tuple[Any, ...] | None = None
 
     def __init__(self, entry, coordinator) -> None:
         super().__init__(coordinator)
@@ -23,3 +35,89 @@ class PlantCareEntity(CoordinatorEntity):
             manufacturer="Plant Care",
             model="Plant",
         )
+
+    def _state_key(self) -> tuple[Any, ...]:
+        """Everything a state write would publish for this entity."""
+        available = self.available
+        return (
+            available,
+            self.state,
+            self.extra_state_attributes if available else None,
+            self.icon,
+        )
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        self._last_state_key = self._state_key()
+        self.coordinator.state_writes += 1
+        super().async_write_ha_state()
+
+    @callback
+    def async_write_ha_state_if_changed(self) -> None:
+        if self._state_key() != self._last_state_key:
+            self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self.async_write_ha_state_if_changed()
+
+
+class PlantCareTaskEntity(PlantCareEntity):
+    """Base entity for a single care task (bound to its slot in coordinator data).
+
+    Named and styled from the task's definition (tasks.py). It is only
+    notified when its own task changed; coordinator updates merely carry
+    availability changes.
+    """
+
+    def __init__(self, entry, coordinator, task_type: str) -> None:
+        super().__init__(entry, coordinator)
+        self.task_type = task_type
+        self.definition = get_task_definition(task_type)
+        self._task_index = coordinator.config.tasks.index(task_type)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_task_listener(
+                self._task_index, self.async_write_ha_state_if_changed
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self._last_state_key is None or self.available != self._last_state_key[0]:
+            self.async_write_ha_state()
+
+    @property
+    def task(self) -> TaskComputed | None:
+        """The task's result; None until the coordinator has data."""
+        data = self.coordinator.data
+        return data.tasks[self._task_index] if data is not None else None
+
+
+class PlantCareMetricEntity(PlantCareEntity):
+    """Base entity for a single env metric.
+
+    Besides full coordinator refreshes, it also receives per-metric pushes
+    when the configured source sensor changes state.
+    """
+
+    def __init__(self, entry, coordinator, metric: str) -> None:
+        super().__init__(entry, coordinator)
+        self.metric = metric
+        self._metric_index = METRICS.index(metric)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_metric_listener(
+                self._metric_index, self.async_write_ha_state_if_changed
+            )
+        )
+
+    @property
+    def metric_result(self) -> MetricResult | None:
+        """The metric's result; None until the coordinator has data."""
+        data = self.coordinator.data
+        return data.env[self._metric_index] if data is not None else None
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .instrumentation import async_get_instrumentation
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Diagnostics of one plant, plus the domain-wide runtime counters.
+
+    Timings and state write counts are only collected while instrumentation
+    is enabled (service plant_care.set_instrumentation).
+    """
+    domain_data = hass.data.get(DOMAIN, {})
+    result: dict[str, Any] = {
+        "entry": {
+            "title": entry.title,
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "instrumentation": async_get_instrumentation(hass).as_dict(entry.entry_id),
+    }
+
+    if (entry_data := domain_data.get(entry.entry_id)) is not None:
+        coordinator = entry_data["coordinator"]
+        result["coordinator"] = coordinator.as_diagnostics()
+        result["data"] = asdict(coordinator.data) if coordinator.data else None
+
+    if (storage := domain_data.get("storage")) is not None:
+        result["storage"] = storage.as_diagnostics(entry.entry_id)
+
+    if (scheduler := domain_data.get("scheduler")) is not None:
+        result["scheduler"] = scheduler.as_diagnostics()
+
+    if (sources := domain_data.get("sources")) is not None:
+        result["sources"] = sources.as_diagnostics()
+
+    if (fleet := domain_data.get("fleet")) is not None:
+        result["fleet"] = {
+            "plants_due": len(fleet.due),
+            "plants_out_of_range": len(fleet.out_of_range),
+        }
+
+    return result
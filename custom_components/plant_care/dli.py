@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import math
+from datetime import date, timedelta
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import LIGHT_SMOOTHING_TAU, LUX_TO_PPFD
+
+
+def _day_end(day: date) -> float:
+    """Epoch seconds of the local midnight ending `day`."""
+    return dt_util.start_of_local_day(day + timedelta(days=1)).timestamp()
+
+
+class DailyLightIntegral:
+    """Daily light integral (DLI) of one plant, accumulated from lux readings.
+
+    Every reading integrates the previous level (converted to PPFD) over the
+    time since the previous reading, split at local midnight. Each update is
+    O(1); no history is kept or scanned.
+
+    Alongside, a time-weighted exponential moving average of the illuminance
+    (time constant LIGHT_SMOOTHING_TAU) is kept, so light bounds are not
+    checked against short lux spikes.
+    """
+
+    __slots__ = (
+        "day",
+        "integral",
+        "previous_day",
+        "last_ts",
+        "last_lux",
+        "smoothed_lux",
+    )
+
+    def __init__(self) -> None:
+        self.day: date | None = None
+        self.integral = 0.0  # µmol/m² since the start of `day`
+        self.previous_day: float | None = None  # DLI (mol/m²/d) of the day before
+        self.last_ts: float | None = None
+        self.last_lux: float | None = None  # None => unknown, counts as dark
+        self.smoothed_lux: float | None = None
+
+    @property
+    def dli(self) -> float:
+        """DLI of the current day so far (mol/m²/d)."""
+        return self.integral / 1_000_000
+
+    def _accumulate(self, seconds: float) -> None:
+        if seconds <= 0 or self.last_lux is None:
+            return
+        lux = self.last_lux
+        self.integral += lux * LUX_TO_PPFD * seconds
+        if self.smoothed_lux is not None:
+            decay = math.exp(-seconds / LIGHT_SMOOTHING_TAU)
+            self.smoothed_lux = lux + (self.smoothed_lux - lux) * decay
+
+    def advance(self, ts: float) -> None:
+        """Integrate the last reading up to `ts` (epoch seconds)."""
+        if self.last_ts is None or self.day is None:
+            self.last_ts = ts
+            self.day = dt_util.as_local(dt_util.utc_from_timestamp(ts)).date()
+            return
+        if ts <= self.last_ts:
+            return
+
+        while ts >= (day_end := _day_end(self.day)):
+            self._accumulate(day_end - self.last_ts)
+            self.previous_day = self.dli
+            self.integral = 0.0
+            self.day += timedelta(days=1)
+            self.last_ts = day_end
+        self._accumulate(ts - self.last_ts)
+        self.last_ts = ts
+
+    def update(self, lux: float | None, ts: float) -> float | None:
+        """Feed a reading; returns the smoothed illuminance (None if unavailable)."""
+        self.advance(ts)
+        if lux is not None and lux < 0:
+            lux = 0.0
+        self.last_lux = lux
+        if lux is None:
+            return None
+        if self.smoothed_lux is None:
+            self.smoothed_lux = lux
+        return self.smoothed_lux
+
+    # --- Persistence (restored by the DLI sensor) ---
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "day": self.day.isoformat() if self.day else None,
+            "integral": self.integral,
+            "previous_day": self.previous_day,
+            "last_ts": self.last_ts,
+            "smoothed_lux": self.smoothed_lux,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Continue from a saved state.
+
+        Nothing is integrated for the time Home Assistant was not running;
+        the next reading starts a new interval.
+        """
+        if self.last_ts is not None:
+            return  # already fed with live readings
+        try:
+            day = date.fromisoformat(data["day"]) if data.get("day") else None
+            integral = float(data.get("integral") or 0.0)
+            last_ts = float(data["last_ts"]) if data.get("last_ts") is not None else None
+        except (KeyError, TypeError, ValueError):
+            return
+        self.day = day if last_ts is not None else None
+        self.integral = integral
+        self.last_ts = last_ts
+        self.previous_day = data.get("previous_day")
+        self.smoothed_lux = data.get("smoothed_lux")
+        self.last_lux = None
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import CORE_TASKS, METRICS
+from .tasks import get_task_definition
+
+if TYPE_CHECKING:
+    from .coordinator import PlantCareCoordinator
+
+
+class TaskSchedule(NamedTuple):
+    """When an enabled task of a plant is due next, and how often it recurs."""
+
+    task_type: str
+    next_due_date: date
+    interval_days: int
+    days_overdue: int
+    # Due from next_due_date on; part of the tuple so that reaching the due
+    # date (days_overdue still 0) is a schedule change too
+    is_due: bool
+
+    def summary(self, plant_name: str) -> str:
+        """Title of the task in the calendar and the to-do list."""
+        return f"{get_task_definition(self.task_type).action} {plant_name}"
+
+    @property
+    def overdue_text(self) -> str | None:
+        if not self.days_overdue:
+            return None
+        return f"Overdue by {self.days_overdue} day(s)"
+
+
+# (plant name, schedules of its enabled tasks)
+PlantSchedule = tuple[str, tuple[TaskSchedule, ...]]
+ScheduleListener = Callable[[str, "PlantSchedule | None"], None]
+
+
+class PlantCareFleet:
+    """Domain-wide index of due and out-of-range plants, and of care schedules.
+
+    Every plant reports its own changes (coordinator updates for tasks,
+    per-metric pushes for env metrics); only that plant's entry in the index
+    is re-evaluated, in O(tasks) or O(1). The summary sensors and the
+    calendar read the index instead of scanning every plant's entities.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        # entry_id -> due task types / out-of-range metrics (only non-empty sets)
+        self.due: dict[str, frozenset[str]] = {}
+        self.out_of_range: dict[str, frozenset[str]] = {}
+        self._names: dict[str, str] = {}
+        self._listeners: list[CALLBACK_TYPE] = []
+        # Open async_batch() blocks, and whether a change waits for their end
+        self._batch_depth = 0
+        self._batch_changed = False
+        # entry_id -> care schedule of the plant
+        self.schedules: dict[str, PlantSchedule] = {}
+        self._schedule_listeners: list[ScheduleListener] = []
+
+    @callback
+    def async_register(self, coordinator: PlantCareCoordinator) -> CALLBACK_TYPE:
+        """Add a plant to the index. Returns a callback that removes it again."""
+        entry_id = coordinator.entry.entry_id
+        unsubs = [
+            coordinator.async_add_listener(lambda: self._async_update_plant(coordinator))
+        ]
+        for index, metric in enumerate(METRICS):
+            unsubs.append(
+                coordinator.async_add_metric_listener(
+                    index,
+                    lambda index=index, metric=metric: self._async_update_metric(
+                        coordinator, index, metric
+                    ),
+                )
+            )
+        self._async_update_plant(coordinator)
+
+        @callback
+        def unregister() -> None:
+            for unsub in unsubs:
+                unsub()
+            self._names.pop(entry_id, None)
+            removed = self.due.pop(entry_id, None) is not None
+            removed |= self.out_of_range.pop(entry_id, None) is not None
+            old = self.schedules.pop(entry_id, None)
+            # Last plant gone: the summary sensors become unavailable
+            if removed or (old is not None and not self.schedules):
+                self._async_notify()
+            if old is not None:
+                self._async_notify_schedules(entry_id, old)
+
+        return unregister
+
+    @callback
+    def _async_update_plant(self, coordinator: PlantCareCoordinator) -> None:
+        data = coordinator.data
+        if data is None:
+            return
+        entry_id = coordinator.entry.entry_id
+        renamed = self._names.get(entry_id) != data.plant_name
+        self._names[entry_id] = data.plant_name
+
+        due = frozenset(
+            task_type
+            for task_type, task in zip(data.task_types, data.tasks)
+            if task.is_due
+        )
+        out_of_range = frozenset(
+            metric for metric, result in zip(METRICS, data.env) if result.out_of_range
+        )
+        changed = _set(self.due, entry_id, due)
+        changed |= _set(self.out_of_range, entry_id, out_of_range)
+        if changed or (
+            renamed and (entry_id in self.due or entry_id in self.out_of_range)
+        ):
+            self._async_notify()
+
+        schedule = (
+            data.plant_name,
+            tuple(
+                TaskSchedule(
+                    task_type,
+                    task.next_due_date,
+                    task.interval_days,
+                    task.days_overdue,
+                    task.is_due,
+                )
+                for task_type, task in zip(data.task_types, data.tasks)
+                if task.next_due_date is not None
+            ),
+        )
+        if (old := self.schedules.get(entry_id)) != schedule:
+            self.schedules[entry_id] = schedule
+            if old is None and len(self.schedules) == 1:
+                # First plant: the summary sensors become available
+                self._async_notify()
+            self._async_notify_schedules(entry_id, old)
+
+    @callback
+    def _async_update_metric(
+        self, coordinator: PlantCareCoordinator, index: int, metric: str
+    ) -> None:
+        data = coordinator.data
+        if data is None:
+            return
+        entry_id = coordinator.entry.entry_id
+        current = self.out_of_range.get(entry_id, frozenset())
+        if data.env[index].out_of_range:
+            updated = current | {metric}
+        else:
+            updated = current - {metric}
+        if _set(self.out_of_range, entry_id, updated):
+            self._async_notify()
+
+    @property
+    def has_plants(self) -> bool:
+        """Whether any plant is loaded (the domain-wide entities need one)."""
+        return bool(self.schedules)
+
+    # --- Summary sensors ---
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for index changes. Returns a callback that removes the listener."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @contextmanager
+    def async_batch(self) -> Iterator[None]:
+        """Notify the summary listeners once for all changes within the block."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_changed:
+                self._batch_changed = False
+                self._async_notify()
+
+    @callback
+    def _async_notify(self) -> None:
+        if self._batch_depth:
+            self._batch_changed = True
+            return
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_add_schedule_listener(
+        self, update_callback: ScheduleListener
+    ) -> CALLBACK_TYPE:
+        """Listen for changes of any plant's schedule (calendar).
+
+        Called with the entry_id and its previous schedule (None if new);
+        the current one is in `schedules` (missing if the plant was removed).
+        """
+        self._schedule_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._schedule_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_notify_schedules(self, entry_id: str, old: PlantSchedule | None) -> None:
+        for update_callback in list(self._schedule_listeners):
+            update_callback(entry_id, old)
+
+    def plant_names(self, index: dict[str, frozenset[str]]) -> list[str]:
+        return sorted(self._names.get(entry_id, entry_id) for entry_id in index)
+
+    def task_counts(self) -> dict[str, Any]:
+        """Plants due per task type (core tasks always listed, others once due)."""
+        counts = dict.fromkeys(CORE_TASKS, 0)
+        for tasks in self.due.values():
+            for task_type in tasks:
+                counts[task_type] = counts.get(task_type, 0) + 1
+        return counts
+
+
+def _set(index: dict[str, frozenset[str]], entry_id: str, value: frozenset[str]) -> bool:
+    """Store a plant's set in the index (empty sets are dropped); True if changed."""
+    if index.get(entry_id, frozenset()) == value:
+        return False
+    if value:
+        index[entry_id] = value
+    else:
+        del index[entry_id]
+    return True
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right, insort
+
+from .const import HISTORY_MAX_EVENTS
+
+
+class CareHistory:
+    """Bounded, sorted history of care events for one plant task.
+
+    Events are epoch seconds in a compact `array("q")` (8 bytes per event)
+    instead of a list of ISO strings. Once `maxlen` events are stored the
+    oldest one is dropped, so memory and storage size per plant are fixed.
+    Range queries use binary search.
+    """
+
+    __slots__ = ("_events", "_maxlen")
+
+    def __init__(self, events=(), maxlen: int = HISTORY_MAX_EVENTS) -> None:
+        self._maxlen = maxlen
+        self._events = array("q", sorted(int(ts) for ts in events)[-maxlen:])
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add(self, ts: int) -> None:
+        """Record an event (out-of-order timestamps are inserted in place)."""
+        events = self._events
+        if not events or ts >= events[-1]:
+            events.append(ts)
+        else:
+            insort(events, ts)
+        if len(events) > self._maxlen:
+            del events[0]
+
+    def between(self, start: int | None = None, end: int | None = None) -> list[int]:
+        """Return events with start <= ts <= end (open-ended if None)."""
+        events = self._events
+        lo = 0 if start is None else bisect_left(events, start)
+        hi = len(events) if end is None else bisect_right(events, end)
+        return events[lo:hi].tolist()
+
+    def as_list(self) -> list[int]:
+        """Serializable form for the storage snapshot."""
+        return self._events.tolist()
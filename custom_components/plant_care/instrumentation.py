@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import bisect
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, INSTRUMENTATION_BUCKETS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DurationHistogram:
+    """Fixed-bucket histogram of durations (seconds); O(log buckets) per sample."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        # One count per bucket upper bound, plus one for everything above
+        self.counts = [0] * (len(INSTRUMENTATION_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(INSTRUMENTATION_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        buckets = {
+            f"<={bound * 1000:g}ms": n
+            for bound, n in zip(INSTRUMENTATION_BUCKETS, self.counts)
+        }
+        buckets[f">{INSTRUMENTATION_BUCKETS[-1] * 1000:g}ms"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else None,
+            "max_ms": round(self.max * 1000, 3),
+            "buckets": buckets,
+        }
+
+
+class PlantCareInstrumentation:
+    """Opt-in runtime counters of the integration (shown in the diagnostics).
+
+    Disabled by default; every hook returns after one attribute check then.
+    Enable it with the `plant_care.set_instrumentation` service while
+    investigating a slow Home Assistant, download the diagnostics of any
+    plant, and disable it again.
+
+    Collected while enabled:
+    - refresh duration histograms, per plant and fleet-wide
+    - storage load / journal append / compaction counts and durations
+    - entity state writes caused by each refresh (and by source pushes)
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.reset()
+
+    def reset(self) -> None:
+        self.refresh = DurationHistogram()
+        self.plant_refresh: dict[str, DurationHistogram] = {}
+        # entry_id -> [refreshes, entity state writes caused by them]
+        self.refresh_writes: dict[str, list[int]] = {}
+        # entry_id -> state writes caused by source sensor pushes
+        self.push_writes: dict[str, int] = {}
+        # "load" / "append" / "compact" -> histogram
+        self.storage: dict[str, DurationHistogram] = {}
+
+    @callback
+    def async_set_enabled(self, enabled: bool) -> None:
+        if enabled and not self.enabled:
+            self.reset()
+        self.enabled = enabled
+        _LOGGER.info("Plant Care instrumentation %s", "enabled" if enabled else "disabled")
+
+    def record_refresh(self, entry_id: str, seconds: float) -> None:
+        self.refresh.add(seconds)
+        if (histogram := self.plant_refresh.get(entry_id)) is None:
+            histogram = self.plant_refresh[entry_id] = DurationHistogram()
+        histogram.add(seconds)
+
+    def record_refresh_writes(self, entry_id: str, writes: int) -> None:
+        counts = self.refresh_writes.setdefault(entry_id, [0, 0])
+        counts[0] += 1
+        counts[1] += writes
+
+    def record_push_writes(self, entry_id: str, writes: int) -> None:
+        self.push_writes[entry_id] = self.push_writes.get(entry_id, 0) + writes
+
+    def record_storage(self, operation: str, seconds: float) -> None:
+        if (histogram := self.storage.get(operation)) is None:
+            histogram = self.storage[operation] = DurationHistogram()
+        histogram.add(seconds)
+
+    def as_dict(self, entry_id: str | None = None) -> dict[str, Any]:
+        """Collected values; per-plant values only for `entry_id` (if given)."""
+        result: dict[str, Any] = {
+            "enabled": self.enabled,
+            "refresh": self.refresh.as_dict(),
+            "storage": {
+                operation: histogram.as_dict()
+                for operation, histogram in self.storage.items()
+            },
+            "refresh_state_writes": sum(w for _, w in self.refresh_writes.values()),
+            "push_state_writes": sum(self.push_writes.values()),
+        }
+        if entry_id is not None:
+            refreshes, writes = self.refresh_writes.get(entry_id, (0, 0))
+            histogram = self.plant_refresh.get(entry_id)
+            result["plant"] = {
+                "refresh": histogram.as_dict() if histogram else None,
+                "refreshes": refreshes,
+                "refresh_state_writes": writes,
+                "state_writes_per_refresh": (
+                    round(writes / refreshes, 2) if refreshes else None
+                ),
+                "push_state_writes": self.push_writes.get(entry_id, 0),
+            }
+        return result
+
+
+@callback
+def async_get_instrumentation(hass: HomeAssistant) -> PlantCareInstrumentation:
+    """The domain-wide instrumentation (created on first use)."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (instrumentation := domain_data.get("instrumentation")) is None:
+        instrumentation = domain_data["instrumentation"] = PlantCareInstrumentation()
+    return instrumentation
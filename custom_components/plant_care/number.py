@@ -5,9 +5,6 @@ from homeassistant.helpers.entity import EntityCategory
 
 from .const import (
     DOMAIN,
-    DEFAULT_OPTIONS,
-    OPT_WATERING_INTERVAL_DAYS,
-    OPT_FERTILIZING_INTERVAL_DAYS,
     OPT_MOISTURE_MIN,
     OPT_MOISTURE_MAX,
     OPT_HUMIDITY_MIN,
@@ -18,36 +15,31 @@ from .const import (
     OPT_LIGHT_MAX,
 )
 from .device import PlantCareEntity
+from .tasks import get_task_definition
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     plant_name = entry.data.get("plant_name", "Plant")
 
+    definitions = [get_task_definition(t) for t in coordinator.config.tasks]
+
     async_add_entities(
         [
-            # Intervals
-            PlantCareConfigNumber(
-                entry,
-                coordinator,
-                key=OPT_WATERING_INTERVAL_DAYS,
-                name=f"{plant_name} Watering Interval (days)",
-                unit="d",
-                min_v=0,
-                max_v=60,
-                step=1,
-                icon="mdi:calendar-range",
-            ),
-            PlantCareConfigNumber(
-                entry,
-                coordinator,
-                key=OPT_FERTILIZING_INTERVAL_DAYS,
-                name=f"{plant_name} Fertilizing Interval (days)",
-                unit="d",
-                min_v=0,
-                max_v=365,
-                step=1,
-                icon="mdi:calendar-range",
+            # Intervals, one per task of the plant
+            *(
+                PlantCareConfigNumber(
+                    entry,
+                    coordinator,
+                    key=definition.interval_option,
+                    name=f"{plant_name} {definition.name} Interval (days)",
+                    unit="d",
+                    min_v=0,
+                    max_v=definition.max_interval,
+                    step=1,
+                    icon="mdi:calendar-range",
+                )
+                for definition in definitions
             ),
             # Moisture
             PlantCareConfigNumber(
@@ -175,12 +167,22 @@ class PlantCareConfigNumber(PlantCareEntity, NumberEntity):
         self._attr_native_step = step
         self._attr_icon = icon
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # The value lives in the entry options, not in coordinator data; the
+        # coordinator notifies the numbers of the options that changed
+        self.async_on_remove(
+            self.coordinator.async_add_option_listener(
+                self._key, self.async_write_ha_state_if_changed
+            )
+        )
+
     @property
     def native_value(self) -> float:
-        return float(self.entry.options.get(self._key, DEFAULT_OPTIONS[self._key]))
+        return float(self.coordinator.get_option(self._key))
 
     async def async_set_native_value(self, value: float) -> None:
-        new_options = dict(self.entry.options)
-        new_options[self._key] = value
-        self.hass.config_entries.async_update_entry(self.entry, options=new_options)
-        await self.coordinator.async_refresh()
+        # Rapid edits (of any number of this plant) are coalesced into one
+        # options write and one re-evaluation of what they affect
+        self.coordinator.async_set_option(self._key, value)
+        self.async_write_ha_state()
@@ -6,9 +6,46 @@ from homeassistant import config_entries
 from homeassistant.helpers import selector
 
 from .const import (
+    DEFAULT_OPTIONS,
+    ENV_METRIC_FILTERS,
     OPT_TEMP_ENTITY_ID,
     OPT_HUMIDITY_ENTITY_ID,
     OPT_MOISTURE_ENTITY_ID,
+    OPT_LIGHT_ENTITY_ID,
+    OPT_EXTRA_TASKS,
+    OPT_WATERING_PREDICTIVE,
+)
+from .tasks import (
+    EXTRA_TASK_CHOICES,
+    get_task_definition,
+    parse_task_types,
+    plant_task_types,
+)
+
+_HYSTERESIS_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0, max=100000, step=0.1, mode=selector.NumberSelectorMode.BOX
+    )
+)
+_DWELL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        max=1440,
+        step=1,
+        unit_of_measurement="min",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+
+
+# Built-in extra tasks to pick from; any other name adds a custom task
+_EXTRA_TASKS_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=list(EXTRA_TASK_CHOICES),
+        multiple=True,
+        custom_value=True,
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
 )
 
 
@@ -18,6 +55,13 @@ class PlantCareOptionsFlowHandler(config_entries.OptionsFlow):
         self._config_entry = config_entry
 
     async def async_step_init(self, user_input=None):
+        # Adaptive toggles of the tasks the plant has now (added tasks get
+        # theirs the next time the options are opened)
+        adaptive_keys = [
+            get_task_definition(task_type).adaptive_option
+            for task_type in plant_task_types(self._config_entry.options)
+        ]
+
         if user_input is not None:
             new_options = dict(self._config_entry.options)
 
@@ -29,6 +73,21 @@ class PlantCareOptionsFlowHandler(config_entries.OptionsFlow):
             new_options[OPT_MOISTURE_ENTITY_ID] = (
                 user_input.get(OPT_MOISTURE_ENTITY_ID) or ""
             )
+            new_options[OPT_LIGHT_ENTITY_ID] = user_input.get(OPT_LIGHT_ENTITY_ID) or ""
+            new_options[OPT_WATERING_PREDICTIVE] = bool(
+                user_input.get(OPT_WATERING_PREDICTIVE, False)
+            )
+            for adaptive_key in adaptive_keys:
+                new_options[adaptive_key] = bool(user_input.get(adaptive_key, False))
+            # Added / removed tasks reload the plant (entities are per task)
+            new_options[OPT_EXTRA_TASKS] = list(
+                parse_task_types(user_input.get(OPT_EXTRA_TASKS, []))
+            )
+
+            # Out-of-range filtering (0 = off)
+            for hysteresis_key, dwell_key in ENV_METRIC_FILTERS.values():
+                new_options[hysteresis_key] = user_input.get(hysteresis_key, 0)
+                new_options[dwell_key] = user_input.get(dwell_key, 0)
 
             return self.async_create_entry(title="", data=new_options)
 
@@ -39,6 +98,22 @@ class PlantCareOptionsFlowHandler(config_entries.OptionsFlow):
                 return vol.Optional(opt_key, default=val)
             return vol.Optional(opt_key)
 
+        def _filter_opt(opt_key: str):
+            val = self._config_entry.options.get(opt_key, DEFAULT_OPTIONS[opt_key])
+            return vol.Optional(opt_key, default=val)
+
+        options = self._config_entry.options
+        adaptive = {
+            vol.Optional(
+                adaptive_key, default=bool(options.get(adaptive_key, False))
+            ): selector.BooleanSelector()
+            for adaptive_key in adaptive_keys
+        }
+        filters = {}
+        for hysteresis_key, dwell_key in ENV_METRIC_FILTERS.values():
+            filters[_filter_opt(hysteresis_key)] = _HYSTERESIS_SELECTOR
+            filters[_filter_opt(dwell_key)] = _DWELL_SELECTOR
+
         schema = vol.Schema(
             {
                 _opt_with_default(OPT_TEMP_ENTITY_ID): selector.EntitySelector(
@@ -50,6 +125,19 @@ class PlantCareOptionsFlowHandler(config_entries.OptionsFlow):
                 _opt_with_default(OPT_MOISTURE_ENTITY_ID): selector.EntitySelector(
                     selector.EntitySelectorConfig(domain="sensor")
                 ),
+                _opt_with_default(OPT_LIGHT_ENTITY_ID): selector.EntitySelector(
+                    selector.EntitySelectorConfig(domain="sensor")
+                ),
+                vol.Optional(
+                    OPT_WATERING_PREDICTIVE,
+                    default=bool(options.get(OPT_WATERING_PREDICTIVE, False)),
+                ): selector.BooleanSelector(),
+                vol.Optional(
+                    OPT_EXTRA_TASKS,
+                    default=list(parse_task_types(options.get(OPT_EXTRA_TASKS))),
+                ): _EXTRA_TASKS_SELECTOR,
+                **adaptive,
+                **filters,
             }
         )
 
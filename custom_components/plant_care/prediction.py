@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import Any
+
+from .const import (
+    PREDICTION_MIN_SAMPLES,
+    PREDICTION_MIN_SPAN,
+    PREDICTION_RISE_RESET,
+)
+
+
+class MoistureTrend:
+    """Linear fit of soil moisture over time since the last watering.
+
+    Keeps only the running least-squares sums (n, Σt, Σy, Σt², Σty) of the
+    current drying segment, so adding a reading and predicting are O(1).
+    A rise of PREDICTION_RISE_RESET points or more starts a new segment
+    (the plant was watered).
+
+    Times are hours relative to the first reading of the segment to keep
+    the sums well conditioned.
+    """
+
+    __slots__ = ("t0", "last_ts", "last_value", "n", "st", "sy", "stt", "sty")
+
+    def __init__(self) -> None:
+        self.t0: float | None = None  # epoch seconds of the segment start
+        self.last_ts: float | None = None
+        self.last_value: float | None = None
+        self.reset()
+
+    def reset(self) -> None:
+        self.t0 = None
+        self.n = 0
+        self.st = self.sy = self.stt = self.sty = 0.0
+
+    def start_after(self, ts: float | None) -> None:
+        """Drop a segment that began before a (manually recorded) watering."""
+        if ts is not None and self.t0 is not None and self.t0 < ts:
+            self.reset()
+
+    def add(self, value: float, ts: float) -> None:
+        """Add a reading (epoch seconds); repeated timestamps are ignored."""
+        if self.last_ts is not None and ts <= self.last_ts:
+            return
+        if self.last_value is not None and value - self.last_value >= PREDICTION_RISE_RESET:
+            self.reset()
+        self.last_ts = ts
+        self.last_value = value
+
+        if self.t0 is None:
+            self.t0 = ts
+        t = (ts - self.t0) / 3600
+        self.n += 1
+        self.st += t
+        self.sy += value
+        self.stt += t * t
+        self.sty += t * value
+
+    @property
+    def slope(self) -> float | None:
+        """Fitted change per hour, or None if there is not enough data."""
+        if self.n < PREDICTION_MIN_SAMPLES or self.last_ts is None or self.t0 is None:
+            return None
+        if (self.last_ts - self.t0) < PREDICTION_MIN_SPAN:
+            return None
+        denom = self.n * self.stt - self.st * self.st
+        if denom <= 0:
+            return None
+        return (self.n * self.sty - self.st * self.sy) / denom
+
+    def predict_crossing(self, threshold: float) -> float | None:
+        """Epoch seconds at which the fit crosses `threshold` going down.
+
+        None if moisture isn't falling (or there is not enough data yet).
+        Already below the threshold -> the time of the last reading.
+        """
+        slope = self.slope
+        if slope is None or slope >= 0:
+            return None
+        intercept = (self.sy - slope * self.st) / self.n
+        hours = (threshold - intercept) / slope
+        return max(self.t0 + hours * 3600, self.last_ts)
+
+    # --- Persistence (restored by the prediction sensor) ---
+
+    def as_dict(self) -> dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def restore(self, data: dict[str, Any]) -> None:
+        if self.last_ts is not None:
+            return  # already fed with live readings
+        try:
+            values = {slot: data[slot] for slot in self.__slots__}
+            values["n"] = int(values["n"])
+        except (KeyError, TypeError, ValueError):
+            return
+        for slot, value in values.items():
+            setattr(self, slot, value)
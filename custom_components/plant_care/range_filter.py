@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+
+class OutOfRangeFilter:
+    """Debounced out-of-range state of one env metric.
+
+    Fed incrementally with every new reading of the source sensor:
+    - hysteresis: once out of range, the value has to come back inside the
+      bounds by `hysteresis` before the metric counts as in range again
+    - min_dwell: a change of the out-of-range state only takes effect after
+      it has held for `min_dwell` seconds
+
+    A sensor jittering around a bound therefore causes one transition
+    instead of one per reading. An unavailable reading is no reading: the
+    committed state and a pending change are kept, so a short outage neither
+    skips the dwell time nor resets it.
+    """
+
+    __slots__ = ("hysteresis", "min_dwell", "state", "_pending_since")
+
+    def __init__(self, hysteresis: float = 0.0, min_dwell: float = 0.0) -> None:
+        self.hysteresis = hysteresis
+        self.min_dwell = min_dwell
+        self.state: bool | None = None  # None => no reading yet
+        self._pending_since: float | None = None
+
+    def reset(self) -> None:
+        """Forget the state (e.g. when the metric's source sensor changed)."""
+        self.state = None
+        self._pending_since = None
+
+    def _target(self, value: float, min_v: float, max_v: float) -> bool:
+        if value < min_v or value > max_v:
+            return True
+        if self.state and self.hysteresis > 0:
+            # Stay out of range until the value is back inside by the band
+            return value < min_v + self.hysteresis or value > max_v - self.hysteresis
+        return False
+
+    def update(
+        self, value: float | None, min_v: float, max_v: float, now: float
+    ) -> float | None:
+        """Feed a reading (epoch seconds `now`).
+
+        Returns the seconds until a pending state change may take effect, or
+        None if nothing is pending.
+        """
+        if value is None:
+            # Nothing to check a pending change against until the next reading
+            return None
+
+        target = self._target(value, min_v, max_v)
+        if self.state is None or target == self.state:
+            self.state = target
+            self._pending_since = None
+            return None
+
+        if self._pending_since is None:
+            self._pending_since = now
+        remaining = self._pending_since + self.min_dwell - now
+        if remaining <= 0:
+            self.state = target
+            self._pending_since = None
+            return None
+        return remaining
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_track_point_in_time,
+    async_track_time_change,
+)
+from homeassistant.util import dt as dt_util
+
+from .const import SCHEDULER_BATCH_DELAY, SCHEDULER_BATCH_SIZE, SCHEDULER_RETRY_DELAY
+
+if TYPE_CHECKING:
+    from .coordinator import PlantCareCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PlantCareScheduler:
+    """Domain-wide scheduler shared by all plants.
+
+    Owns the timers that used to exist once per config entry: a single
+    point-in-time wakeup for the earliest task due-state transition, and one
+    local midnight callback closing the day of every plant's DLI.
+
+    Transitions of every plant/task are kept in a min-heap keyed by the local
+    midnight on which they happen. Only the plants whose transition is reached
+    get refreshed; plants that are not due cost nothing in between.
+
+    Each pass evaluates its plants in small batches so hundreds of plants
+    don't flood the event loop in the same second. A plant whose refresh
+    fails stays scheduled: it is retried SCHEDULER_RETRY_DELAY seconds later.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._coordinators: dict[str, PlantCareCoordinator] = {}
+
+        # (entry_id, task_type) -> next transition; the heap may hold stale
+        # items, only those matching this dict are valid (lazy deletion)
+        self._due_times: dict[tuple[str, str], datetime] = {}
+        self._due_heap: list[tuple[datetime, str, str]] = []
+        self._unsub_wakeup: CALLBACK_TYPE | None = None
+        self._wakeup_at: datetime | None = None
+        self._unsub_midnight: CALLBACK_TYPE | None = None
+
+        # Counters for the diagnostics
+        self.timers_armed = 0
+        self.wakeups = 0
+        self.passes = 0
+        self.plants_refreshed = 0
+
+    @callback
+    def async_register(self, coordinator: PlantCareCoordinator) -> CALLBACK_TYPE:
+        """Add a plant to the scheduler. Returns a callback that removes it again."""
+        entry_id = coordinator.entry.entry_id
+        self._coordinators[entry_id] = coordinator
+        if self._unsub_midnight is None:
+            self._unsub_midnight = async_track_time_change(
+                self.hass, self._async_midnight, hour=0, minute=0, second=0
+            )
+            self.timers_armed += 1
+
+        # Re-index due transitions whenever the plant's data was refreshed
+        unsub_listener = coordinator.async_add_listener(
+            lambda: self._async_update_transitions(coordinator)
+        )
+        self._async_update_transitions(coordinator)
+
+        @callback
+        def unregister() -> None:
+            unsub_listener()
+            self._coordinators.pop(entry_id, None)
+            for key in [key for key in self._due_times if key[0] == entry_id]:
+                del self._due_times[key]
+
+            if self._coordinators:
+                self._async_arm_wakeup()
+            else:
+                self._async_cancel_timers()
+
+        return unregister
+
+    @callback
+    def _async_cancel_timers(self) -> None:
+        if self._unsub_wakeup is not None:
+            self._unsub_wakeup()
+            self._unsub_wakeup = None
+            self._wakeup_at = None
+        if self._unsub_midnight is not None:
+            self._unsub_midnight()
+            self._unsub_midnight = None
+        self._due_heap.clear()
+
+    @callback
+    def _async_midnight(self, now: datetime) -> None:
+        for coordinator in list(self._coordinators.values()):
+            coordinator.async_start_of_day(now)
+
+    # --- Due-date priority queue ---
+
+    @callback
+    def _async_update_transitions(self, coordinator: PlantCareCoordinator) -> None:
+        """Push the next transition of each task of a plant onto the heap."""
+        data = coordinator.data
+        if not data:
+            return
+
+        entry_id = coordinator.entry.entry_id
+        changed = False
+        for task_type, task in zip(data.task_types, data.tasks):
+            key = (entry_id, task_type)
+            change_date = task.next_change_date()
+            when = dt_util.start_of_local_day(change_date) if change_date else None
+            if self._due_times.get(key) == when:
+                continue
+
+            changed = True
+            if when is None:
+                self._due_times.pop(key, None)
+                continue
+            self._due_times[key] = when
+            heapq.heappush(self._due_heap, (when, entry_id, task_type))
+
+        if not changed:
+            return
+
+        # Drop stale items once they dominate the heap
+        if len(self._due_heap) > 2 * len(self._due_times) + 64:
+            self._due_heap = [
+                (when, entry_id, task_type)
+                for (entry_id, task_type), when in self._due_times.items()
+            ]
+            heapq.heapify(self._due_heap)
+
+        self._async_arm_wakeup()
+
+    @callback
+    def _async_arm_wakeup(self) -> None:
+        """Schedule one wakeup for the earliest valid transition."""
+        heap = self._due_heap
+        while heap and self._due_times.get((heap[0][1], heap[0][2])) != heap[0][0]:
+            heapq.heappop(heap)
+
+        when = heap[0][0] if heap else None
+        if when == self._wakeup_at:
+            return
+
+        if self._unsub_wakeup is not None:
+            self._unsub_wakeup()
+            self._unsub_wakeup = None
+        self._wakeup_at = when
+        if when is not None:
+            self._unsub_wakeup = async_track_point_in_time(
+                self.hass, self._async_wakeup, when
+            )
+            self.timers_armed += 1
+
+    @callback
+    def _async_wakeup(self, now: datetime) -> None:
+        self._unsub_wakeup = None
+        self._wakeup_at = None
+        self.wakeups += 1
+
+        entry_ids: set[str] = set()
+        heap = self._due_heap
+        while heap and heap[0][0] <= now:
+            when, entry_id, task_type = heapq.heappop(heap)
+            key = (entry_id, task_type)
+            if self._due_times.get(key) == when:
+                del self._due_times[key]
+                entry_ids.add(entry_id)
+
+        self.async_schedule_pass(entry_ids)
+        self._async_arm_wakeup()
+
+    # --- Batched refresh passes ---
+
+    @callback
+    def async_schedule_pass(self, entry_ids: Iterable[str]) -> None:
+        """Refresh the given plants in one batched pass (runs in the background)."""
+        entry_ids = list(entry_ids)
+        if not entry_ids:
+            return
+        self.hass.async_create_background_task(
+            self.async_refresh(entry_ids), "plant_care scheduler pass"
+        )
+
+    async def async_refresh(self, entry_ids: Iterable[str]) -> None:
+        """Refresh plants in batches, yielding to the event loop in between."""
+        entry_ids = list(entry_ids)
+        _LOGGER.debug("Refreshing %d plant(s)", len(entry_ids))
+        self.passes += 1
+        self.plants_refreshed += len(entry_ids)
+
+        for start in range(0, len(entry_ids), SCHEDULER_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(SCHEDULER_BATCH_DELAY)
+
+            # Plants may have been unloaded while we were waiting
+            batch = [
+                coordinator
+                for entry_id in entry_ids[start : start + SCHEDULER_BATCH_SIZE]
+                if (coordinator := self._coordinators.get(entry_id)) is not None
+            ]
+            results = await asyncio.gather(
+                *(c.async_refresh() for c in batch), return_exceptions=True
+            )
+
+            # Listeners are not notified when nothing changed; make sure every
+            # refreshed plant is back in the heap either way
+            for coordinator, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    _LOGGER.error(
+                        "Error refreshing %s", coordinator.name, exc_info=result
+                    )
+                elif coordinator.last_update_success:
+                    self._async_update_transitions(coordinator)
+                    continue
+                self._async_schedule_retry(coordinator)
+
+    @callback
+    def _async_schedule_retry(self, coordinator: PlantCareCoordinator) -> None:
+        """Wake a plant whose refresh failed again after SCHEDULER_RETRY_DELAY."""
+        entry_id = coordinator.entry.entry_id
+        if self._coordinators.get(entry_id) is not coordinator:
+            return  # unloaded meanwhile
+        when = dt_util.utcnow() + timedelta(seconds=SCHEDULER_RETRY_DELAY)
+        for task_type in coordinator.config.tasks:
+            key = (entry_id, task_type)
+            if (due := self._due_times.get(key)) is not None and due <= when:
+                continue
+            self._due_times[key] = when
+            heapq.heappush(self._due_heap, (when, entry_id, task_type))
+        self._async_arm_wakeup()
+
+    # --- Diagnostics ---
+
+    def as_diagnostics(self) -> dict[str, Any]:
+        return {
+            "plants": len(self._coordinators),
+            "active_timers": int(self._unsub_wakeup is not None)
+            + int(self._unsub_midnight is not None),
+            "next_wakeup": self._wakeup_at.isoformat() if self._wakeup_at else None,
+            "transitions": len(self._due_times),
+            "heap_size": len(self._due_heap),
+            "timers_armed": self.timers_armed,
+            "wakeups": self.wakeups,
+            "passes": self.passes,
+            "plants_refreshed": self.plants_refreshed,
+        }
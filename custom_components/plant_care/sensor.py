@@ -1,40 +1,43 @@
 from __future__ import annotations
 
-from typing import Any
+from datetime import datetime
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.const import EntityCategory
+from homeassistant.helpers.restore_state import RestoredExtraData, RestoreEntity
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
-    TASK_WATERING,
-    TASK_FERTILIZING,
     OPT_TEMP_ENTITY_ID,
     OPT_HUMIDITY_ENTITY_ID,
     OPT_MOISTURE_ENTITY_ID,
+    OPT_LIGHT_ENTITY_ID,
 )
-from .device import PlantCareEntity
+from .device import PlantCareMetricEntity, PlantCareTaskEntity
+from .fleet import PlantCareFleet
 
 
-def _get_task(data: dict[str, Any] | None, task_type: str):
-    """Safely fetch a task from coordinator data (data may be None during startup)."""
-    if not data:
-        return None
-    tasks = data.get("tasks")
-    if not isinstance(tasks, dict):
-        return None
-    return tasks.get(task_type)
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
+    """Domain-wide fleet summary sensors (loaded by discovery from async_setup)."""
+    if discovery_info is None:
+        return
+    fleet: PlantCareFleet = hass.data[DOMAIN]["fleet"]
+    async_add_entities(
+        [PlantCareFleetDueSensor(fleet), PlantCareFleetOutOfRangeSensor(fleet)]
+    )
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     async_add_entities(
         [
-            # Task sensors
-            PlantCareLastDoneSensor(entry, coordinator, TASK_WATERING),
-            PlantCareNextDueDateSensor(entry, coordinator, TASK_WATERING),
-            PlantCareLastDoneSensor(entry, coordinator, TASK_FERTILIZING),
-            PlantCareNextDueDateSensor(entry, coordinator, TASK_FERTILIZING),
+            # Task sensors, for each task of the plant
+            *(
+                sensor(entry, coordinator, task_type)
+                for task_type in coordinator.config.tasks
+                for sensor in (PlantCareLastDoneSensor, PlantCareNextDueDateSensor)
+            ),
             # Env deviation sensors (disabled-by-default if no external sensor configured)
             PlantCareEnvDeviationSensor(
                 entry, coordinator, "temperature", unit="°C", icon="mdi:thermometer"
@@ -45,73 +48,65 @@ async def async_setup_entry(hass, entry, async_add_entities):
             PlantCareEnvDeviationSensor(
                 entry, coordinator, "moisture", unit="%", icon="mdi:flower"
             ),
+            PlantCareEnvDeviationSensor(
+                entry, coordinator, "light", unit="lx", icon="mdi:white-balance-sunny"
+            ),
+            # Daily light integral (disabled-by-default if no light sensor configured)
+            PlantCareDailyLightIntegralSensor(entry, coordinator),
+            # Moisture trend (disabled-by-default if no moisture sensor configured)
+            PlantCareWateringPredictionSensor(entry, coordinator),
         ]
     )
 
 
-class PlantCareLastDoneSensor(PlantCareEntity, SensorEntity):
+class PlantCareLastDoneSensor(PlantCareTaskEntity, SensorEntity):
     _attr_device_class = "timestamp"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(self, entry, coordinator, task_type: str):
-        super().__init__(entry, coordinator)
-        self.task_type = task_type
+        super().__init__(entry, coordinator, task_type)
         plant_id = entry.data.get("plant_id", entry.entry_id)
         plant_name = entry.data.get("plant_name", "Plant")
 
-        if task_type == TASK_WATERING:
-            self._attr_name = f"{plant_name} Watering Last"
-            self._attr_unique_id = f"{plant_id}_watering_last"
-            self._attr_suggested_object_id = f"{plant_id}_watering_last"
-            self._attr_icon = "mdi:watering-can-outline"
-        else:
-            self._attr_name = f"{plant_name} Fertilizing Last"
-            self._attr_unique_id = f"{plant_id}_fertilizing_last"
-            self._attr_suggested_object_id = f"{plant_id}_fertilizing_last"
-            self._attr_icon = "mdi:bottle-tonic-outline"
+        self._attr_name = f"{plant_name} {self.definition.name} Last"
+        self._attr_unique_id = f"{plant_id}_{task_type}_last"
+        self._attr_suggested_object_id = f"{plant_id}_{task_type}_last"
+        self._attr_icon = self.definition.icon
 
     @property
     def native_value(self):
-        task = _get_task(self.coordinator.data, self.task_type)
+        task = self.task
         if task is None:
             return None  # unknown until coordinator has data
 
         # Expecting a datetime (device_class timestamp)
-        return getattr(task, "last_done", None)
+        return task.last_done
 
 
-class PlantCareNextDueDateSensor(PlantCareEntity, SensorEntity):
+class PlantCareNextDueDateSensor(PlantCareTaskEntity, SensorEntity):
     # We'll expose as date string YYYY-MM-DD (simple & stable)
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(self, entry, coordinator, task_type: str):
-        super().__init__(entry, coordinator)
-        self.task_type = task_type
+        super().__init__(entry, coordinator, task_type)
         plant_id = entry.data.get("plant_id", entry.entry_id)
         plant_name = entry.data.get("plant_name", "Plant")
 
-        if task_type == TASK_WATERING:
-            self._attr_name = f"{plant_name} Watering Next"
-            self._attr_unique_id = f"{plant_id}_watering_next"
-            self._attr_suggested_object_id = f"{plant_id}_watering_next"
-            self._attr_icon = "mdi:calendar"
-        else:
-            self._attr_name = f"{plant_name} Fertilizing Next"
-            self._attr_unique_id = f"{plant_id}_fertilizing_next"
-            self._attr_suggested_object_id = f"{plant_id}_fertilizing_next"
-            self._attr_icon = "mdi:calendar"
+        self._attr_name = f"{plant_name} {self.definition.name} Next"
+        self._attr_unique_id = f"{plant_id}_{task_type}_next"
+        self._attr_suggested_object_id = f"{plant_id}_{task_type}_next"
+        self._attr_icon = "mdi:calendar"
 
     @property
     def native_value(self):
-        task = _get_task(self.coordinator.data, self.task_type)
-        if task is None:
-            return None  # unknown until coordinator has data
+        task = self.task
+        if task is None or task.next_due_date is None:
+            return None  # unknown until coordinator has data / disabled
 
-        next_due = getattr(task, "next_due_date", None)
-        return next_due.isoformat() if next_due else None
+        return task.next_due_date.isoformat()
 
 
-class PlantCareEnvDeviationSensor(PlantCareEntity, SensorEntity):
+class PlantCareEnvDeviationSensor(PlantCareMetricEntity, SensorEntity):
     """Shows how far the external sensor value is outside the configured bounds.
 
     - 0.0: within bounds
@@ -126,8 +121,7 @@ class PlantCareEnvDeviationSensor(PlantCareEntity, SensorEntity):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(self, entry, coordinator, metric: str, *, unit: str, icon: str):
-        super().__init__(entry, coordinator)
-        self.metric = metric
+        super().__init__(entry, coordinator, metric)
 
         plant_id = entry.data.get("plant_id", entry.entry_id)
         plant_name = entry.data.get("plant_name", "Plant")
@@ -136,6 +130,7 @@ class PlantCareEnvDeviationSensor(PlantCareEntity, SensorEntity):
             "temperature": "Temperature",
             "humidity": "Humidity",
             "moisture": "Moisture",
+            "light": "Light",
         }[metric]
 
         self._attr_name = f"{plant_name} {pretty} Deviation"
@@ -149,29 +144,213 @@ class PlantCareEnvDeviationSensor(PlantCareEntity, SensorEntity):
             "temperature": OPT_TEMP_ENTITY_ID,
             "humidity": OPT_HUMIDITY_ENTITY_ID,
             "moisture": OPT_MOISTURE_ENTITY_ID,
+            "light": OPT_LIGHT_ENTITY_ID,
         }[metric]
         is_configured = bool((entry.options.get(opt_key) or "").strip())
         self._attr_entity_registry_enabled_default = is_configured
 
-    def _metric_data(self) -> dict:
-        data = (self.coordinator.data or {}).get("env", {})
-        return data.get(self.metric, {})
-
     @property
     def available(self) -> bool:
         # deviation == None means unavailable (no configured sensor / invalid value)
-        dev = self._metric_data().get("deviation")
-        return dev is not None
+        m = self.metric_result
+        return m is not None and m.deviation is not None
+
+    @property
+    def native_value(self):
+        m = self.metric_result
+        return m.deviation if m is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        m = self.metric_result
+        if m is None:
+            return {}
+        return {
+            "value": m.value,
+            "min": m.min,
+            "max": m.max,
+        }
+
+
+class PlantCareDailyLightIntegralSensor(
+    PlantCareMetricEntity, RestoreEntity, SensorEntity
+):
+    """Daily light integral (mol/m²/d) accumulated from the light source sensor.
+
+    Updated with every light reading and reset at local midnight (by the
+    domain scheduler, even if the light sensor doesn't report then). The
+    accumulator survives restarts through the restore state.
+    """
+
+    _attr_native_unit_of_measurement = "mol/(m²·d)"
+    _attr_state_class = SensorStateClass.TOTAL
+    _attr_suggested_display_precision = 2
+    _attr_icon = "mdi:sun-clock"
+
+    def __init__(self, entry, coordinator):
+        super().__init__(entry, coordinator, "light")
+
+        plant_id = entry.data.get("plant_id", entry.entry_id)
+        plant_name = entry.data.get("plant_name", "Plant")
+
+        self._attr_name = f"{plant_name} Daily Light Integral"
+        self._attr_unique_id = f"{plant_id}_light_dli"
+        self._attr_suggested_object_id = f"{plant_id}_light_dli"
+
+        is_configured = bool((entry.options.get(OPT_LIGHT_ENTITY_ID) or "").strip())
+        self._attr_entity_registry_enabled_default = is_configured
+
+    async def async_added_to_hass(self) -> None:
+        if (last := await self.async_get_last_extra_data()) is not None:
+            self.coordinator.light.restore(last.as_dict())
+        await super().async_added_to_hass()
+
+    @property
+    def extra_restore_state_data(self) -> RestoredExtraData:
+        return RestoredExtraData(self.coordinator.light.as_dict())
+
+    @property
+    def available(self) -> bool:
+        # Unavailable until the source reported a value (e.g. after a restart)
+        return bool(
+            self.coordinator.get_source_entity("light")
+        ) and not self.coordinator.is_source_pending("light")
+
+    @property
+    def native_value(self) -> float:
+        return round(self.coordinator.light.dli, 3)
+
+    @property
+    def last_reset(self) -> datetime | None:
+        day = self.coordinator.light.day
+        return dt_util.start_of_local_day(day) if day else None
+
+    @property
+    def extra_state_attributes(self):
+        light = self.coordinator.light
+        return {
+            "previous_day": round(light.previous_day, 3)
+            if light.previous_day is not None
+            else None,
+            "smoothed_lux": round(light.smoothed_lux)
+            if light.smoothed_lux is not None
+            else None,
+        }
+
+
+class PlantCareWateringPredictionSensor(
+    PlantCareMetricEntity, RestoreEntity, SensorEntity
+):
+    """Day the soil moisture is expected to fall below moisture_min.
+
+    Projected from a running linear fit of the moisture readings since the
+    last watering (prediction.py). Unknown while moisture isn't falling or
+    there are too few readings. The fit survives restarts through the
+    restore state.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:water-alert-outline"
+
+    def __init__(self, entry, coordinator):
+        super().__init__(entry, coordinator, "moisture")
+
+        plant_id = entry.data.get("plant_id", entry.entry_id)
+        plant_name = entry.data.get("plant_name", "Plant")
+
+        self._attr_name = f"{plant_name} Watering Predicted"
+        self._attr_unique_id = f"{plant_id}_watering_predicted"
+        self._attr_suggested_object_id = f"{plant_id}_watering_predicted"
+
+        is_configured = bool((entry.options.get(OPT_MOISTURE_ENTITY_ID) or "").strip())
+        self._attr_entity_registry_enabled_default = is_configured
+
+    async def async_added_to_hass(self) -> None:
+        if (last := await self.async_get_last_extra_data()) is not None:
+            self.coordinator.moisture_trend.restore(last.as_dict())
+        await super().async_added_to_hass()
+
+    @property
+    def extra_restore_state_data(self) -> RestoredExtraData:
+        return RestoredExtraData(self.coordinator.moisture_trend.as_dict())
+
+    @property
+    def available(self) -> bool:
+        # Unavailable until the source reported a value (e.g. after a restart)
+        return bool(
+            self.coordinator.get_source_entity("moisture")
+        ) and not self.coordinator.is_source_pending("moisture")
 
     @property
     def native_value(self):
-        return self._metric_data().get("deviation")
+        data = self.coordinator.data
+        if data is None or data.predicted_watering is None:
+            return None
+        return data.predicted_watering.isoformat()
 
     @property
     def extra_state_attributes(self):
-        m = self._metric_data()
+        slope = self.coordinator.moisture_trend.slope
         return {
-            "value": m.get("value"),
-            "min": m.get("min"),
-            "max": m.get("max"),
+            # Fitted drying rate in points per day (negative = drying)
+            "drying_rate": round(slope * 24, 1) if slope is not None else None,
         }
+
+
+class PlantCareFleetSensor(SensorEntity):
+    """Base for the domain-wide summary sensors (read from the fleet index)."""
+
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "plants"
+
+    def __init__(self, fleet: PlantCareFleet, key: str, name: str) -> None:
+        self.fleet = fleet
+        self._attr_name = name
+        self._attr_unique_id = f"{DOMAIN}_{key}"
+        self._attr_suggested_object_id = f"{DOMAIN}_{key}"
+
+    @property
+    def available(self) -> bool:
+        return self.fleet.has_plants
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self.fleet.async_add_listener(self.async_write_ha_state))
+
+
+class PlantCareFleetDueSensor(PlantCareFleetSensor):
+    """Number of plants with at least one due task; the plants as attribute."""
+
+    _attr_icon = "mdi:watering-can"
+
+    def __init__(self, fleet: PlantCareFleet) -> None:
+        super().__init__(fleet, "plants_due", "Plant Care Plants Due")
+
+    @property
+    def native_value(self) -> int:
+        return len(self.fleet.due)
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            "plants": self.fleet.plant_names(self.fleet.due),
+            **self.fleet.task_counts(),
+        }
+
+
+class PlantCareFleetOutOfRangeSensor(PlantCareFleetSensor):
+    """Number of plants with at least one env metric out of range."""
+
+    _attr_icon = "mdi:alert-outline"
+
+    def __init__(self, fleet: PlantCareFleet) -> None:
+        super().__init__(fleet, "plants_out_of_range", "Plant Care Plants Out Of Range")
+
+    @property
+    def native_value(self) -> int:
+        return len(self.fleet.out_of_range)
+
+    @property
+    def extra_state_attributes(self):
+        return {"plants": self.fleet.plant_names(self.fleet.out_of_range)}
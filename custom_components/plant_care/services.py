@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_DEVICE_ID, ATTR_ENTITY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .bulk import async_export_plants, async_import_plants
+from .const import CONF_PLANT_ID, CONF_PLANT_NAME, DOMAIN
+from .instrumentation import async_get_instrumentation
+from .scheduler import PlantCareScheduler
+from .storage import PlantCareStorage
+from .tasks import plant_task_types
+
+SERVICE_GET_HISTORY = "get_history"
+SERVICE_MARK_DONE = "mark_done"
+SERVICE_IMPORT_PLANTS = "import_plants"
+SERVICE_EXPORT_PLANTS = "export_plants"
+SERVICE_SET_INSTRUMENTATION = "set_instrumentation"
+
+ATTR_TASK = "task"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_TIMESTAMP = "timestamp"
+ATTR_PATH = "path"
+ATTR_ENABLED = "enabled"
+
+# Plants can be targeted by device or by any of their entities; no target = all plants
+_TARGET_SCHEMA = {
+    vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+}
+
+GET_HISTORY_SCHEMA = vol.Schema(
+    {
+        **_TARGET_SCHEMA,
+        vol.Optional(ATTR_TASK): cv.slug,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+    }
+)
+
+MARK_DONE_SCHEMA = vol.Schema(
+    {
+        **_TARGET_SCHEMA,
+        vol.Required(ATTR_TASK): cv.slug,
+        vol.Optional(ATTR_TIMESTAMP): cv.datetime,
+    }
+)
+
+# Paths are relative to the config directory (CSV if *.csv, JSON otherwise)
+FILE_SCHEMA = vol.Schema({vol.Required(ATTR_PATH): cv.string})
+
+SET_INSTRUMENTATION_SCHEMA = vol.Schema({vol.Required(ATTR_ENABLED): cv.boolean})
+
+
+@callback
+def async_resolve_entries(hass: HomeAssistant, call: ServiceCall) -> list[ConfigEntry]:
+    """Return the loaded plant entries targeted by a service call."""
+    loaded = {
+        entry.entry_id: entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id in hass.data.get(DOMAIN, {})
+    }
+
+    device_ids = call.data.get(ATTR_DEVICE_ID) or []
+    entity_ids = call.data.get(ATTR_ENTITY_ID) or []
+    if not device_ids and not entity_ids:
+        return list(loaded.values())
+
+    entry_ids: set[str] = set()
+    dev_reg = dr.async_get(hass)
+    for device_id in device_ids:
+        if (device := dev_reg.async_get(device_id)) is not None:
+            entry_ids.update(device.config_entries)
+
+    ent_reg = er.async_get(hass)
+    for entity_id in entity_ids:
+        if (entity := ent_reg.async_get(entity_id)) is not None and entity.config_entry_id:
+            entry_ids.add(entity.config_entry_id)
+
+    return [loaded[entry_id] for entry_id in entry_ids if entry_id in loaded]
+
+
+def _as_timestamp(value) -> int | None:
+    if value is None:
+        return None
+    # Naive datetimes from the UI are local time
+    return int(dt_util.as_local(value).timestamp())
+
+
+async def async_mark_done(
+    hass: HomeAssistant, entry_ids: list[str], task_type: str, ts: int
+) -> None:
+    """Record a care task as done for plants: one storage transaction, one refresh pass."""
+    storage: PlantCareStorage = hass.data[DOMAIN]["storage"]
+    scheduler: PlantCareScheduler = hass.data[DOMAIN]["scheduler"]
+    await storage.set_last_done_many(entry_ids, task_type, ts)
+    await scheduler.async_refresh(entry_ids)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the plant_care services (once per domain)."""
+
+    async def _async_get_history(call: ServiceCall) -> ServiceResponse:
+        storage: PlantCareStorage | None = hass.data.get(DOMAIN, {}).get("storage")
+        if storage is None:
+            return {"plants": {}}
+
+        start = _as_timestamp(call.data.get(ATTR_START))
+        end = _as_timestamp(call.data.get(ATTR_END))
+
+        plants: dict[str, Any] = {}
+        for entry in async_resolve_entries(hass, call):
+            plant_id = entry.data.get(CONF_PLANT_ID, entry.entry_id)
+            result: dict[str, Any] = {"name": entry.data.get(CONF_PLANT_NAME, "Plant")}
+            # Without a task: every task of the plant
+            tasks = (
+                [call.data[ATTR_TASK]]
+                if ATTR_TASK in call.data
+                else plant_task_types(entry.options)
+            )
+            for task_type in tasks:
+                events = await storage.get_history(entry.entry_id, task_type, start, end)
+                result[task_type] = [
+                    dt_util.as_local(dt_util.utc_from_timestamp(ts)).isoformat()
+                    for ts in events
+                ]
+            plants[plant_id] = result
+
+        return {"plants": plants}
+
+    async def _async_mark_done(call: ServiceCall) -> None:
+        if not call.data.get(ATTR_DEVICE_ID) and not call.data.get(ATTR_ENTITY_ID):
+            raise ServiceValidationError("mark_done requires plant devices or entities")
+
+        entries = async_resolve_entries(hass, call)
+        if not entries:
+            raise ServiceValidationError("No loaded plants match the given target")
+
+        task_type = call.data[ATTR_TASK]
+        if missing := [
+            entry.data.get(CONF_PLANT_NAME, entry.entry_id)
+            for entry in entries
+            if task_type not in plant_task_types(entry.options)
+        ]:
+            raise ServiceValidationError(
+                f"Plants without the task {task_type}: {', '.join(sorted(missing))}"
+            )
+
+        ts = _as_timestamp(call.data.get(ATTR_TIMESTAMP) or dt_util.now())
+        await async_mark_done(hass, [entry.entry_id for entry in entries], task_type, ts)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_MARK_DONE,
+        _async_mark_done,
+        schema=MARK_DONE_SCHEMA,
+    )
+
+    async def _async_import_plants(call: ServiceCall) -> ServiceResponse:
+        return await async_import_plants(hass, call.data[ATTR_PATH])
+
+    async def _async_export_plants(call: ServiceCall) -> ServiceResponse:
+        return await async_export_plants(hass, call.data[ATTR_PATH])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_PLANTS,
+        _async_import_plants,
+        schema=FILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_PLANTS,
+        _async_export_plants,
+        schema=FILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    @callback
+    def _async_set_instrumentation(call: ServiceCall) -> None:
+        async_get_instrumentation(hass).async_set_enabled(call.data[ATTR_ENABLED])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_INSTRUMENTATION,
+        _async_set_instrumentation,
+        schema=SET_INSTRUMENTATION_SCHEMA,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        _async_get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
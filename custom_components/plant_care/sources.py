@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import PlantCareCoordinator
+
+
+def state_to_float(state: State | None) -> float | None:
+    if state is None:
+        return None
+    try:
+        return float(state.state)
+    except (ValueError, TypeError):
+        return None
+
+
+class PlantCareSources:
+    """Domain-wide registry of the source sensors plants read.
+
+    A source entity shared by many plants (e.g. one temperature sensor per
+    room) is subscribed once. Each state change is parsed once and handed to
+    all plants using it in one pass; fleet summary updates caused by that
+    pass are written once at its end.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        # source entity_id -> entry_id -> coordinator of a plant using it
+        self._plants: dict[str, dict[str, PlantCareCoordinator]] = {}
+        # entry_id -> its source entity_ids
+        self._entries: dict[str, set[str]] = {}
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+
+        # Counters for the diagnostics
+        self.events = 0
+        self.plant_updates = 0
+
+    @callback
+    def async_set_sources(
+        self, coordinator: PlantCareCoordinator, entity_ids: Iterable[str]
+    ) -> None:
+        """Set the sources of a plant (an empty set removes the plant)."""
+        entry_id = coordinator.entry.entry_id
+        wanted = set(entity_ids)
+        for entity_id in self._entries.pop(entry_id, set()) - wanted:
+            self._async_remove(entity_id, entry_id)
+        if wanted:
+            self._entries[entry_id] = wanted
+        for entity_id in wanted:
+            plants = self._plants.setdefault(entity_id, {})
+            plants[entry_id] = coordinator
+            if entity_id not in self._unsubs:
+                self._unsubs[entity_id] = async_track_state_change_event(
+                    self.hass, entity_id, self._async_state_changed
+                )
+
+    @callback
+    def _async_remove(self, entity_id: str, entry_id: str) -> None:
+        plants = self._plants[entity_id]
+        plants.pop(entry_id, None)
+        if not plants:
+            # Last plant using the source: drop its subscription
+            del self._plants[entity_id]
+            self._unsubs.pop(entity_id)()
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        entity_id: str = event.data["entity_id"]
+        if not (plants := self._plants.get(entity_id)):
+            return
+        new_state: State | None = event.data.get("new_state")
+        value = state_to_float(new_state)
+        self.events += 1
+        self.plant_updates += len(plants)
+
+        fleet = self.hass.data.get(DOMAIN, {}).get("fleet")
+        with fleet.async_batch() if fleet is not None else nullcontext():
+            for coordinator in list(plants.values()):
+                coordinator.async_source_changed(entity_id, new_state, value)
+
+    def as_diagnostics(self) -> dict[str, Any]:
+        return {
+            "sources": len(self._plants),
+            "shared_sources": sum(1 for plants in self._plants.values() if len(plants) > 1),
+            "subscriptions": len(self._unsubs),
+            "events": self.events,
+            "plant_updates": self.plant_updates,
+        }
+
+
+@callback
+def async_get_sources(hass: HomeAssistant) -> PlantCareSources:
+    """The domain-wide source registry (created on first use)."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (sources := domain_data.get("sources")) is None:
+        sources = domain_data["sources"] = PlantCareSources(hass)
+    return sources
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import csv
+import logging
+import os
+import unicodedata
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, SPECIES_MIN_SIMILARITY, SPECIES_SEARCH_LIMIT
+
+_LOGGER = logging.getLogger(__name__)
+
+SPECIES_PATH = os.path.join(os.path.dirname(__file__), "species.csv")
+
+# Option columns of species.csv, in file order
+SPECIES_OPTIONS = (
+    "watering_interval_days",
+    "fertilizing_interval_days",
+    "temp_min",
+    "temp_max",
+    "humidity_min",
+    "humidity_max",
+    "moisture_min",
+    "moisture_max",
+    "light_min",
+    "light_max",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class SpeciesProfile:
+    """Care defaults of one species (a row of species.csv)."""
+
+    key: str
+    name: str
+    scientific_name: str
+    values: tuple[float, ...]  # indexed like SPECIES_OPTIONS
+
+    @property
+    def label(self) -> str:
+        return f"{self.name} ({self.scientific_name})"
+
+    @property
+    def options(self) -> dict[str, Any]:
+        return {
+            key: int(value) if value.is_integer() else value
+            for key, value in zip(SPECIES_OPTIONS, self.values)
+        }
+
+
+def _normalize(text: str) -> str:
+    """Lower case ASCII words: "Ficus × lyrata" -> "ficus lyrata"."""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return " ".join("".join(c if c.isalnum() else " " for c in text.lower()).split())
+
+
+def _trigrams(text: str) -> set[str]:
+    """Trigrams of every word, padded so word starts weigh more."""
+    grams: set[str] = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class SpeciesIndex:
+    """Search index over the species profiles (built once, read-only).
+
+    - prefix: a sorted word list; every query word must start a word of the
+      common or scientific name (binary search per query word)
+    - approximate: an inverted trigram index for typos ("monstra"), ranked
+      by the share of the query's trigrams a name contains
+
+    Approximate matching is only used when no name matches by prefix.
+    """
+
+    def __init__(self, profiles: list[SpeciesProfile]) -> None:
+        self.profiles = profiles
+        self._by_key = {profile.key: profile for profile in profiles}
+        # (word, profile index), sorted by word
+        self._words: list[tuple[str, int]] = []
+        # trigram -> indices of the profiles containing it
+        self._trigrams: dict[str, list[int]] = {}
+        for index, profile in enumerate(profiles):
+            text = _normalize(f"{profile.name} {profile.scientific_name}")
+            self._words.extend((word, index) for word in set(text.split()))
+            for gram in _trigrams(text):
+                self._trigrams.setdefault(gram, []).append(index)
+        self._words.sort()
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    def get(self, key: str) -> SpeciesProfile | None:
+        return self._by_key.get(key)
+
+    def _prefix_matches(self, word: str) -> set[int]:
+        matches: set[int] = set()
+        i = bisect_left(self._words, (word,))
+        while i < len(self._words) and self._words[i][0].startswith(word):
+            matches.add(self._words[i][1])
+            i += 1
+        return matches
+
+    def search(self, query: str, limit: int = SPECIES_SEARCH_LIMIT) -> list[SpeciesProfile]:
+        text = _normalize(query)
+        if not text:
+            return []
+
+        found: set[int] | None = None
+        for word in text.split():
+            matches = self._prefix_matches(word)
+            found = matches if found is None else found & matches
+        if found:
+            ranked = sorted(found, key=lambda i: self.profiles[i].name)
+        else:
+            grams = _trigrams(text)
+            shared: dict[int, int] = {}
+            for gram in grams:
+                for index in self._trigrams.get(gram, ()):
+                    shared[index] = shared.get(index, 0) + 1
+            ranked = [
+                index
+                for _, _, index in sorted(
+                    (-count, self.profiles[index].name, index)
+                    for index, count in shared.items()
+                    if count / len(grams) >= SPECIES_MIN_SIMILARITY
+                )
+            ]
+
+        return [self.profiles[index] for index in ranked[:limit]]
+
+
+def load_species_index(path: str = SPECIES_PATH) -> SpeciesIndex:
+    """Read species.csv and build its index (blocking, runs in the executor)."""
+    profiles: list[SpeciesProfile] = []
+    with open(path, encoding="utf-8", newline="") as fp:
+        for row in csv.DictReader(fp):
+            try:
+                values = tuple(float(row[key]) for key in SPECIES_OPTIONS)
+            except (KeyError, TypeError, ValueError):
+                _LOGGER.warning("Skipping invalid species profile: %s", row)
+                continue
+            profiles.append(
+                SpeciesProfile(row["key"], row["name"], row["scientific_name"], values)
+            )
+    return SpeciesIndex(profiles)
+
+
+async def async_get_species_index(hass: HomeAssistant) -> SpeciesIndex:
+    """The species index, loaded in the executor on first use (not at startup)."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (loading := domain_data.get("species")) is None:
+        # Concurrent flows await the same load
+        loading = domain_data["species"] = hass.async_add_executor_job(
+            load_species_index
+        )
+    try:
+        return await loading
+    except (OSError, ValueError, csv.Error):
+        # Not cached: the next search tries again
+        domain_data.pop("species", None)
+        raise
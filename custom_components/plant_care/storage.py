@@ -1,54 +1,397 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import json
+import logging
+import os
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
 
-from .const import STORAGE_KEY, STORAGE_VERSION, TASK_WATERING, TASK_FERTILIZING
+from .const import (
+    ADAPTIVE_ALPHA,
+    ADAPTIVE_MIN_GAP_DAYS,
+    STORAGE_JOURNAL_COMPACT_THRESHOLD,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    TASK_WATERING,
+    TASK_FERTILIZING,
+)
+from .history import CareHistory
+from .instrumentation import async_get_instrumentation
+
+_LOGGER = logging.getLogger(__name__)
+
+# Task type -> field in the per-entry snapshot dict before v5
+_LEGACY_FIELDS = {
+    TASK_WATERING: "last_watered",
+    TASK_FERTILIZING: "last_fertilized",
+}
+
+# Columns of a row in the per-entry task table
+_LAST_DONE = 0
+_LEARNED = 1
 
 
 @dataclass
 class PlantState:
-    last_watered: str | None = None  # ISO datetime string
-    last_fertilized: str | None = None  # ISO datetime string
+    # task type -> [last done (epoch seconds), learned interval in days (adaptive
+    # mode)]; one compact row per task, whatever tasks the plant has
+    tasks: dict[str, list[Any]] = field(default_factory=dict)
+
+    def last_done(self, task_type: str) -> int | None:
+        row = self.tasks.get(task_type)
+        return None if row is None else row[_LAST_DONE]
+
+    def learned(self, task_type: str) -> float | None:
+        row = self.tasks.get(task_type)
+        return None if row is None else row[_LEARNED]
+
+
+def learn_interval(learned: float | None, previous: int | None, ts: int) -> float | None:
+    """Fold the gap between two care events into the learned interval (days).
+
+    Exponentially weighted mean: O(1) per event, no history needed.
+    """
+    if previous is None or ts <= previous:
+        return learned
+    gap = (ts - previous) / 86400
+    if gap < ADAPTIVE_MIN_GAP_DAYS:
+        return learned
+    if learned is None:
+        return gap
+    return ADAPTIVE_ALPHA * gap + (1 - ADAPTIVE_ALPHA) * learned
+
+
+def to_epoch(value: int | float | str | None) -> int | None:
+    """Normalize a timestamp (epoch seconds or ISO string from v1/v2) to epoch seconds."""
+    if value is None or isinstance(value, (int, float)):
+        return None if value is None else int(value)
+    dt = dt_util.parse_datetime(value)
+    return int(dt.timestamp()) if dt is not None else None
+
+
+class _PlantCareStore(Store[dict[str, Any]]):
+    """Snapshot store with migrations from older storage versions."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        if old_major_version < 2:
+            # v1: one JSON blob without a journal -> snapshot at sequence 0
+            old_data = {"entries": old_data.get("entries", {}), "seq": 0}
+        if old_major_version < 3:
+            # v3: last_* as epoch seconds instead of ISO strings
+            for entry in old_data["entries"].values():
+                for key in _LEGACY_FIELDS.values():
+                    if key in entry:
+                        entry[key] = to_epoch(entry[key])
+                # The care history started during v2: seed it with the last
+                # done times recorded before, so get_history includes them
+                history = entry.get("history", {})
+                for task_type, key in _LEGACY_FIELDS.items():
+                    last = entry.get(key)
+                    if last is not None and last not in history.get(task_type, ()):
+                        history.setdefault(task_type, []).append(last)
+                if history:
+                    entry["history"] = history
+        if old_major_version < 4:
+            # v4: learned intervals; seed them once from the recorded history
+            for entry in old_data["entries"].values():
+                learned: dict[str, float] = {}
+                for task_type, events in entry.get("history", {}).items():
+                    value = previous = None
+                    for ts in events:
+                        value = learn_interval(value, previous, ts)
+                        previous = ts
+                    if value is not None:
+                        learned[task_type] = value
+                if learned:
+                    entry["learned"] = learned
+        if old_major_version < 5:
+            # v5: one [last done, learned] row per task instead of a field per task
+            for entry in old_data["entries"].values():
+                learned = entry.pop("learned", {})
+                tasks: dict[str, list[Any]] = {}
+                for task_type, key in _LEGACY_FIELDS.items():
+                    last = entry.pop(key, None)
+                    if last is not None or task_type in learned:
+                        tasks[task_type] = [last, learned.get(task_type)]
+                entry["tasks"] = tasks
+        return old_data
 
 
 class PlantCareStorage:
-    """Small persistent store for per-entry state (last_done timestamps)."""
+    """Small persistent store for per-entry state (last_done timestamps).
 
-    def __init__(self, hass: HomeAssistant) -> None:
-        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+    Each entry holds a task table, task type -> [last done, learned
+    interval]; any task type can be recorded, rows are created on first use.
+
+    Layout:
+    - a snapshot (Home Assistant Store, `.storage/plant_care_state`) holding
+      all entries plus the sequence number of the last event folded into it
+    - an append-only journal (`.storage/plant_care_state.journal`) with one
+      care event (seq, entry_id, task, timestamp) per line
+
+    All timestamps are stored as epoch seconds, so reading state never parses
+    strings.
+
+    Besides the last_* timestamps, every event is also recorded in a bounded
+    per-plant, per-task CareHistory (epoch seconds, see history.py). An event
+    older than the task's last done time (back-dated) is only added to the
+    history; last done and the learned interval stay as they are.
+
+    An update only appends its event to the journal, so per-update I/O stays
+    constant no matter how many plants exist. Once the journal holds
+    STORAGE_JOURNAL_COMPACT_THRESHOLD events it is compacted into a new
+    snapshot and truncated. On load, journal events newer than the snapshot
+    are replayed.
+
+    Appends are coalesced: events within `save_delay` seconds are written in
+    one append. Pending events are flushed on Home Assistant shutdown (final
+    write) and when an entry is unloaded (async_flush()). A delay of 0 writes
+    immediately.
+    """
+
+    def __init__(self, hass: HomeAssistant, save_delay: float = STORAGE_SAVE_DELAY) -> None:
+        self.hass = hass
+        self._store = _PlantCareStore(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._journal_path = hass.config.path(".storage", f"{STORAGE_KEY}.journal")
         self._data: dict[str, Any] | None = None
+        # entry_id -> task_type -> history (kept out of _data, serialized on compaction)
+        self._history: dict[str, dict[str, CareHistory]] = {}
+        self._save_delay = save_delay
+
+        self._pending_events: list[dict[str, Any]] = []
+        self._journal_len = 0
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        self._write_lock = asyncio.Lock()
+        self._instrumentation = async_get_instrumentation(hass)
+
+    async def async_setup(self) -> None:
+        """Load data once and make sure pending events survive a shutdown."""
+        if self._data is not None:
+            return
+        await self.async_load()
+        self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+        )
 
     async def async_load(self) -> dict[str, Any]:
         if self._data is None:
-            self._data = await self._store.async_load() or {"entries": {}}
-            self._data.setdefault("entries", {})
+            started = time.perf_counter()
+            data = await self._store.async_load() or {"entries": {}, "seq": 0}
+            data.setdefault("entries", {})
+            data.setdefault("seq", 0)
+
+            for entry_id, entry in data["entries"].items():
+                self._history[entry_id] = {
+                    task_type: CareHistory(events)
+                    for task_type, events in entry.pop("history", {}).items()
+                }
+
+            events = await self.hass.async_add_executor_job(
+                self._read_journal, data["seq"]
+            )
+            for event in events:
+                self._apply_event(data, event)
+            self._journal_len = len(events)
+            self._data = data
+            if self._instrumentation.enabled:
+                self._instrumentation.record_storage(
+                    "load", time.perf_counter() - started
+                )
+
+            if events:
+                _LOGGER.debug("Replayed %d journal event(s)", len(events))
         return self._data
 
-    async def async_save(self) -> None:
+    # --- Journal ---
+
+    def _read_journal(self, after_seq: int) -> list[dict[str, Any]]:
+        """Read journal events newer than the snapshot (runs in the executor)."""
+        events: list[dict[str, Any]] = []
+        try:
+            with open(self._journal_path, encoding="utf-8") as fp:
+                for line in fp:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        # Torn last line after a crash; everything before is intact
+                        _LOGGER.warning("Skipping corrupt journal line: %r", line)
+                        continue
+                    if event.get("seq", 0) > after_seq:
+                        events.append(event)
+        except FileNotFoundError:
+            pass
+        return events
+
+    def _append_journal(self, events: list[dict[str, Any]]) -> None:
+        lines = "".join(json.dumps(event, separators=(",", ":")) + "\n" for event in events)
+        os.makedirs(os.path.dirname(self._journal_path), exist_ok=True)
+        with open(self._journal_path, "a", encoding="utf-8") as fp:
+            fp.write(lines)
+
+    def _truncate_journal(self) -> None:
+        try:
+            os.remove(self._journal_path)
+        except FileNotFoundError:
+            pass
+
+    def _apply_event(self, data: dict[str, Any], event: dict[str, Any]) -> None:
+        entry = data["entries"].setdefault(event["entry_id"], {})
+        data["seq"] = max(data["seq"], event["seq"])
+
+        # Journals written before v3 hold ISO strings
+        if (ts := to_epoch(event["ts"])) is None:
+            return
+        tasks = entry.setdefault("tasks", {})
+        last, learned = tasks.get(event["task"], (None, None))
+        if last is None or ts > last:
+            # Rows are replaced, never mutated: PlantState copies may share them
+            tasks[event["task"]] = [ts, learn_interval(learned, last, ts)]
+        # Back-dated events (mark_done with a timestamp) only go to the history
+        self._history.setdefault(event["entry_id"], {}).setdefault(
+            event["task"], CareHistory()
+        ).add(ts)
+
+    def _snapshot(self) -> dict[str, Any]:
+        """Serializable snapshot: entries with their history as plain int lists."""
+        assert self._data is not None
+        entries: dict[str, Any] = {}
+        for entry_id, entry in self._data["entries"].items():
+            # The save serializes in the executor while events keep coming in:
+            # copy the task table too, not only the entry around it
+            entries[entry_id] = {**entry, "tasks": dict(entry.get("tasks", {}))}
+            if history := self._history.get(entry_id):
+                entries[entry_id]["history"] = {
+                    task_type: h.as_list() for task_type, h in history.items()
+                }
+        return {"entries": entries, "seq": self._data["seq"]}
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, self._save_delay, self._async_delayed_flush
+            )
+
+    async def _async_delayed_flush(self, _now) -> None:
+        self._unsub_flush = None
+        await self.async_flush()
+
+    async def _async_final_write(self, _event: Event) -> None:
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Append pending events to the journal now (e.g. on unload)."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+        async with self._write_lock:
+            if not self._pending_events:
+                return
+            events, self._pending_events = self._pending_events, []
+            started = time.perf_counter()
+            await self.hass.async_add_executor_job(self._append_journal, events)
+            self._journal_len += len(events)
+            if self._instrumentation.enabled:
+                self._instrumentation.record_storage(
+                    "append", time.perf_counter() - started
+                )
+
+            if self._journal_len >= STORAGE_JOURNAL_COMPACT_THRESHOLD:
+                await self._async_compact()
+
+    async def _async_compact(self) -> None:
+        """Fold the journal into a new snapshot and truncate it.
+
+        The snapshot is written first and records the last folded sequence
+        number, so a crash in between only causes already folded events to be
+        skipped on replay.
+        """
         if self._data is None:
             return
-        await self._store.async_save(self._data)
+        started = time.perf_counter()
+        await self._store.async_save(self._snapshot())
+        await self.hass.async_add_executor_job(self._truncate_journal)
+        self._journal_len = 0
+        if self._instrumentation.enabled:
+            self._instrumentation.record_storage("compact", time.perf_counter() - started)
+
+    # --- Public API ---
 
     async def get_entry_state(self, entry_id: str) -> PlantState:
         data = await self.async_load()
         entry = data["entries"].get(entry_id, {})
-        return PlantState(
-            last_watered=entry.get("last_watered"),
-            last_fertilized=entry.get("last_fertilized"),
-        )
+        return PlantState(tasks=dict(entry.get("tasks", {})))
+
+    async def get_history(
+        self,
+        entry_id: str,
+        task_type: str,
+        start: int | None = None,
+        end: int | None = None,
+    ) -> list[int]:
+        """Return care events (epoch seconds) of a task within [start, end]."""
+        await self.async_load()
+        history = self._history.get(entry_id, {}).get(task_type)
+        return history.between(start, end) if history is not None else []
+
+    async def set_last_done(self, entry_id: str, task_type: str, ts: int) -> None:
+        await self.set_last_done_many([entry_id], task_type, ts)
+
+    async def set_last_done_many(
+        self, entry_ids: list[str], task_type: str, ts: int
+    ) -> None:
+        """Record a care event for many plants in one transaction (one append)."""
+        await self.record_events((entry_id, task_type, ts) for entry_id in entry_ids)
+
+    async def record_events(self, events: Iterable[tuple[str, str, int]]) -> None:
+        """Record (entry_id, task_type, epoch seconds) care events in one transaction."""
+        events = list(events)
+        for _, task_type, _ in events:
+            if not task_type or slugify(task_type) != task_type:
+                raise ValueError(f"Unknown task_type: {task_type}")
 
-    async def set_last_done(self, entry_id: str, task_type: str, iso_dt: str) -> None:
         data = await self.async_load()
-        entry = data["entries"].setdefault(entry_id, {})
-        if task_type == TASK_WATERING:
-            entry["last_watered"] = iso_dt
-        elif task_type == TASK_FERTILIZING:
-            entry["last_fertilized"] = iso_dt
+        for entry_id, task_type, ts in events:
+            event = {
+                "seq": data["seq"] + 1,
+                "entry_id": entry_id,
+                "task": task_type,
+                "ts": int(ts),
+            }
+            self._apply_event(data, event)
+            self._pending_events.append(event)
+
+        if self._save_delay > 0:
+            self._async_schedule_flush()
         else:
-            raise ValueError(f"Unknown task_type: {task_type}")
+            await self.async_flush()
+
+    # --- Diagnostics ---
 
-        await self.async_save()
+    def as_diagnostics(self, entry_id: str) -> dict[str, Any]:
+        data = self._data or {"entries": {}, "seq": 0}
+        return {
+            "loaded": self._data is not None,
+            "seq": data["seq"],
+            "journal_events": self._journal_len,
+            "pending_events": len(self._pending_events),
+            "entries": len(data["entries"]),
+            "entry": data["entries"].get(entry_id, {}),
+            "history_events": {
+                task_type: len(history)
+                for task_type, history in self._history.get(entry_id, {}).items()
+            },
+        }
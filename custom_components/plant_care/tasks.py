@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.util import slugify
+
+from .const import CORE_TASKS, DEFAULT_OPTIONS, OPT_EXTRA_TASKS
+
+
+@dataclass(slots=True, frozen=True)
+class TaskDefinition:
+    """A kind of care task; entities and option keys are generated from it."""
+
+    key: str  # task type, e.g. "misting"
+    name: str  # entity names: "<plant> Misting Due"
+    action: str  # calendar / to-do titles: "Mist <plant>"
+    done: str  # mark-done button: "<plant> Misting Mark misted"
+    icon: str
+    done_icon: str
+    default_interval: int  # days (0 = disabled)
+    max_interval: int  # upper bound of the interval number entity
+
+    @property
+    def interval_option(self) -> str:
+        return f"{self.key}_interval_days"
+
+    @property
+    def adaptive_option(self) -> str:
+        return f"{self.key}_adaptive"
+
+
+_BUILTIN = (
+    TaskDefinition(
+        key="watering",
+        name="Watering",
+        action="Water",
+        done="watered",
+        icon="mdi:watering-can-outline",
+        done_icon="mdi:watering-can",
+        default_interval=7,
+        max_interval=60,
+    ),
+    TaskDefinition(
+        key="fertilizing",
+        name="Fertilizing",
+        action="Fertilize",
+        done="fertilized",
+        icon="mdi:bottle-tonic-outline",
+        done_icon="mdi:bottle-tonic",
+        default_interval=30,
+        max_interval=365,
+    ),
+    TaskDefinition(
+        key="misting",
+        name="Misting",
+        action="Mist",
+        done="misted",
+        icon="mdi:spray-bottle",
+        done_icon="mdi:spray-bottle",
+        default_interval=2,
+        max_interval=60,
+    ),
+    TaskDefinition(
+        key="rotating",
+        name="Rotating",
+        action="Rotate",
+        done="rotated",
+        icon="mdi:rotate-right",
+        done_icon="mdi:rotate-right",
+        default_interval=14,
+        max_interval=120,
+    ),
+    TaskDefinition(
+        key="pruning",
+        name="Pruning",
+        action="Prune",
+        done="pruned",
+        icon="mdi:content-cut",
+        done_icon="mdi:content-cut",
+        default_interval=90,
+        max_interval=730,
+    ),
+    TaskDefinition(
+        key="repotting",
+        name="Repotting",
+        action="Repot",
+        done="repotted",
+        icon="mdi:pot-mix-outline",
+        done_icon="mdi:pot-mix",
+        default_interval=365,
+        max_interval=1825,
+    ),
+)
+
+# Task type -> definition of the tasks that come with the integration
+BUILTIN_TASKS: dict[str, TaskDefinition] = {task.key: task for task in _BUILTIN}
+
+# Extra tasks a plant can add (watering and fertilizing are always there)
+EXTRA_TASK_CHOICES = tuple(key for key in BUILTIN_TASKS if key not in CORE_TASKS)
+
+
+def get_task_definition(task_type: str) -> TaskDefinition:
+    """Definition of a task type; user-defined types get a generic one."""
+    if (definition := BUILTIN_TASKS.get(task_type)) is not None:
+        return definition
+    name = task_type.replace("_", " ").capitalize()
+    return TaskDefinition(
+        key=task_type,
+        name=name,
+        action=name,
+        done="done",
+        icon="mdi:checkbox-marked-circle-outline",
+        done_icon="mdi:check-circle",
+        default_interval=7,
+        max_interval=1825,
+    )
+
+
+def parse_task_types(value: Any) -> tuple[str, ...]:
+    """Task types from an option value: a list or a comma-separated string."""
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, Iterable):
+        return ()
+    task_types: list[str] = []
+    for item in value:
+        if (task_type := slugify(str(item))) and task_type not in task_types:
+            task_types.append(task_type)
+    return tuple(task_types)
+
+
+def plant_task_types(options: Mapping[str, Any]) -> tuple[str, ...]:
+    """The tasks of a plant: the core tasks first, then its extra tasks."""
+    extra = parse_task_types(options.get(OPT_EXTRA_TASKS))
+    return CORE_TASKS + tuple(t for t in extra if t not in CORE_TASKS)
+
+
+def option_default(key: str) -> Any:
+    """Default of an option, including the generated per-task options."""
+    if key in DEFAULT_OPTIONS:
+        return DEFAULT_OPTIONS[key]
+    if key.endswith("_interval_days"):
+        return get_task_definition(key.removesuffix("_interval_days")).default_interval
+    if key.endswith("_adaptive"):
+        return False
+    raise KeyError(key)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from homeassistant.components.todo import (
+    TodoItem,
+    TodoItemStatus,
+    TodoListEntity,
+    TodoListEntityFeature,
+)
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .fleet import PlantCareFleet, PlantSchedule, TaskSchedule
+from .services import async_mark_done
+
+
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
+    """Domain-wide to-do list of due tasks (loaded by discovery from async_setup)."""
+    if discovery_info is None:
+        return
+    fleet: PlantCareFleet = hass.data[DOMAIN]["fleet"]
+    async_add_entities([PlantCareTodoList(fleet)])
+
+
+class PlantCareTodoList(TodoListEntity):
+    """Every currently due task of every plant, as one to-do list.
+
+    Items are added and removed per plant as its tasks become due or are
+    done (fleet schedule changes); the list is never rebuilt from all plants.
+    Completing an item marks the task as done.
+    """
+
+    _attr_should_poll = False
+    _attr_icon = "mdi:sprout"
+    _attr_supported_features = TodoListEntityFeature.UPDATE_TODO_ITEM
+
+    def __init__(self, fleet: PlantCareFleet) -> None:
+        self.fleet = fleet
+        self._attr_name = "Plant Care"
+        self._attr_unique_id = f"{DOMAIN}_due_tasks"
+        self._attr_suggested_object_id = DOMAIN
+        # uid -> item, uid -> (entry_id, task_type)
+        self._items: dict[str, TodoItem] = {}
+        self._tasks: dict[str, tuple[str, str]] = {}
+        # Items ordered by due date, then summary (None = re-sort on next read)
+        self._sorted: list[TodoItem] | None = []
+        self._write_scheduled = False
+
+    @property
+    def available(self) -> bool:
+        # Schedule changes include the first plant added and the last removed
+        return self.fleet.has_plants
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.fleet.async_add_schedule_listener(self._async_schedule_changed)
+        )
+        for entry_id in self.fleet.schedules:
+            self._async_update_plant(entry_id, None)
+
+    @callback
+    def _async_schedule_changed(self, entry_id: str, old: PlantSchedule | None) -> None:
+        if self._async_update_plant(entry_id, old) and not self._write_scheduled:
+            # Many plants change together (mark_done on a group, midnight
+            # passes): write the list state once for all of them
+            self._write_scheduled = True
+            self.hass.loop.call_soon(self._async_write_scheduled)
+
+    @callback
+    def _async_update_plant(self, entry_id: str, old: PlantSchedule | None) -> bool:
+        """Replace the items of one plant; True if the list changed."""
+        new = self.fleet.schedules.get(entry_id)
+        items: dict[str, TodoItem] = {}
+        if new is not None:
+            plant_name, schedules = new
+            for schedule in schedules:
+                if schedule.is_due:
+                    uid = f"{entry_id}_{schedule.task_type}"
+                    items[uid] = _item(uid, plant_name, schedule)
+                    self._tasks[uid] = (entry_id, schedule.task_type)
+
+        changed = False
+        previous = [] if old is None else old[1]
+        for schedule in previous:
+            uid = f"{entry_id}_{schedule.task_type}"
+            if uid not in items and uid in self._items:
+                del self._items[uid]
+                del self._tasks[uid]
+                changed = True
+        for uid, item in items.items():
+            if self._items.get(uid) != item:
+                self._items[uid] = item
+                changed = True
+        if changed:
+            self._sorted = None
+        return changed
+
+    @callback
+    def _async_write_scheduled(self) -> None:
+        self._write_scheduled = False
+        if self.hass is not None:
+            self.async_write_ha_state()
+
+    @property
+    def todo_items(self) -> list[TodoItem]:
+        if self._sorted is None:
+            self._sorted = sorted(
+                self._items.values(), key=lambda item: (item.due, item.summary)
+            )
+        return self._sorted
+
+    async def async_update_todo_item(self, item: TodoItem) -> None:
+        if (task := self._tasks.get(item.uid)) is None or item.uid not in self._items:
+            raise HomeAssistantError("This plant care task is no longer due")
+        if item.status != TodoItemStatus.COMPLETED:
+            raise HomeAssistantError("Plant care tasks can only be completed")
+        entry_id, task_type = task
+        # The item disappears once the refreshed plant is no longer due
+        await async_mark_done(
+            self.hass, [entry_id], task_type, int(dt_util.utcnow().timestamp())
+        )
+
+
+def _item(uid: str, plant_name: str, schedule: TaskSchedule) -> TodoItem:
+    return TodoItem(
+        summary=schedule.summary(plant_name),
+        uid=uid,
+        status=TodoItemStatus.NEEDS_ACTION,
+        due=schedule.next_due_date,
+        description=schedule.overdue_text,
+    )
@@ -0,0 +1,76 @@
+"""Fixtures for the plant_care tests.
+
+Run from the repository root:
+
+    pip install -r tests/requirements.txt
+    pytest -c tests/pytest.ini tests
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+# Make `custom_components.plant_care` importable without installing anything
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_components.plant_care.const import DOMAIN  # noqa: E402
+
+# The `hass` / `enable_custom_integrations` / `freezer` fixtures come from
+# pytest-homeassistant-custom-component, which registers itself as a plugin
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    yield
+
+
+@pytest.fixture(autouse=True)
+def isolated_config_dir(hass, tmp_path):
+    # The storage journal is a real file; keep it out of the harness' config dir
+    hass.config.config_dir = str(tmp_path)
+    yield
+
+
+@pytest.fixture
+def setup_plants(hass):
+    """Set up plants: await setup_plants(2, watering_interval_days=3)."""
+
+    async def _setup(count: int = 1, **options) -> list[MockConfigEntry]:
+        entries = []
+        for i in range(count):
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                data={"plant_name": f"Plant {i}", "plant_id": f"plant_{i}"},
+                options=options,
+            )
+            entry.add_to_hass(hass)
+            entries.append(entry)
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done()
+        return entries
+
+    return _setup
+
+
+@pytest.fixture
+def move_to(hass, freezer):
+    """Move the clock and run what is scheduled until then: await move_to(dt)."""
+
+    async def _move_to(when) -> None:
+        freezer.move_to(when)
+        async_fire_time_changed(hass, when)
+        await hass.async_block_till_done()
+        # Scheduler passes run as background tasks
+        for task in list(hass._background_tasks):
+            await task
+        await hass.async_block_till_done()
+
+    return _move_to
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pytest
+
+from custom_components.plant_care.const import (
+    ADAPTIVE_ALPHA,
+    ADAPTIVE_MIN_GAP_DAYS,
+    DOMAIN,
+)
+from custom_components.plant_care.storage import learn_interval
+
+DAY = 86400
+T0 = 1_790_000_000
+
+
+def test_learn_interval_ewma():
+    # The first gap seeds the interval, later gaps are weighted in
+    assert learn_interval(None, None, T0) is None
+    assert learn_interval(None, T0, T0 + 4 * DAY) == 4
+    learned = learn_interval(4, T0, T0 + 2 * DAY)
+    assert learned == pytest.approx(ADAPTIVE_ALPHA * 2 + (1 - ADAPTIVE_ALPHA) * 4)
+    # Constant gaps converge to the gap
+    for _ in range(50):
+        learned = learn_interval(learned, T0, T0 + 3 * DAY)
+    assert learned == pytest.approx(3)
+
+
+def test_learn_interval_min_gap():
+    # Marked twice in a row (or out of order): not a care interval
+    short = int(ADAPTIVE_MIN_GAP_DAYS * DAY) - 1
+    assert learn_interval(4, T0, T0 + short) == 4
+    assert learn_interval(None, T0, T0 + short) is None
+    assert learn_interval(4, T0, T0) == 4
+    assert learn_interval(4, T0 + DAY, T0) == 4
+    at_cutoff = learn_interval(4, T0, T0 + int(ADAPTIVE_MIN_GAP_DAYS * DAY))
+    assert at_cutoff == pytest.approx(
+        ADAPTIVE_ALPHA * ADAPTIVE_MIN_GAP_DAYS + (1 - ADAPTIVE_ALPHA) * 4
+    )
+
+
+@pytest.mark.parametrize(
+    ("adaptive", "next_due"), [(True, "2026-10-17"), (False, "2026-10-21")]
+)
+async def test_next_due_follows_learned_interval(
+    hass, freezer, setup_plants, adaptive, next_due
+):
+    freezer.move_to("2026-10-17 12:00:00+00:00")
+    hass.config.set_time_zone("UTC")
+    await setup_plants(watering_interval_days=7, watering_adaptive=adaptive)
+    # Watered every 3 days instead of every 7
+    for day in (5, 8, 11, 14):
+        await hass.services.async_call(
+            DOMAIN,
+            "mark_done",
+            {
+                "entity_id": ["binary_sensor.plant_0_watering_due"],
+                "task": "watering",
+                "timestamp": f"2026-10-{day:02d} 08:00:00",
+            },
+            blocking=True,
+        )
+    await hass.async_block_till_done()
+
+    state = hass.states.get("binary_sensor.plant_0_watering_due")
+    assert state.attributes["learned_interval_days"] == pytest.approx(3)
+    assert hass.states.get("sensor.plant_0_watering_next").state.startswith(next_due)
+    assert (state.state == "on") is adaptive
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+
+from homeassistant.setup import async_setup_component
+
+from custom_components.plant_care.const import DOMAIN
+
+
+async def test_export_import_round_trip(hass, tmp_path):
+    assert await async_setup_component(hass, DOMAIN, {})
+    (tmp_path / "plants.csv").write_text(
+        "plant_name,watering_interval_days,last_watered\n"
+        "Fern,3,2026-10-16T10:00:00+00:00\n"
+    )
+    response = await hass.services.async_call(
+        DOMAIN, "import_plants", {"path": "plants.csv"}, blocking=True, return_response=True
+    )
+    await hass.async_block_till_done()
+    assert response["created"] == ["fern"]
+    entry = hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, "fern")
+    storage = hass.data[DOMAIN]["storage"]
+    [watered] = await storage.get_history(entry.entry_id, "watering")
+
+    for _ in range(3):
+        await hass.services.async_call(
+            DOMAIN, "export_plants", {"path": "plants.json"}, blocking=True
+        )
+        response = await hass.services.async_call(
+            DOMAIN, "import_plants", {"path": "plants.json"}, blocking=True, return_response=True
+        )
+        assert response["updated"] == ["fern"]
+    assert await storage.get_history(entry.entry_id, "watering") == [watered]
+
+    # A stale file does not move last done backwards
+    data = json.loads((tmp_path / "plants.json").read_text())
+    data["plants"][0]["last_watered"] = "2026-10-01T10:00:00+00:00"
+    (tmp_path / "stale.json").write_text(json.dumps(data))
+    await hass.services.async_call(
+        DOMAIN, "import_plants", {"path": "stale.json"}, blocking=True
+    )
+    state = await storage.get_entry_state(entry.entry_id)
+    assert state.last_done("watering") == watered
+    assert await storage.get_history(entry.entry_id, "watering") == [watered]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from dataclasses import FrozenInstanceError
+from datetime import date
+
+import pytest
+
+from custom_components.plant_care.const import DOMAIN
+from custom_components.plant_care.coordinator import MetricResult, TaskComputed
+
+
+def _plant_states(hass) -> dict[str, object]:
+    return {
+        state.entity_id: state.last_updated
+        for state in hass.states.async_all()
+        if state.entity_id.split(".")[1].startswith("plant_0_")
+    }
+
+
+async def test_identical_refresh_writes_nothing(hass, setup_plants):
+    hass.states.async_set("sensor.moisture", "45")
+    hass.states.async_set("sensor.temperature", "21")
+    [entry] = await setup_plants(
+        moisture_entity_id="sensor.moisture", temp_entity_id="sensor.temperature"
+    )
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    writes = coordinator.state_writes
+    states = _plant_states(hass)
+    assert states
+
+    for _ in range(2):
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+    # Same sources, same tasks: no entity wrote a state
+    assert coordinator.state_writes == writes
+    assert _plant_states(hass) == states
+
+    # A source update with the same value doesn't write either
+    hass.states.async_set("sensor.moisture", "45", force_update=True)
+    await hass.async_block_till_done()
+    assert coordinator.state_writes == writes
+
+
+async def test_task_change_notifies_only_its_entities(hass, setup_plants):
+    [entry] = await setup_plants()
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    states = _plant_states(hass)
+
+    await hass.services.async_call(
+        "button",
+        "press",
+        {"entity_id": "button.plant_0_fertilizing_mark_fertilized"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    changed = {
+        entity_id
+        for entity_id, last_updated in _plant_states(hass).items()
+        if states.get(entity_id) != last_updated
+    }
+    assert changed == {
+        "binary_sensor.plant_0_fertilizing_due",
+        "sensor.plant_0_fertilizing_last",
+        "sensor.plant_0_fertilizing_next",
+        # The pressed button records the press
+        "button.plant_0_fertilizing_mark_fertilized",
+    }
+    assert coordinator.state_writes > 0
+
+
+def test_result_model():
+    task = TaskComputed(None, date(2026, 10, 20), False, 0)
+    # Compared by value: a recomputed, identical task is no change
+    assert task == TaskComputed(None, date(2026, 10, 20), False, 0)
+    assert task != TaskComputed(None, date(2026, 10, 20), True, 0)
+    assert task.next_change_date() == date(2026, 10, 20)
+    assert TaskComputed(None, date(2026, 10, 20), True, 2).next_change_date() == date(
+        2026, 10, 23
+    )
+    assert TaskComputed(None, None, False, 0).next_change_date() is None
+
+    result = MetricResult(25.0, 30.0, 80.0, True, 5.0)
+    assert result == MetricResult(25.0, 30.0, 80.0, True, 5.0)
+    # Slotted and immutable: results can be shared and compared safely
+    assert not hasattr(result, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        result.value = 40.0
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from homeassistant.util import dt as dt_util
+
+
+async def test_day_closed_at_midnight(hass, freezer, setup_plants, move_to):
+    freezer.move_to("2026-10-17 06:00:00+00:00")
+    hass.config.set_time_zone("UTC")
+    hass.states.async_set("sensor.lux", "10000")
+    await setup_plants(3, light_entity_id="sensor.lux")
+    freezer.tick(timedelta(hours=1))
+    hass.states.async_set("sensor.lux", "20000")
+    await hass.async_block_till_done()
+    # 10000 lx * 0.0185 * 3600 s = 0.666 mol/m²
+    assert hass.states.get("sensor.plant_0_daily_light_integral").state == "0.666"
+
+    # The light sensor doesn't report over night; the scheduler closes the day
+    await move_to(datetime(2026, 10, 18, tzinfo=dt_util.UTC))
+    for i in range(3):
+        state = hass.states.get(f"sensor.plant_{i}_daily_light_integral")
+        assert state.state == "0.0"
+        # 0.666 + 20000 lx for the 17 hours until midnight
+        assert state.attributes["previous_day"] == 23.31
+
+
+async def test_unavailable_until_source_reports(hass, setup_plants):
+    await setup_plants(light_entity_id="sensor.lux")
+    state = hass.states.get("sensor.plant_0_daily_light_integral")
+    assert state.state == "unavailable"
+
+    hass.states.async_set("sensor.lux", "unavailable")
+    await hass.async_block_till_done()
+    state = hass.states.get("sensor.plant_0_daily_light_integral")
+    assert state.state == "unavailable"
+
+    hass.states.async_set("sensor.lux", "10000")
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.plant_0_daily_light_integral").state == "0.0"
+    assert hass.states.get("binary_sensor.plant_0_light_out_of_range").state == "off"
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import pytest
+
+from custom_components.plant_care.const import DOMAIN
+
+FLEET_ENTITIES = (
+    "sensor.plant_care_plants_due",
+    "sensor.plant_care_plants_out_of_range",
+    "calendar.plant_care",
+    "todo.plant_care",
+)
+
+
+async def _mark_done(hass, plant: int, task: str, timestamp: str | None = None) -> None:
+    data = {"entity_id": [f"binary_sensor.plant_{plant}_{task}_due"], "task": task}
+    if timestamp is not None:
+        data["timestamp"] = timestamp
+    await hass.services.async_call(DOMAIN, "mark_done", data, blocking=True)
+    await hass.async_block_till_done()
+
+
+async def test_summary_counts(hass, freezer, setup_plants):
+    freezer.move_to("2026-10-17 12:00:00+00:00")
+    hass.config.set_time_zone("UTC")
+    hass.states.async_set("sensor.moisture", "25")
+    await setup_plants(
+        2,
+        watering_interval_days=3,
+        fertilizing_interval_days=0,
+        moisture_entity_id="sensor.moisture",
+        moisture_min=30,
+    )
+    due = hass.states.get("sensor.plant_care_plants_due")
+    assert due.state == "2"
+    assert due.attributes["plants"] == ["Plant 0", "Plant 1"]
+    assert due.attributes["watering"] == 2
+    assert due.attributes["fertilizing"] == 0
+    out_of_range = hass.states.get("sensor.plant_care_plants_out_of_range")
+    assert out_of_range.state == "2"
+
+    await _mark_done(hass, 1, "watering")
+    due = hass.states.get("sensor.plant_care_plants_due")
+    assert due.state == "1"
+    assert due.attributes["plants"] == ["Plant 0"]
+    assert due.attributes["watering"] == 1
+
+    hass.states.async_set("sensor.moisture", "50")
+    await hass.async_block_till_done()
+    out_of_range = hass.states.get("sensor.plant_care_plants_out_of_range")
+    assert out_of_range.state == "0"
+    assert out_of_range.attributes["plants"] == []
+
+
+async def test_unavailable_without_plants(hass, setup_plants):
+    [entry] = await setup_plants()
+    for entity_id in FLEET_ENTITIES:
+        assert hass.states.get(entity_id).state != "unavailable", entity_id
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    for entity_id in FLEET_ENTITIES:
+        assert hass.states.get(entity_id).state == "unavailable", entity_id
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.plant_care_plants_due").state == "1"
+    for entity_id in FLEET_ENTITIES:
+        assert hass.states.get(entity_id).state != "unavailable", entity_id
+
+
+@pytest.mark.parametrize(
+    ("start", "end"),
+    [
+        # The cached month itself, a window inside it, one reaching past it
+        ("2026-10-17", "2026-11-01"),
+        ("2026-10-22", "2026-10-27"),
+        ("2026-10-28", "2026-11-10"),
+    ],
+)
+async def test_calendar_occurrences(hass, freezer, setup_plants, start, end):
+    freezer.move_to("2026-10-17 12:00:00+00:00")
+    hass.config.set_time_zone("UTC")
+    await setup_plants(watering_interval_days=3, fertilizing_interval_days=7)
+    await _mark_done(hass, 0, "watering", "2026-10-17 08:00:00")
+    await _mark_done(hass, 0, "fertilizing", "2026-10-16 08:00:00")
+
+    # Warm the day cache with the whole month first
+    for start_date, end_date in (("2026-10-17", "2026-11-01"), (start, end)):
+        response = await hass.services.async_call(
+            "calendar",
+            "get_events",
+            {
+                "entity_id": "calendar.plant_care",
+                "start_date_time": f"{start_date} 00:00:00",
+                "end_date_time": f"{end_date} 00:00:00",
+            },
+            blocking=True,
+            return_response=True,
+        )
+    events = [
+        (event["start"], event["summary"])
+        for event in response["calendar.plant_care"]["events"]
+    ]
+    # Watering every 3 days from the 20th, fertilizing every 7 from the 23rd;
+    # on the same day the plant's tasks keep their order
+    watering = ["2026-10-20", "2026-10-23", "2026-10-26", "2026-10-29"]
+    watering += ["2026-11-01", "2026-11-04", "2026-11-07"]
+    fertilizing = ["2026-10-23", "2026-10-30", "2026-11-06"]
+    expected = sorted(
+        [(day, "Water Plant 0") for day in watering]
+        + [(day, "Fertilize Plant 0") for day in fertilizing],
+        key=lambda event: event[0],
+    )
+    assert events == [
+        (day, summary) for day, summary in expected if start <= day < end
+    ]
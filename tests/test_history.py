@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.plant_care.const import DOMAIN, HISTORY_MAX_EVENTS
+from custom_components.plant_care.history import CareHistory
+from custom_components.plant_care.storage import PlantCareStorage
+
+DAY = 86400
+T0 = 1_790_000_000
+
+
+def test_oldest_event_evicted():
+    history = CareHistory(maxlen=3)
+    for day in range(5):
+        history.add(T0 + day * DAY)
+    assert history.as_list() == [T0 + 2 * DAY, T0 + 3 * DAY, T0 + 4 * DAY]
+
+    # Loading more than maxlen events keeps the newest
+    history = CareHistory([T0 + day * DAY for day in range(5)], maxlen=3)
+    assert history.as_list() == [T0 + 2 * DAY, T0 + 3 * DAY, T0 + 4 * DAY]
+
+
+def test_out_of_order_insert():
+    history = CareHistory([T0, T0 + 4 * DAY])
+    history.add(T0 + 2 * DAY)
+    history.add(T0 - DAY)
+    history.add(T0 + 2 * DAY)
+    assert history.as_list() == [
+        T0 - DAY,
+        T0,
+        T0 + 2 * DAY,
+        T0 + 2 * DAY,
+        T0 + 4 * DAY,
+    ]
+    assert history.between(T0, T0 + 2 * DAY) == [T0, T0 + 2 * DAY, T0 + 2 * DAY]
+    assert history.between(end=T0 - 1) == [T0 - DAY]
+    assert history.between(start=T0 + 3 * DAY) == [T0 + 4 * DAY]
+
+
+async def test_storage_history_bounded(hass):
+    storage = PlantCareStorage(hass, save_delay=0)
+    count = HISTORY_MAX_EVENTS + 2
+    await storage.record_events(
+        [("entry", "watering", T0 + i * DAY) for i in range(count)]
+    )
+    events = await storage.get_history("entry", "watering")
+    assert len(events) == HISTORY_MAX_EVENTS
+    assert events[0] == T0 + 2 * DAY
+    assert events[-1] == T0 + (count - 1) * DAY
+
+
+async def test_get_history_service(hass, setup_plants):
+    [entry] = await setup_plants()
+    storage = hass.data[DOMAIN]["storage"]
+    await storage.record_events(
+        [(entry.entry_id, "watering", T0 + day * DAY) for day in range(5)]
+    )
+
+    def _iso(ts: int) -> str:
+        return dt_util.as_local(dt_util.utc_from_timestamp(ts)).isoformat()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_history",
+        {
+            "task": "watering",
+            "start": datetime.fromtimestamp(T0 + DAY, timezone.utc),
+            "end": datetime.fromtimestamp(T0 + 3 * DAY, timezone.utc),
+        },
+        blocking=True,
+        return_response=True,
+    )
+    assert response["plants"]["plant_0"]["watering"] == [
+        _iso(T0 + DAY),
+        _iso(T0 + 2 * DAY),
+        _iso(T0 + 3 * DAY),
+    ]
+
+    # Without a task or range: every task of the plant, all events
+    response = await hass.services.async_call(
+        DOMAIN, "get_history", {}, blocking=True, return_response=True
+    )
+    assert len(response["plants"]["plant_0"]["watering"]) == 5
+    assert response["plants"]["plant_0"]["fertilizing"] == []
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.plant_care.const import DOMAIN, OPTIONS_SAVE_DELAY
+
+
+async def _set_value(hass, entity_id: str, value: float) -> None:
+    await hass.services.async_call(
+        "number", "set_value", {"entity_id": entity_id, "value": value}, blocking=True
+    )
+
+
+async def _save(hass) -> None:
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=OPTIONS_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+
+
+def _last_updated(hass) -> dict[str, object]:
+    return {state.entity_id: state.last_updated for state in hass.states.async_all()}
+
+
+async def test_edits_coalesced(hass, setup_plants):
+    hass.states.async_set("sensor.moisture", "25")
+    [entry] = await setup_plants(moisture_entity_id="sensor.moisture")
+    updates = []
+    entry.async_on_unload(
+        entry.add_update_listener(lambda hass, entry: updates.append(dict(entry.options)))
+    )
+
+    await _set_value(hass, "number.plant_0_watering_moisture_min", 20)
+    await _set_value(hass, "number.plant_0_watering_moisture_max", 70)
+    # Shown right away, written later
+    assert hass.states.get("number.plant_0_watering_moisture_min").state == "20.0"
+    assert updates == []
+    await _save(hass)
+
+    # Two edits, one options write
+    assert len(updates) == 1
+    assert updates[0]["moisture_min"] == 20
+    assert updates[0]["moisture_max"] == 70
+    assert hass.states.get("binary_sensor.plant_0_moisture_out_of_range").state == "off"
+
+
+async def test_only_affected_entities_updated(hass, setup_plants):
+    hass.states.async_set("sensor.moisture", "25")
+    hass.states.async_set("sensor.temperature", "21")
+    [entry] = await setup_plants(
+        moisture_entity_id="sensor.moisture", temp_entity_id="sensor.temperature"
+    )
+    before = _last_updated(hass)
+
+    await _set_value(hass, "number.plant_0_watering_moisture_min", 30)
+    await _save(hass)
+    changed = {e for e, t in _last_updated(hass).items() if before.get(e) != t}
+    assert changed == {
+        "number.plant_0_watering_moisture_min",
+        "binary_sensor.plant_0_moisture_out_of_range",
+        "sensor.plant_0_moisture_deviation",
+        "sensor.plant_care_plants_out_of_range",
+    }
+
+    before = _last_updated(hass)
+    await _set_value(hass, "number.plant_0_watering_interval_days", 3)
+    await _save(hass)
+    changed = {e for e, t in _last_updated(hass).items() if before.get(e) != t}
+    assert "number.plant_0_watering_interval_days" in changed
+    # Only the watering task was re-evaluated
+    assert all(e.split(".")[1].startswith("plant_0_watering_") for e in changed)
+    due = hass.states.get("binary_sensor.plant_0_watering_due")
+    assert due.attributes["interval_days"] == 3
+    assert hass.data[DOMAIN][entry.entry_id]["coordinator"].config.intervals[0] == 3
+
+
+async def test_options_flow_updates_numbers(hass, setup_plants):
+    [entry] = await setup_plants()
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, "temp_min": 12.5}
+    )
+    await hass.async_block_till_done()
+    state = hass.states.get("number.plant_0_targets_temperature_min_degc")
+    assert state.state == "12.5"
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from custom_components.plant_care.const import DOMAIN
+
+
+async def test_prediction_follows_each_reading(hass, freezer, setup_plants):
+    freezer.move_to("2026-10-17 12:00:00+00:00")
+    hass.config.set_time_zone("UTC")
+    hass.states.async_set("sensor.moisture", "60")
+    [entry] = await setup_plants(
+        moisture_entity_id="sensor.moisture",
+        moisture_min=30,
+        watering_interval_days=14,
+    )
+    await hass.services.async_call(
+        "button",
+        "press",
+        {"entity_id": "button.plant_0_watering_mark_watered"},
+        blocking=True,
+    )
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    # Drying by 12 points a day, all readings in range: 60 -> 30 in 2.5 days
+    for hour in range(1, 13):
+        freezer.tick(timedelta(hours=1))
+        hass.states.async_set("sensor.moisture", str(60 - hour * 0.5))
+        await hass.async_block_till_done()
+        # The sensor shows the prediction including this reading
+        predicted = coordinator.data.predicted_watering
+        assert hass.states.get("sensor.plant_0_watering_predicted").state == (
+            predicted.isoformat() if predicted else "unknown"
+        )
+
+    assert hass.states.get("sensor.plant_0_watering_predicted").state == "2026-10-20"
+    # Not predictive: the due date stays on the interval
+    assert hass.states.get("sensor.plant_0_watering_next").state == "2026-10-31"
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from custom_components.plant_care.range_filter import OutOfRangeFilter
+
+MIN, MAX = 30.0, 80.0
+
+
+def test_dwell():
+    range_filter = OutOfRangeFilter(min_dwell=600)
+    assert range_filter.update(35, MIN, MAX, 0) is None
+    assert range_filter.state is False
+
+    # Jitter across the bound never holds for the dwell time
+    for now in range(30, 600, 60):
+        assert range_filter.update(29, MIN, MAX, now) == 600
+        assert range_filter.update(31, MIN, MAX, now + 30) is None
+        assert range_filter.state is False
+
+    assert range_filter.update(28, MIN, MAX, 1000) == 600
+    assert range_filter.update(27, MIN, MAX, 1300) == 300
+    assert range_filter.update(27, MIN, MAX, 1600) is None
+    assert range_filter.state is True
+
+
+def test_hysteresis():
+    range_filter = OutOfRangeFilter(hysteresis=5)
+    range_filter.update(29, MIN, MAX, 0)
+    assert range_filter.state is True
+    range_filter.update(33, MIN, MAX, 10)
+    assert range_filter.state is True
+    range_filter.update(36, MIN, MAX, 20)
+    assert range_filter.state is False
+
+
+def test_unavailable_keeps_state_and_dwell():
+    range_filter = OutOfRangeFilter(hysteresis=5, min_dwell=600)
+    range_filter.update(35, MIN, MAX, 0)
+    assert range_filter.update(28, MIN, MAX, 100) == 600
+
+    # An outage neither commits nor restarts the pending change
+    assert range_filter.update(None, MIN, MAX, 200) is None
+    assert range_filter.state is False
+    assert range_filter.update(28, MIN, MAX, 400) == 300
+    assert range_filter.update(28, MIN, MAX, 700) is None
+    assert range_filter.state is True
+
+    # The first reading after an outage is still subject to the hysteresis
+    range_filter.update(None, MIN, MAX, 800)
+    assert range_filter.update(33, MIN, MAX, 900) is None
+    assert range_filter.state is True
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.plant_care.const import DOMAIN, SCHEDULER_RETRY_DELAY
+
+
+def _midnight(day: int) -> datetime:
+    return datetime(2026, 10, day, tzinfo=dt_util.UTC)
+
+
+async def _watered(hass, plant: int, day: int) -> None:
+    await hass.services.async_call(
+        DOMAIN,
+        "mark_done",
+        {
+            "entity_id": [f"binary_sensor.plant_{plant}_watering_due"],
+            "task": "watering",
+            "timestamp": f"2026-10-{day} 08:00:00",
+        },
+        blocking=True,
+    )
+
+
+def _due(hass) -> list[str]:
+    return [
+        state.entity_id
+        for state in hass.states.async_all("binary_sensor")
+        if state.entity_id.endswith("_watering_due") and state.state == "on"
+    ]
+
+
+async def test_plants_woken_in_due_order(hass, freezer, setup_plants, move_to):
+    freezer.move_to("2026-10-17 12:00:00+00:00")
+    hass.config.set_time_zone("UTC")
+    await setup_plants(3, watering_interval_days=3, fertilizing_interval_days=0)
+    # Due on the 20th, 18th and 19th
+    for plant, day in ((0, 17), (1, 15), (2, 16)):
+        await _watered(hass, plant, day)
+    scheduler = hass.data[DOMAIN]["scheduler"]
+    assert _due(hass) == []
+
+    for day, due in (
+        (18, ["binary_sensor.plant_1_watering_due"]),
+        (19, ["binary_sensor.plant_2_watering_due"]),
+        (20, ["binary_sensor.plant_0_watering_due"]),
+    ):
+        assert scheduler.as_diagnostics()["next_wakeup"] == _midnight(day).isoformat()
+        refreshed = scheduler.plants_refreshed
+        await move_to(_midnight(day))
+        assert set(due) <= set(_due(hass))
+        # Only the plant reaching its due date (plus overdue ones) is refreshed
+        assert scheduler.plants_refreshed - refreshed == day - 17
+
+    assert len(_due(hass)) == 3
+
+
+async def test_failed_refresh_is_retried(hass, freezer, setup_plants, move_to):
+    freezer.move_to("2026-10-17 12:00:00+00:00")
+    hass.config.set_time_zone("UTC")
+    [entry] = await setup_plants(watering_interval_days=1, fertilizing_interval_days=0)
+    await _watered(hass, 0, 17)
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    with patch.object(coordinator, "async_refresh", side_effect=RuntimeError("boom")):
+        await move_to(_midnight(18))
+    assert hass.states.get("binary_sensor.plant_0_watering_due").state == "off"
+
+    # Still scheduled: the plant is refreshed again after the retry delay
+    await move_to(_midnight(18) + timedelta(seconds=SCHEDULER_RETRY_DELAY))
+    assert hass.states.get("binary_sensor.plant_0_watering_due").state == "on"
+    scheduler = hass.data[DOMAIN]["scheduler"]
+    assert scheduler.as_diagnostics()["next_wakeup"] == _midnight(19).isoformat()
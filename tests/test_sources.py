@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from custom_components.plant_care.const import DOMAIN
+from custom_components.plant_care.sources import async_get_sources
+
+
+def _out_of_range(hass, plant_id: str) -> str:
+    return hass.states.get(f"binary_sensor.{plant_id}_temperature_out_of_range").state
+
+
+async def test_shared_source(hass, setup_plants):
+    hass.states.async_set("sensor.room_temperature", "21")
+    first, second = await setup_plants(2, temp_entity_id="sensor.room_temperature")
+    sources = async_get_sources(hass)
+    diagnostics = sources.as_diagnostics()
+    assert diagnostics["shared_sources"] == 1
+    assert diagnostics["subscriptions"] == 1
+
+    fleet = hass.data[DOMAIN]["fleet"]
+    notified = []
+    fleet.async_add_listener(lambda: notified.append(dict(fleet.out_of_range)))
+
+    hass.states.async_set("sensor.room_temperature", "40")
+    await hass.async_block_till_done()
+    assert _out_of_range(hass, "plant_0") == "on"
+    assert _out_of_range(hass, "plant_1") == "on"
+    # One state change, parsed once, one fleet summary update for both plants
+    assert sources.events == 1
+    assert sources.plant_updates == 2
+    assert notified == [
+        {
+            first.entry_id: frozenset({"temperature"}),
+            second.entry_id: frozenset({"temperature"}),
+        }
+    ]
+
+    # Unloading one plant keeps the subscription of the other
+    assert await hass.config_entries.async_unload(first.entry_id)
+    await hass.async_block_till_done()
+    diagnostics = sources.as_diagnostics()
+    assert diagnostics["shared_sources"] == 0
+    assert diagnostics["subscriptions"] == 1
+
+    hass.states.async_set("sensor.room_temperature", "21")
+    await hass.async_block_till_done()
+    assert _out_of_range(hass, "plant_1") == "off"
+    assert sources.plant_updates == 3
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.plant_care.const import DOMAIN
+from custom_components.plant_care.species import (
+    SPECIES_OPTIONS,
+    SpeciesIndex,
+    SpeciesProfile,
+    load_species_index,
+)
+
+VALUES = tuple(1.0 for _ in SPECIES_OPTIONS)
+
+
+def _index(*names: tuple[str, str]) -> SpeciesIndex:
+    return SpeciesIndex(
+        [SpeciesProfile(name.lower(), name, scientific, VALUES) for name, scientific in names]
+    )
+
+
+def test_search():
+    index = _index(
+        ("Monstera", "Monstera deliciosa"),
+        ("Fiddle-leaf fig", "Ficus lyrata"),
+        ("Rubber plant", "Ficus elastica"),
+        ("Snake plant", "Dracaena trifasciata"),
+    )
+    # Every query word has to start a word of the common or scientific name
+    assert [p.key for p in index.search("ficus")] == ["fiddle-leaf fig", "rubber plant"]
+    assert [p.key for p in index.search("ficus ly")] == ["fiddle-leaf fig"]
+    assert [p.key for p in index.search("PLANT")] == ["rubber plant", "snake plant"]
+    assert [p.key for p in index.search("fic", limit=1)] == ["fiddle-leaf fig"]
+    # Typos fall back to trigram matching
+    assert [p.key for p in index.search("monstra")] == ["monstera"]
+    assert index.search("zzzz") == []
+    assert index.search(" - ") == []
+
+
+def test_shipped_profiles():
+    index = load_species_index()
+    assert len(index) == 46
+    assert index.get("snake_plant").options["watering_interval_days"] == 21
+
+
+async def test_flow_without_species_profiles(hass):
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": "user"})
+    with patch(
+        "custom_components.plant_care.species.load_species_index",
+        side_effect=OSError("missing"),
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"plant_name": "Fern", "species": "fern"}
+        )
+    # The flow goes on with the generic defaults
+    assert result["step_id"] == "settings"
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["options"]["watering_interval_days"] == 7
+
+    # The failed load is not cached
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": "user"})
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"plant_name": "Snake", "species": "snake"}
+    )
+    assert result["step_id"] == "species"
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"species": "snake_plant"}
+    )
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
+    assert result["options"]["watering_interval_days"] == 21
+    assert result["data"]["species"] == "snake_plant"
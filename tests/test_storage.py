@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.plant_care import storage as storage_module
+from custom_components.plant_care.const import STORAGE_KEY, STORAGE_SAVE_DELAY
+from custom_components.plant_care.storage import PlantCareStorage
+
+DAY = 86400
+T0 = 1_790_000_000
+
+
+async def test_back_dated_event(hass):
+    storage = PlantCareStorage(hass, save_delay=0)
+    await storage.record_events(
+        [("entry", "watering", T0), ("entry", "watering", T0 + 4 * DAY)]
+    )
+    state = await storage.get_entry_state("entry")
+    learned = state.learned("watering")
+
+    # Marked as done a day earlier after the fact
+    await storage.set_last_done("entry", "watering", T0 + DAY)
+    state = await storage.get_entry_state("entry")
+    assert state.last_done("watering") == T0 + 4 * DAY
+    assert state.learned("watering") == learned
+    assert await storage.get_history("entry", "watering") == [
+        T0,
+        T0 + DAY,
+        T0 + 4 * DAY,
+    ]
+
+    # Replaying the journal gives the same state
+    reloaded = PlantCareStorage(hass, save_delay=0)
+    state = await reloaded.get_entry_state("entry")
+    assert state.last_done("watering") == T0 + 4 * DAY
+    assert state.learned("watering") == learned
+
+
+async def test_migrate_v1(hass, hass_storage):
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "entries": {
+                "entry": {
+                    "last_watered": "2026-01-01T00:00:00+00:00",
+                    "last_fertilized": None,
+                }
+            }
+        },
+    }
+    storage = PlantCareStorage(hass, save_delay=0)
+    state = await storage.get_entry_state("entry")
+    watered = 1767225600
+    assert state.tasks == {"watering": [watered, None]}
+    # The migrated last done time is part of the care history
+    assert await storage.get_history("entry", "watering") == [watered]
+    assert await storage.get_history("entry", "fertilizing") == []
+
+    # Watered again four days later: the gap is learned from the migrated time
+    await storage.set_last_done("entry", "watering", watered + 4 * DAY)
+    state = await storage.get_entry_state("entry")
+    assert state.tasks == {"watering": [watered + 4 * DAY, 4.0]}
+
+
+async def test_journal_replay_and_compaction(hass, hass_storage):
+    storage = PlantCareStorage(hass, save_delay=0)
+    with patch.object(storage_module, "STORAGE_JOURNAL_COMPACT_THRESHOLD", 3):
+        await storage.set_last_done("a", "watering", T0)
+        await storage.set_last_done("b", "fertilizing", T0 + DAY)
+        # Not compacted yet: the events are only in the journal
+        assert STORAGE_KEY not in hass_storage
+        replayed = PlantCareStorage(hass, save_delay=0)
+        assert (await replayed.get_entry_state("a")).last_done("watering") == T0
+        assert (await replayed.get_entry_state("b")).last_done("fertilizing") == T0 + DAY
+
+        await storage.set_last_done("a", "watering", T0 + 2 * DAY)
+    assert not os.path.exists(hass.config.path(".storage", f"{STORAGE_KEY}.journal"))
+    snapshot = hass_storage[STORAGE_KEY]
+    assert snapshot["version"] == 5
+    assert snapshot["data"]["seq"] == 3
+    assert snapshot["data"]["entries"]["a"]["history"] == {"watering": [T0, T0 + 2 * DAY]}
+
+    # Events after the compaction are replayed on top of the snapshot
+    await storage.set_last_done("b", "fertilizing", T0 + 3 * DAY)
+    reloaded = PlantCareStorage(hass, save_delay=0)
+    assert (await reloaded.get_entry_state("a")).last_done("watering") == T0 + 2 * DAY
+    assert (await reloaded.get_entry_state("b")).last_done("fertilizing") == T0 + 3 * DAY
+    assert await reloaded.get_history("b", "fertilizing") == [T0 + DAY, T0 + 3 * DAY]
+
+
+async def test_torn_journal_line(hass):
+    storage = PlantCareStorage(hass, save_delay=0)
+    await storage.set_last_done("a", "watering", T0)
+    # A crash in the middle of an append leaves a partial last line
+    with open(hass.config.path(".storage", f"{STORAGE_KEY}.journal"), "a") as fp:
+        fp.write('{"seq":2,"entry_id":"a","ta')
+    reloaded = PlantCareStorage(hass, save_delay=0)
+    assert (await reloaded.get_entry_state("a")).last_done("watering") == T0
+
+
+async def test_events_during_compaction(hass):
+    # A long save delay: nothing is flushed unless the test does it
+    storage = PlantCareStorage(hass, save_delay=60)
+    saving = asyncio.Event()
+    release = asyncio.Event()
+    saved = []
+
+    async def _slow_save(data):
+        saving.set()
+        await release.wait()
+        # Serialized only now, like the executor job of the real Store
+        saved.append(json.loads(json.dumps(data)))
+
+    with patch.object(storage_module, "STORAGE_JOURNAL_COMPACT_THRESHOLD", 1), patch.object(
+        storage._store, "async_save", _slow_save
+    ):
+        await storage.set_last_done("a", "watering", T0)
+        compaction = hass.async_create_task(storage.async_flush())
+        await saving.wait()
+        # First fertilizing of the plant while the snapshot is being written
+        await storage.record_events([("a", "fertilizing", T0 + DAY)])
+        release.set()
+        await compaction
+
+    [snapshot] = saved
+    assert snapshot["seq"] == 1
+    assert snapshot["entries"]["a"]["tasks"] == {"watering": [T0, None]}
+    # The later event is not lost: it is journaled after the snapshot
+    await storage.async_flush()
+    reloaded = PlantCareStorage(hass, save_delay=0)
+    state = await reloaded.get_entry_state("a")
+    assert state.last_done("fertilizing") == T0 + DAY
+
+
+async def test_burst_coalesced(hass):
+    storage = PlantCareStorage(hass)
+    await storage.async_setup()
+    with patch.object(
+        storage, "_append_journal", wraps=storage._append_journal
+    ) as append:
+        for day in range(5):
+            await storage.set_last_done("entry", "watering", T0 + day * DAY)
+        assert append.call_count == 0
+
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=STORAGE_SAVE_DELAY + 1)
+        )
+        await hass.async_block_till_done()
+    # Five events, one append
+    assert append.call_count == 1
+    assert len(append.call_args.args[0]) == 5
+
+
+async def test_flush_on_final_write(hass):
+    storage = PlantCareStorage(hass)
+    await storage.async_setup()
+    await storage.set_last_done("entry", "watering", T0)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+    state = await PlantCareStorage(hass).get_entry_state("entry")
+    assert state.last_done("watering") == T0
+
+
+async def test_flush_on_unload(hass, setup_plants):
+    [entry] = await setup_plants()
+    await hass.services.async_call(
+        "button", "press", {"entity_id": "button.plant_0_watering_mark_watered"}
+    )
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = await PlantCareStorage(hass).get_entry_state(entry.entry_id)
+    assert state.last_done("watering") is not None
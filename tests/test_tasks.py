@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pytest
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.plant_care.const import DOMAIN
+from custom_components.plant_care.storage import PlantCareStorage
+
+BASELINE_UNIQUE_IDS = {
+    "plant_0_watering_due",
+    "plant_0_watering_last",
+    "plant_0_watering_next",
+    "plant_0_watering_mark_watered",
+    "plant_0_watering_interval_days",
+    "plant_0_fertilizing_due",
+    "plant_0_fertilizing_last",
+    "plant_0_fertilizing_next",
+    "plant_0_fertilizing_mark_fertilized",
+    "plant_0_fertilizing_interval_days",
+}
+
+
+def _unique_ids(hass, entry) -> set[str]:
+    registry = er.async_get(hass)
+    return {
+        entity.unique_id
+        for entity in er.async_entries_for_config_entry(registry, entry.entry_id)
+    }
+
+
+async def test_extra_task_added_through_options(hass, setup_plants):
+    [entry] = await setup_plants()
+    assert BASELINE_UNIQUE_IDS <= _unique_ids(hass, entry)
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"extra_tasks": ["misting", "Leaf cleaning"]}
+    )
+    assert result["type"] == "create_entry"
+    await hass.async_block_till_done()
+
+    # The plant was reloaded with entities for the new tasks
+    assert hass.data[DOMAIN][entry.entry_id]["coordinator"] is not coordinator
+    assert entry.options["extra_tasks"] == ["misting", "leaf_cleaning"]
+    for entity_id in (
+        "binary_sensor.plant_0_misting_due",
+        "sensor.plant_0_misting_next",
+        "button.plant_0_misting_mark_misted",
+        "number.plant_0_misting_interval_days",
+        "binary_sensor.plant_0_leaf_cleaning_due",
+        "button.plant_0_leaf_cleaning_mark_done",
+    ):
+        assert hass.states.get(entity_id) is not None, entity_id
+
+    # The entities of the core tasks kept their unique IDs
+    assert BASELINE_UNIQUE_IDS <= _unique_ids(hass, entry)
+    assert hass.states.get("button.plant_0_watering_mark_watered") is not None
+
+
+@pytest.mark.parametrize("task_type", ["", "Misting", "leaf cleaning", "mist/ing"])
+async def test_record_events_rejects_non_slug(hass, task_type):
+    storage = PlantCareStorage(hass, save_delay=0)
+    with pytest.raises(ValueError):
+        await storage.record_events([("entry", task_type, 1_790_000_000)])
+    assert await storage.get_history("entry", task_type) == []
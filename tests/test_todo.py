@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.plant_care.const import DOMAIN
+
+
+async def test_due_tasks_listed(hass, freezer, setup_plants):
+    freezer.move_to("2026-10-17 12:00:00+00:00")
+    hass.config.set_time_zone("UTC")
+    await setup_plants(2, watering_interval_days=3, fertilizing_interval_days=0)
+    await hass.services.async_call(
+        DOMAIN,
+        "mark_done",
+        {"entity_id": ["binary_sensor.plant_1_watering_due"], "task": "watering"},
+        blocking=True,
+    )
+
+    # Plant 0 was never watered, plant 1 just now
+    assert hass.states.get("todo.plant_care").state == "1"
+
+    await hass.services.async_call(
+        "todo",
+        "update_item",
+        {"entity_id": "todo.plant_care", "item": "Water Plant 0", "status": "completed"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("todo.plant_care").state == "0"
+    assert hass.states.get("binary_sensor.plant_0_watering_due").state == "off"
+
+
+async def test_listed_on_due_date(hass, freezer, setup_plants, move_to):
+    freezer.move_to("2026-10-17 12:00:00+00:00")
+    hass.config.set_time_zone("UTC")
+    await setup_plants(watering_interval_days=1, fertilizing_interval_days=0)
+    await hass.services.async_call(
+        DOMAIN,
+        "mark_done",
+        {"entity_id": ["binary_sensor.plant_0_watering_due"], "task": "watering"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("todo.plant_care").state == "0"
+
+    # Due (not yet overdue) from midnight on
+    await move_to(datetime(2026, 10, 18, 0, 0, 1, tzinfo=dt_util.UTC))
+    assert hass.states.get("binary_sensor.plant_0_watering_due").state == "on"
+    assert hass.states.get("todo.plant_care").state == "1"
+    response = await hass.services.async_call(
+        "todo",
+        "get_items",
+        {"entity_id": "todo.plant_care"},
+        blocking=True,
+        return_response=True,
+    )
+    [item] = response["todo.plant_care"]["items"]
+    assert item["summary"] == "Water Plant 0"
+    assert item["due"] == "2026-10-18"